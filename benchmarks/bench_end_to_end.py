@@ -0,0 +1,164 @@
+"""
+Benchmark: whole assistant turns offline. Replays the labelled utterance
+corpus through VedaAssistant.process_command (typed turns) and a set of WAV
+fixtures through listen_and_process (voice turns), against the stand-ins in
+harness.py: a fake Ollama server, fake TTS and a WAV recognizer. Reports
+throughput, per-stage latency (from the turn traces), routing tiers and peak
+RSS.
+
+Results can be saved as a named baseline and later runs compared with it;
+a comparison exits with status 1 if anything regressed past the tolerance.
+
+Run from the repository root:
+    python benchmarks/bench_end_to_end.py [--passes 3] [--prompt-ms 150] [--token-ms 25]
+        [--strategy speculative] [--save NAME] [--compare NAME] [--tolerance 0.2]
+"""
+import argparse
+import collections
+import json
+import os
+import sys
+import tempfile
+import time
+
+from harness import ROOT, FakeOllamaServer, FakeTTS, HeadlessGUI, WavRecognizer, build_assistant, peak_rss_mb, write_fixture
+
+from veda.core.tracing import load_traces, stage_report
+
+DATA = os.path.join(ROOT, "benchmarks", "data", "labelled_utterances.json")
+BASELINES = os.path.join(ROOT, "benchmarks", "baselines")
+VOICE_TURNS = 12
+
+
+def run(args, tmp):
+    with open(DATA, "r", encoding="utf-8") as f:
+        corpus = json.load(f)
+    server = FakeOllamaServer({item["text"]: item["intent"] for item in corpus},
+                              prompt_ms=args.prompt_ms, token_ms=args.token_ms).start()
+    fixtures = []
+    for i, item in enumerate(corpus[:VOICE_TURNS]):
+        path = os.path.join(tmp, f"utterance_{i}.wav")
+        write_fixture(path, item["text"])
+        fixtures.append((path, item["text"]))
+
+    trace_path = os.path.join(tmp, "traces.jsonl")
+    gui = HeadlessGUI()
+    tts = FakeTTS()
+    recognizer = WavRecognizer(fixtures)
+    assistant = build_assistant(server, gui, tts, recognizer, llm_strategy=args.strategy, trace_path=trace_path)
+    assistant.llm.warm_up()
+
+    start = time.perf_counter()
+    typed = 0
+    for _ in range(args.passes):
+        for item in corpus:
+            assistant.process_command(item["text"])
+            typed += 1
+    typed_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in fixtures:
+        assistant.listen_and_process()
+    voice_seconds = time.perf_counter() - start
+
+    assistant.shutdown()  # also writes out the traces
+    server.stop()
+
+    tiers = collections.Counter()
+    for trace in load_traces(trace_path):
+        if trace["name"] == "turn":
+            tiers[trace["attrs"].get("tier", "-")] += 1
+    stages = {name: {"count": stats["count"], "p50_ms": stats["p50"], "p95_ms": stats["p95"]}
+              for name, stats in stage_report(trace_path).items()}
+    return {
+        "config": {"passes": args.passes, "prompt_ms": args.prompt_ms, "token_ms": args.token_ms,
+                   "strategy": args.strategy, "corpus": len(corpus)},
+        "throughput": {"typed_turns_per_s": typed / typed_seconds, "voice_turns_per_s": len(fixtures) / voice_seconds},
+        "stages": stages,
+        "tiers": dict(tiers),
+        "server_requests": dict(server.requests),
+        "tts_fetches": tts.fetched,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def report(results):
+    config = results["config"]
+    print(f"{config['corpus']} utterances x {config['passes']} passes + {VOICE_TURNS} voice turns, "
+          f"'{config['strategy']}' strategy, model {config['prompt_ms']:.0f} ms prompt + {config['token_ms']:.0f} ms/token")
+    throughput = results["throughput"]
+    print(f"throughput: {throughput['typed_turns_per_s']:.1f} typed turns/s, "
+          f"{throughput['voice_turns_per_s']:.1f} voice turns/s")
+    print(f"tiers: {results['tiers']}   server requests: {results['server_requests']}   "
+          f"TTS fetches: {results['tts_fetches']}")
+    if results["peak_rss_mb"] is not None:
+        print(f"peak RSS: {results['peak_rss_mb']:.0f} MiB")
+    print(f"{'stage':<14} {'count':>6} {'p50 ms':>9} {'p95 ms':>9}")
+    for name, stats in sorted(results["stages"].items(), key=lambda item: -item[1]["p95_ms"]):
+        print(f"{name:<14} {stats['count']:>6} {stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f}")
+
+
+def compare(results, baseline, tolerance):
+    """Prints metrics that moved past tolerance against the baseline; returns the regressions."""
+    # (name, current, baseline, higher is better)
+    metrics = [(f"throughput.{name}", value, baseline["throughput"].get(name), True)
+               for name, value in results["throughput"].items()]
+    metrics += [(f"{name}.p95_ms", stats["p95_ms"], baseline["stages"].get(name, {}).get("p95_ms"), False)
+                for name, stats in results["stages"].items()]
+    metrics.append(("peak_rss_mb", results["peak_rss_mb"], baseline.get("peak_rss_mb"), False))
+
+    regressions = []
+    print(f"{'metric':<34} {'baseline':>10} {'now':>10} {'change':>8}")
+    for name, now, before, higher_is_better in metrics:
+        if now is None or not before:
+            continue
+        change = (now - before) / before
+        worse = -change if higher_is_better else change
+        # Sub-millisecond stages are all noise; judge them on absolute change
+        if name.endswith("p95_ms") and abs(now - before) < 1.0:
+            worse = 0.0
+        flag = "  REGRESSION" if worse > tolerance else ""
+        if flag:
+            regressions.append(name)
+        print(f"{name:<34} {before:>10.2f} {now:>10.2f} {change:>+7.0%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline end-to-end benchmark of VedaAssistant turns.")
+    parser.add_argument("--passes", type=int, default=3, help="times the corpus is replayed (default 3)")
+    parser.add_argument("--prompt-ms", type=float, default=150.0, help="fake model prompt-eval latency")
+    parser.add_argument("--token-ms", type=float, default=25.0, help="fake model time per generated token")
+    parser.add_argument("--strategy", default="speculative", help="VedaAssistant LLM strategy")
+    parser.add_argument("--save", metavar="NAME", help="save the results as benchmarks/baselines/NAME.json")
+    parser.add_argument("--compare", metavar="NAME", help="compare with a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression (default 0.2)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)  # the assistant's databases and caches go here
+        try:
+            results = run(args, tmp)
+        finally:
+            os.chdir(ROOT)
+    report(results)
+
+    if args.save:
+        os.makedirs(BASELINES, exist_ok=True)
+        path = os.path.join(BASELINES, f"{args.save}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"saved baseline {path}")
+    if args.compare:
+        with open(os.path.join(BASELINES, f"{args.compare}.json"), "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline["config"] != results["config"]:
+            print(f"note: baseline config differs: {baseline['config']}")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) past {args.tolerance:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
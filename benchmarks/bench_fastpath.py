@@ -0,0 +1,84 @@
+"""
+Microbenchmark: compiled single-pass intent matcher vs the legacy
+re.search loop in TacticalFastPath.extract.
+
+Run from the repository root:
+    python benchmarks/bench_fastpath.py
+"""
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from veda.core.matcher import CompiledIntentMatcher
+from veda.core.planner import TacticalFastPath
+
+UTTERANCES = [
+    "set volume to 40",
+    "open chrome",
+    "what is the date",
+    "move report.txt to backup",
+    "tell me a joke about robots",
+    "how far away is the moon",
+    "weather in london",
+    "lock the computer",
+]
+
+WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel",
+         "india", "juliet", "kilo", "lima", "mike", "november", "oscar"]
+
+
+def legacy_extract(patterns, text):
+    """The pre-matcher algorithm: one re.search per pattern, in declaration order."""
+    text = text.lower().strip()
+    for intent, intent_patterns in patterns.items():
+        for pattern in intent_patterns:
+            match = re.search(pattern, text)
+            if match:
+                return {"intent": intent, "params": {k: v.strip() for k, v in match.groupdict().items()}}
+    return None
+
+
+def synthetic_patterns(count):
+    """Builds a pattern table of `count` entries from the planner's own patterns plus fillers."""
+    real = [(intent, pattern) for intent, patterns in TacticalFastPath().patterns.items() for pattern in patterns]
+    fillers = []
+    i = 0
+    while len(real) + len(fillers) < count:
+        fillers.append((f"custom_{i // 3}", rf"{WORDS[i % len(WORDS)]} command {i} (?P<arg>\w+)"))
+        i += 1
+    # Fillers go first so the real intents are the worst case for the loop
+    patterns = {}
+    for intent, pattern in (fillers + real)[:count]:
+        patterns.setdefault(intent, []).append(pattern)
+    return patterns
+
+
+def timeit(fn, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in UTTERANCES:
+            fn(text)
+    return (time.perf_counter() - start) / (rounds * len(UTTERANCES)) * 1e6
+
+
+def main():
+    print(f"{'patterns':>9} {'legacy us':>11} {'compiled us':>12} {'speedup':>8}")
+    for count in (15, 150, 1500):
+        patterns = synthetic_patterns(count)
+        matcher = CompiledIntentMatcher(patterns)
+        for text in UTTERANCES:
+            expected = legacy_extract(patterns, text)
+            got = matcher.match(text)
+            assert (expected and (expected["intent"], expected["params"])) == (got or None), text
+
+        rounds = max(5, 20000 // count)
+        legacy = timeit(lambda t: legacy_extract(patterns, t), rounds)
+        compiled = timeit(lambda t: matcher.match(t.lower().strip()), rounds)
+        print(f"{count:>9} {legacy:>11.1f} {compiled:>12.1f} {legacy / compiled:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: FileIndex crawl, incremental refresh and query latency on a
+synthetic directory tree, vs the legacy per-query os.walk.
+
+Run from the repository root (creates the tree in a temp dir):
+    python benchmarks/bench_file_index.py [files]      # default 500000
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from veda.core.storage import VedaStorage
+from veda.features.file_index import FileIndex
+
+WORDS = ["report", "invoice", "holiday", "draft", "budget", "photo", "scan", "notes", "resume",
+         "contract", "backup", "project", "meeting", "thesis", "receipt", "plan", "summary", "design"]
+EXTS = [".pdf", ".docx", ".txt", ".jpg", ".png", ".xlsx", ".md"]
+QUERIES = ["budget", "thesis_0042", "holiday photo", "receipt", ".xlsx", "needle_file", "nothing_matches_this"]
+
+
+def build_tree(root, files, per_dir=50, fanout=8):
+    rng = random.Random(7)
+    dirs = [root]
+    made = 0
+    queue = [(root, 0)]
+    while made < files:
+        parent, depth = queue.pop(0)
+        for i in range(fanout):
+            path = os.path.join(parent, f"{rng.choice(WORDS)}_{depth}_{i}")
+            os.makedirs(path, exist_ok=True)
+            dirs.append(path)
+            queue.append((path, depth + 1))
+            for _ in range(min(per_dir, files - made)):
+                name = f"{rng.choice(WORDS)} {rng.choice(WORDS)}_{made:04d}{rng.choice(EXTS)}"
+                open(os.path.join(path, name), "w").close()
+                made += 1
+            if made >= files:
+                break
+    # One deeply nested target the legacy depth-2 walk cannot reach
+    deep = os.path.join(dirs[-1], "a", "b", "c", "d")
+    os.makedirs(deep, exist_ok=True)
+    open(os.path.join(deep, "needle_file.txt"), "w").close()
+    return len(dirs)
+
+
+def legacy_find(root, query):
+    results = []
+    for current, _, files in os.walk(root):
+        if current[len(root):].count(os.sep) > 2:
+            continue
+        for name in files:
+            if query.lower() in name.lower():
+                results.append(os.path.join(current, name))
+            if len(results) >= 5:
+                return results
+    return results
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, "home")
+        start = time.perf_counter()
+        dirs = build_tree(root, files)
+        print(f"tree: {files} files in {dirs} dirs (built in {time.perf_counter() - start:.1f}s)")
+
+        db_path = os.path.join(tmp, "index.db")
+        index = FileIndex([root], db_path=db_path)
+        stats = index.refresh()
+        print(f"initial crawl: {stats['seconds']:.1f}s, {stats['dirs_listed']} dirs listed")
+
+        stats = index.refresh()
+        print(f"no-change refresh: {stats['seconds'] * 1000:.0f} ms, {stats['dirs_listed']} dirs listed")
+        open(os.path.join(root, "new budget file.pdf"), "w").close()
+        stats = index.refresh()
+        print(f"one-file refresh: {stats['seconds'] * 1000:.0f} ms, {stats['dirs_listed']} dirs listed")
+
+        print(f"{'query':>22} {'hits':>5} {'index ms':>9} {'legacy walk ms':>15} {'legacy hits':>12}")
+        for query in QUERIES:
+            timings = []
+            for _ in range(20):
+                t = time.perf_counter()
+                hits = index.search(query)
+                timings.append((time.perf_counter() - t) * 1000)
+            t = time.perf_counter()
+            legacy = legacy_find(root, query)
+            legacy_ms = (time.perf_counter() - t) * 1000
+            timings.sort()
+            print(f"{query:>22} {len(hits):>5} {timings[len(timings) // 2]:>9.2f} {legacy_ms:>15.1f} {len(legacy):>12}")
+        VedaStorage.for_path(db_path).close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark: InteractionHistory search, keyset paging and retention over a
+synthetic interaction log, vs a LIKE full scan.
+
+Run from the repository root (the database lives in a temp dir; 10M rows
+need a few GB of disk and several minutes to generate):
+    python benchmarks/bench_history.py [rows]      # default 10000000
+"""
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from veda.core.memory import VedaMemory
+
+WORDS = ("open close volume brightness weather today tomorrow remind meeting music play pause "
+         "email draft report search find file photo budget holiday train flight dinner recipe "
+         "news score football movie battery update install python code error window").split()
+RARE = "quasar"  # about 1 row in 20000
+SPAN_DAYS = 3 * 365
+
+
+def generate(storage, rows, batch=100000):
+    rng = random.Random(11)
+    start = datetime.datetime(2023, 1, 1)
+    step = SPAN_DAYS * 86400 / rows
+    made = 0
+    while made < rows:
+        chunk = []
+        for i in range(made, min(rows, made + batch)):
+            words = rng.choices(WORDS, k=rng.randint(4, 14))
+            if rng.random() < 0.00005:
+                words.insert(rng.randrange(len(words)), RARE)
+            stamp = (start + datetime.timedelta(seconds=i * step)).strftime("%Y-%m-%d %H:%M:%S")
+            chunk.append(("user" if i % 2 == 0 else "assistant", " ".join(words), stamp))
+        storage.executemany("INSERT INTO interactions (role, content, timestamp) VALUES (?, ?, ?)", chunk)
+        made += len(chunk)
+    return start
+
+
+def timed(fn, repeat=5):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        t = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - t) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2], result
+
+
+def deep_page(query, pages):
+    """Walks pages - 1 pages, then returns a callable fetching the last one (what gets timed)."""
+    cursor = None
+    for _ in range(pages - 1):
+        _, cursor = query(cursor)
+    return lambda: query(cursor)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    with tempfile.TemporaryDirectory() as tmp:
+        memory = VedaMemory(os.path.join(tmp, "history.db"), archive_dir=os.path.join(tmp, "archive"),
+                            retention_days=None)
+        history = memory.history
+        t = time.perf_counter()
+        start = generate(memory.storage, rows)
+        print(f"generated {rows} rows in {time.perf_counter() - t:.0f}s "
+              f"(db {os.path.getsize(os.path.join(tmp, 'history.db')) / 1e6:.0f} MB)")
+
+        day = start + datetime.timedelta(days=400)
+        cases = [
+            ("search rare word", lambda: history.search(RARE)),
+            ("search common word", lambda: history.search("weather")),
+            ("search two words", lambda: history.search("flight tomorrow")),
+            ("search + role", lambda: history.search("battery update", role="assistant")),
+            ("search page 50", deep_page(lambda c: history.search("music", cursor=c), 50)),
+            ("by role", lambda: history.by_role("user")),
+            ("by role page 50", deep_page(lambda c: history.by_role("user", cursor=c), 50)),
+            ("one-day range", lambda: history.by_time(day, day + datetime.timedelta(days=1))),
+            ("range page 50", deep_page(
+                lambda c: history.by_time(day, day + datetime.timedelta(days=30), cursor=c), 50)),
+        ]
+        print(f"{'query':>20} {'ms':>8} {'rows':>5}")
+        for name, fn in cases:
+            ms, result = timed(fn)
+            count = len(result[0]) if isinstance(result, tuple) else len(result)
+            print(f"{name:>20} {ms:>8.2f} {count:>5}")
+
+        ms, found = timed(lambda: memory.storage.query(
+            "SELECT id FROM interactions WHERE content LIKE ? ORDER BY id DESC LIMIT 20", (f"%{RARE}%",)), repeat=1)
+        print(f"{'LIKE scan (rare)':>20} {ms:>8.2f} {len(found):>5}")
+
+        # Retention that archives roughly the oldest month
+        stats = history.compact(retention_days=(datetime.datetime.now() - start).days - 30)
+        archive_bytes = sum(os.path.getsize(path) for path in stats["segments"])
+        print(f"compact: archived {stats['archived']} rows into {len(stats['segments'])} segment(s), "
+              f"{archive_bytes / 1e6:.1f} MB, {stats['seconds']:.1f}s")
+        memory.close()
+        memory.storage.close()
+
+
+if __name__ == "__main__":
+    main()
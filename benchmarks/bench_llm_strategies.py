@@ -0,0 +1,135 @@
+"""
+Benchmark: end-to-end latency of turns that miss the local tiers, for the
+serial, speculative and combined LLM strategies of VedaAssistant.
+
+Uses a simulated model (no Ollama): a fixed prompt-eval time plus a per-token
+decode time. With --one-slot the fake server handles one request at a time,
+like Ollama with OLLAMA_NUM_PARALLEL=1.
+    python benchmarks/bench_llm_strategies.py [prompt_ms] [token_ms] [--one-slot]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from veda.core.assistant import VedaAssistant
+
+TURNS = [
+    ("could you tell me what time it is over here", "time"),
+    ("grab a picture of what's on my display", "screenshot"),
+    ("what do you think about black holes", "none"),
+    ("tell me a joke about programmers", "none"),
+]
+REPLY_WORDS = ("Here is a fairly ordinary reply that runs for a couple of sentences. "
+               "It gives the speech pipeline something to chew on while tokens arrive.").split()
+
+
+class FakeModel:
+    INTENT_TOKENS = 12
+
+    def __init__(self, prompt_ms, token_ms, slots):
+        self.prompt = prompt_ms / 1000.0
+        self.token = token_ms / 1000.0
+        self.slots = threading.Semaphore(slots)
+        self.model = "fake"
+        self.labels = dict(TURNS)
+        self.durations = {}
+
+    def extract_intent(self, text):
+        with self.slots:
+            time.sleep(self.prompt + self.INTENT_TOKENS * self.token)
+        return {"intent": self.labels[text], "params": {}}
+
+    def add_history(self, messages):
+        pass
+
+    def prompt_snapshot(self):
+        return [], 0
+
+    def chat_stream(self, text, cancel=None, history=None, snapshot=None):
+        with self.slots:
+            time.sleep(self.prompt)
+            for i, word in enumerate(REPLY_WORDS):
+                if cancel is not None and cancel.is_set():
+                    return
+                time.sleep(self.token)
+                yield word if i == len(REPLY_WORDS) - 1 else word + " "
+
+    def extract_intent_and_reply(self, text):
+        intent = self.labels[text]
+        reply_tokens = len(REPLY_WORDS) if intent == "none" else 8  # JSON mode still writes a short reply
+        with self.slots:
+            time.sleep(self.prompt + (self.INTENT_TOKENS + reply_tokens) * self.token)
+        return {"intent": intent, "params": {}, "reply": " ".join(REPLY_WORDS) if intent == "none" else "ok"}
+
+
+class RecordingGUI:
+    def __init__(self):
+        self.first_reply = None
+
+    def update_chat(self, sender, message, partial=False):
+        if sender == "Veda" and message and self.first_reply is None:
+            self.first_reply = time.perf_counter()
+
+    def reset_voice_button(self):
+        pass
+
+
+class SilentVoice:
+    def speak_async(self, text, on_start=None):
+        return None
+
+    def speak_stream(self, sentences, on_first_audio=None):
+        for _ in sentences:
+            pass
+
+
+def run(strategy, model, repeats=3):
+    gui = RecordingGUI()
+    assistant = VedaAssistant(gui, llm_strategy=strategy)
+    assistant.llm = model
+    voice, assistant.voice = assistant.voice, SilentVoice()
+    # Force every turn down to the model tier
+    assistant.planner.extract = lambda text: None
+    assistant.intent_cache.get = lambda text: None
+    assistant.intent_cache.put = lambda text, result: None
+    assistant.router = type("NoRouter", (), {"route": staticmethod(lambda text: None)})()
+    results = {"action": ([], []), "chat": ([], [])}
+    for _ in range(repeats):
+        for text, intent in TURNS:
+            gui.first_reply = None
+            start = time.perf_counter()
+            assistant.process_command(text)
+            end = time.perf_counter()
+            visible, total = results["chat" if intent == "none" else "action"]
+            visible.append((gui.first_reply or end) - start)
+            total.append(end - start)
+    assistant.voice = voice
+    assistant.shutdown()
+    return results
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    prompt_ms = float(args[0]) if args else 150.0
+    token_ms = float(args[1]) if len(args) > 1 else 30.0
+    slots = 1 if "--one-slot" in sys.argv else 4
+
+    print(f"prompt eval {prompt_ms:.0f} ms, {token_ms:.0f} ms/token, {slots} server slot(s)")
+    print(f"{'strategy':>12} {'action ms':>10} {'chat first ms':>14} {'chat total ms':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        for strategy in VedaAssistant.LLM_STRATEGIES:
+            results = run(strategy, FakeModel(prompt_ms, token_ms, slots))
+            mean = lambda values: sum(values) / len(values) * 1000
+            print(f"{strategy:>12} {mean(results['action'][1]):>10.0f} "
+                  f"{mean(results['chat'][0]):>14.0f} {mean(results['chat'][1]):>14.0f}")
+        os.chdir(ROOT)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Benchmark: concurrent readers and writers on the unified memory store vs
+the two legacy engines it replaces: the old VedaMemory / TaskManager
+(connect-commit-close per call, rollback journal) and the veda2.0
+MemoryManager (one connection shared by every thread).
+
+Run from the repository root:
+    python benchmarks/bench_memory_store.py [seconds] [readers] [writers]   # default 3 4 2
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from veda.core.memory import VedaMemory
+from veda.features.tasks import TaskManager
+
+SEED_ROWS = 20000
+
+
+class UnifiedStore:
+    def __init__(self, db_path):
+        self.memory = VedaMemory(db_path, retention_days=None)
+        self.tasks = TaskManager(db_path)
+        self.memory.storage.executemany(
+            "INSERT INTO interactions (role, content) VALUES (?, ?)",
+            [("user" if i % 2 else "assistant", f"seed message {i} about weather and music") for i in range(SEED_ROWS)]
+        )
+
+    def write(self, i):
+        op = i % 4
+        if op == 0:
+            self.memory.set(f"key{i % 100}", f"value{i}")
+        elif op == 1:
+            self.memory.storage.execute("INSERT INTO interactions (role, content) VALUES (?, ?)", ("user", f"message {i}"))
+        elif op == 2:
+            self.tasks.add_task(f"task {i}")
+        else:
+            self.memory.store_fact(f"fact number {i}")
+
+    def read(self, i):
+        op = i % 4
+        if op == 0:
+            self.memory.get(f"key{i % 100}")
+        elif op == 1:
+            self.memory.history.by_role("user", limit=10)
+        elif op == 2:
+            self.memory.history.search("weather music", limit=10)
+        else:
+            self.memory.fetch_facts(limit=10)
+
+    def close(self):
+        self.memory.close()
+        self.memory.storage.close()
+
+
+class LegacyConnectPerCall:
+    """Old VedaMemory/TaskManager: a fresh connection (and commit) for every call."""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        conn = sqlite3.connect(db_path)
+        conn.executescript('''
+            CREATE TABLE memory (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE interactions (id INTEGER PRIMARY KEY AUTOINCREMENT, role TEXT, content TEXT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP);
+            CREATE TABLE tasks (id INTEGER PRIMARY KEY AUTOINCREMENT, task TEXT, status TEXT DEFAULT 'pending');
+            CREATE TABLE facts (id INTEGER PRIMARY KEY, fact TEXT NOT NULL);
+        ''')
+        conn.executemany("INSERT INTO interactions (role, content) VALUES (?, ?)",
+                         [("user" if i % 2 else "assistant", f"seed message {i} about weather and music")
+                          for i in range(SEED_ROWS)])
+        conn.commit()
+        conn.close()
+
+    def _run(self, sql, params=(), write=False):
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        try:
+            rows = conn.execute(sql, params).fetchall()
+            if write:
+                conn.commit()
+            return rows
+        finally:
+            conn.close()
+
+    def write(self, i):
+        op = i % 4
+        if op == 0:
+            self._run("INSERT OR REPLACE INTO memory (key, value) VALUES (?, ?)", (f"key{i % 100}", f"value{i}"), True)
+        elif op == 1:
+            self._run("INSERT INTO interactions (role, content) VALUES (?, ?)", ("user", f"message {i}"), True)
+        elif op == 2:
+            self._run("INSERT INTO tasks (task) VALUES (?)", (f"task {i}",), True)
+        else:
+            self._run("INSERT INTO facts (fact) VALUES (?)", (f"fact number {i}",), True)
+
+    def read(self, i):
+        op = i % 4
+        if op == 0:
+            self._run("SELECT value FROM memory WHERE key = ?", (f"key{i % 100}",))
+        elif op == 1:
+            self._run("SELECT * FROM interactions WHERE role = 'user' ORDER BY timestamp DESC, id DESC LIMIT 10")
+        elif op == 2:
+            self._run("SELECT * FROM interactions WHERE content LIKE '%weather%' AND content LIKE '%music%' "
+                      "ORDER BY id DESC LIMIT 10")
+        else:
+            self._run("SELECT * FROM facts ORDER BY id DESC LIMIT 10")
+
+    def close(self):
+        pass
+
+
+class LegacySharedConnection(LegacyConnectPerCall):
+    """
+    veda2.0 MemoryManager: one connection and cursor for every thread. As shipped
+    it has no lock, and using it from several threads crashes the interpreter,
+    so this measures its best case: the same connection behind a global lock.
+    """
+
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.cur = self.conn.cursor()
+        self.lock = threading.Lock()
+
+    def _run(self, sql, params=(), write=False):
+        with self.lock:
+            self.cur.execute(sql, params)
+            rows = self.cur.fetchall()
+            if write:
+                self.conn.commit()
+            return rows
+
+    def close(self):
+        self.conn.close()
+
+
+def hammer(store, seconds, readers, writers):
+    stop = threading.Event()
+    stats = {"read": [], "write": [], "errors": 0}
+    lock = threading.Lock()
+
+    def worker(kind, offset):
+        op = getattr(store, kind)
+        latencies, errors, i = [], 0, offset
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                op(i)
+                latencies.append(time.perf_counter() - start)
+            except Exception:
+                errors += 1
+            i += 1
+        with lock:
+            stats[kind] += latencies
+            stats["errors"] += errors
+
+    threads = [threading.Thread(target=worker, args=("read", n * 1000)) for n in range(readers)]
+    threads += [threading.Thread(target=worker, args=("write", n * 1000)) for n in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return stats
+
+
+def p95_ms(values):
+    values = sorted(values)
+    return values[int(len(values) * 0.95)] * 1000 if values else 0.0
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    writers = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+    print(f"{readers} readers + {writers} writers for {seconds:.0f}s each, {SEED_ROWS} seeded interactions")
+    print(f"{'engine':>24} {'reads/s':>9} {'writes/s':>9} {'read p95':>9} {'write p95':>10} {'errors':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, engine in [("legacy connect-per-call", LegacyConnectPerCall),
+                             ("legacy shared + lock", LegacySharedConnection),
+                             ("unified store", UnifiedStore)]:
+            store = engine(os.path.join(tmp, f"{engine.__name__}.db"))
+            stats = hammer(store, seconds, readers, writers)
+            store.close()
+            print(f"{name:>24} {len(stats['read']) / seconds:>9.0f} {len(stats['write']) / seconds:>9.0f} "
+                  f"{p95_ms(stats['read']):>7.2f}ms {p95_ms(stats['write']):>8.2f}ms {stats['errors']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: multi-step commands run one action after another (the old
+ModeManager protocols, and what a compound command costs as separate turns)
+against PlanExecutor, which runs independent steps concurrently under their
+scheduler resources. System actions are harness.py stand-ins that sleep for a
+realistic time; typed commands go through VedaAssistant.process_command so the
+compound-command split in TacticalFastPath is included.
+
+Also shows a step that hangs: it is reported as timed out after its timeout
+and the steps that depend on it are skipped.
+
+Run from the repository root:
+    python benchmarks/bench_plans.py [--repeat 5] [--step-timeout 0.5]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from harness import ROOT, FakeOllamaServer, FakeTTS, HeadlessComponent, HeadlessGUI, build_assistant
+
+from veda.core.actions import ACTIONS
+from veda.core.plan import PlanExecutor
+from veda.features.modes import PROTOCOLS, ModeManager
+
+# Seconds each stand-in system action takes (app launches dominate)
+LATENCY = {"open_app": 0.30, "close_app": 0.20, "set_volume": 0.05, "set_brightness": 0.08, "screenshot": 0.12}
+COMMANDS = [
+    "close chrome, set volume to 20 and open notepad",
+    "set brightness to 40, take a screenshot and open calculator",
+    "open notepad then close notepad",
+]
+
+
+def sequential(assistant, command):
+    """The compound command as separate turns, one action after another."""
+    plan = assistant.planner.extract_plan(command)
+    for step in plan["params"]["steps"]:
+        assistant.process_command(step["text"])
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sequential vs concurrent execution of multi-step commands.")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case; the best is reported (default 5)")
+    parser.add_argument("--step-timeout", type=float, default=0.5, help="timeout of the hanging step in the demo")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        server = FakeOllamaServer({}, prompt_ms=0, token_ms=0).start()
+        assistant = build_assistant(server, HeadlessGUI(), FakeTTS(first_byte_ms=0, ms_per_char=0))
+        assistant.system = HeadlessComponent("system", latency=LATENCY)
+        assistant.plans = PlanExecutor(assistant)
+        assistant.modes = ModeManager(assistant)
+        try:
+            print(f"{'command':<62} {'steps':>5} {'sequential ms':>14} {'plan ms':>8} {'speed-up':>9}")
+            for command in COMMANDS:
+                steps = len(assistant.planner.extract_plan(command)["params"]["steps"])
+                before = timed(lambda: sequential(assistant, command), args.repeat)
+                after = timed(lambda: assistant.process_command(command), args.repeat)
+                print(f"{command:<62} {steps:>5} {before:>14.0f} {after:>8.0f} {before / after:>8.1f}x")
+
+            for mode, protocol in PROTOCOLS.items():
+                def one_by_one():
+                    for step in protocol["steps"]:
+                        action = ACTIONS.get(step["intent"])
+                        ACTIONS.dispatch(assistant, action, step["params"], "")
+                before = timed(one_by_one, args.repeat)
+                after = timed(lambda: assistant.modes.set_mode(mode), args.repeat)
+                print(f"{'protocol: ' + mode:<62} {len(protocol['steps']):>5} {before:>14.0f} {after:>8.0f} "
+                      f"{before / after:>8.1f}x")
+
+            # A hanging step: open_app takes 10x the timeout, close_app waits on it
+            hanging = HeadlessComponent("system", latency={**LATENCY, "open_app": args.step_timeout * 10})
+            assistant.system = hanging
+            start = time.perf_counter()
+            result = assistant.plans.run([
+                {"intent": "open_app", "params": {"app_name": "stuck"}, "timeout": args.step_timeout},
+                {"intent": "set_volume", "params": {"level": 30}},
+                {"intent": "close_app", "params": {"app_name": "stuck"}, "after": [0]},
+            ])
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"\nhanging step ({args.step_timeout:.1f}s timeout): returned after {elapsed:.0f} ms, "
+                  f"statuses {[step.status for step in result.steps]}")
+            print(f"response: {result.response}")
+        finally:
+            assistant.shutdown()
+            server.stop()
+            os.chdir(ROOT)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: MemoryRetriever indexing, reload and query latency, and the
+prompt size of top-k retrieval vs pasting every memory into the prompt.
+
+Run from the repository root (the database lives in a temp dir):
+    python benchmarks/bench_retrieval.py [memories]      # default 100000
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from veda.core.context import estimate_tokens
+from veda.core.retrieval import MemoryRetriever
+from veda.core.storage import VedaStorage
+
+SUBJECTS = ["my sister", "my dentist", "the gym", "my manager", "our landlord", "the car", "my laptop",
+            "grandma", "the dog", "my flight", "the garden", "my bank", "the piano teacher", "my team"]
+VERBS = ["is scheduled for", "prefers", "needs", "reminded me about", "costs", "is allergic to",
+         "moved to", "asked about", "lives near", "recommended"]
+OBJECTS = ["tuesday mornings", "oat milk", "a new battery", "the quarterly report", "peanuts", "berlin",
+           "the blue folder", "jazz records", "the 8am train", "a window seat", "green tea", "the cabin trip"]
+QUERIES = ["what is my sister allergic to", "when is the dentist", "what does my manager need",
+           "where did grandma move", "what seat do I like on a flight"]
+
+
+def memory_text(rng, i):
+    return f"{rng.choice(SUBJECTS)} {rng.choice(VERBS)} {rng.choice(OBJECTS)} (note {i})"
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(3)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "veda_memory.db")
+        retriever = MemoryRetriever(db_path)
+        rows = [(memory_text(rng, i),) for i in range(count)]
+        retriever.storage.executemany("INSERT INTO facts (fact) VALUES (?)", rows[: count // 2])
+        retriever.storage.executemany("INSERT INTO episodes (episode) VALUES (?)", rows[count // 2:])
+
+        t = time.perf_counter()
+        added = retriever.refresh()
+        on_disk = sum(os.path.getsize(db_path + suffix) for suffix in (".indices", ".weights", ".ids"))
+        print(f"initial index: {added} memories in {time.perf_counter() - t:.1f}s ({on_disk / 1e6:.0f} MB on disk)")
+
+        t = time.perf_counter()
+        reloaded = MemoryRetriever(db_path)
+        reloaded.refresh()
+        print(f"reload from disk: {(time.perf_counter() - t) * 1000:.0f} ms")
+
+        t = time.perf_counter()
+        reloaded.add_fact("my sister is allergic to shellfish and kiwis")
+        print(f"incremental insert: {(time.perf_counter() - t) * 1000:.2f} ms")
+
+        timings = []
+        for _ in range(5):
+            for query in QUERIES:
+                t = time.perf_counter()
+                reloaded.search(query)
+                timings.append((time.perf_counter() - t) * 1000)
+        timings.sort()
+        print(f"query: p50 {timings[len(timings) // 2]:.1f} ms, p95 {timings[int(len(timings) * 0.95)]:.1f} ms")
+
+        for query in QUERIES[:2]:
+            print(f"  {query!r}:")
+            for score, kind, text in reloaded.search(query, k=3):
+                print(f"    {score:.2f} {kind}: {text}")
+
+        message = reloaded.context_message(QUERIES[0])
+        injected = estimate_tokens(message["content"]) if message else 0
+        everything = sum(estimate_tokens(text) for (text,) in rows)
+        print(f"prompt tokens: top-k {injected} vs all memories {everything}")
+        VedaStorage.for_path(db_path).close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark: accuracy and latency of each intent routing tier
+(regex fast-path -> semantic router -> LLM) over a labelled utterance set.
+
+Run from the repository root:
+    python benchmarks/bench_router.py [--llm]
+
+--llm also sends the leftovers to Ollama (needs a running server).
+"""
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from veda.core.planner import TacticalFastPath
+from veda.core.router import SemanticRouter
+from veda.utils.sanitizer import VedaSanitizer
+
+DATA = os.path.join(ROOT, "benchmarks", "data", "labelled_utterances.json")
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))] if ordered else 0.0
+
+
+def main():
+    with open(DATA, "r", encoding="utf-8") as f:
+        utterances = json.load(f)
+
+    tiers = [("fast-path", TacticalFastPath().extract), ("semantic", SemanticRouter().route)]
+    if "--llm" in sys.argv:
+        from veda.core.llm import VedaLLM
+        tiers.append(("llm", VedaLLM().extract_intent))
+
+    stats = {name: {"handled": 0, "correct": 0, "latency": []} for name, _ in tiers}
+    unresolved = []
+    for item in utterances:
+        text = VedaSanitizer.clean_input(item["text"])
+        for name, resolve in tiers:
+            start = time.perf_counter()
+            result = resolve(text)
+            stats[name]["latency"].append((time.perf_counter() - start) * 1000)
+            if result:
+                stats[name]["handled"] += 1
+                stats[name]["correct"] += result.get("intent") == item["intent"]
+                break
+        else:
+            unresolved.append(item)
+
+    total = len(utterances)
+    print(f"{total} labelled utterances")
+    print(f"{'tier':>10} {'handled':>8} {'accuracy':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    for name, _ in tiers:
+        s = stats[name]
+        accuracy = f"{s['correct'] / s['handled']:.0%}" if s["handled"] else "-"
+        print(f"{name:>10} {s['handled']:>8} {accuracy:>9} "
+              f"{percentile(s['latency'], 0.5):>8.3f} {percentile(s['latency'], 0.95):>8.3f}")
+    print(f"{'to llm':>10} {len(unresolved):>8}" + ("" if "--llm" in sys.argv else "   (not run; pass --llm)"))
+
+
+if __name__ == "__main__":
+    main()
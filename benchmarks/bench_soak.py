@@ -0,0 +1,142 @@
+"""
+Soak test: a long session of synthetic turns through VedaAssistant against
+the harness.py stand-ins (instant model and TTS, so turns run back to back).
+tracemalloc, RSS and the thread count are sampled every --sample-every turns;
+at the end the allocation sites that grew most since warm-up are listed.
+
+Growth is measured from the end of the warm-up turns, once caches and
+bounded buffers have filled. The run fails (exit status 1) if traced memory
+grows by more than --budget bytes per turn, or if threads keep piling up.
+
+Run from the repository root:
+    python benchmarks/bench_soak.py [--turns 20000] [--warmup 2000] [--sample-every 2000]
+        [--budget 256] [--top 10] [--frames 1]
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from harness import ROOT, FakeOllamaServer, FakeTTS, HeadlessGUI, build_assistant
+
+DATA = os.path.join(ROOT, "benchmarks", "data", "labelled_utterances.json")
+# Every turn differs from the last, like a real session: fresh chat topics, tasks and levels
+TEMPLATES = [
+    "what do you think about topic number {n}",
+    "remind me to water plant {n}",
+    "set volume to {level}",
+    "tell me something interesting about the year {year}",
+    "weather in city{n}",
+]
+
+
+def synthetic_turns(corpus):
+    for n in itertools.count():
+        if n % 3 == 0:
+            yield corpus[n // 3 % len(corpus)]["text"]
+        else:
+            yield TEMPLATES[n % len(TEMPLATES)].format(n=n, level=n % 101, year=1900 + n % 125)
+
+
+def current_rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 1024 / 1024
+    except ImportError:
+        return None
+
+
+def growth_sites(before, after, top):
+    """The top allocation sites by growth between two snapshots, ignoring tracemalloc and import machinery."""
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+               tracemalloc.Filter(False, "<unknown>")]
+    stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), "traceback")
+    return [stat for stat in stats if stat.size_diff > 0][:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Long-session memory soak test for VedaAssistant.")
+    parser.add_argument("--turns", type=int, default=20000, help="turns after warm-up (default 20000)")
+    parser.add_argument("--warmup", type=int, default=2000, help="turns run before the baseline snapshot")
+    parser.add_argument("--sample-every", type=int, default=2000, help="turns between samples")
+    parser.add_argument("--budget", type=float, default=256.0, help="allowed traced-memory growth, bytes per turn")
+    parser.add_argument("--top", type=int, default=10, help="growth sites to list")
+    parser.add_argument("--frames", type=int, default=1, help="traceback depth tracemalloc records")
+    args = parser.parse_args()
+
+    with open(DATA, "r", encoding="utf-8") as f:
+        corpus = json.load(f)
+    turns = synthetic_turns(corpus)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        server = FakeOllamaServer({item["text"]: item["intent"] for item in corpus}, prompt_ms=0, token_ms=0).start()
+        tts = FakeTTS(first_byte_ms=0, ms_per_char=0)
+        assistant = build_assistant(server, HeadlessGUI(), tts, trace_path=os.path.join(tmp, "traces.jsonl"))
+        tracemalloc.start(args.frames)
+
+        start = time.perf_counter()
+        for _ in range(args.warmup):
+            assistant.process_command(next(turns))
+        assistant.memory.flush()
+        baseline = tracemalloc.take_snapshot()
+        base_traced = tracemalloc.get_traced_memory()[0]
+        base_threads = threading.active_count()
+        print(f"warm-up: {args.warmup} turns in {time.perf_counter() - start:.1f}s, "
+              f"traced {base_traced / 1024 / 1024:.1f} MiB, {base_threads} threads")
+
+        print(f"{'turn':>8} {'traced MiB':>11} {'B/turn':>8} {'RSS MiB':>8} {'threads':>8} {'turns/s':>8}")
+        samples = []
+        start = time.perf_counter()
+        last = start
+        for done in range(1, args.turns + 1):
+            assistant.process_command(next(turns))
+            if done % args.sample_every == 0 or done == args.turns:
+                assistant.memory.flush()
+                traced = tracemalloc.get_traced_memory()[0]
+                now = time.perf_counter()
+                rate = (args.sample_every if done % args.sample_every == 0 else done % args.sample_every) / (now - last)
+                last = now
+                rss = current_rss_mb()
+                samples.append((done, traced, threading.active_count()))
+                print(f"{done:>8} {traced / 1024 / 1024:>11.2f} {(traced - base_traced) / done:>8.1f} "
+                      f"{rss if rss is not None else float('nan'):>8.1f} {threading.active_count():>8} {rate:>8.0f}")
+
+        final = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        assistant.shutdown()
+        server.stop()
+        os.chdir(ROOT)
+
+    per_turn = (samples[-1][1] - base_traced) / args.turns
+    threads = samples[-1][2]
+    print(f"\ntop growth since warm-up ({args.turns} turns):")
+    for stat in growth_sites(baseline, final, args.top):
+        frame = stat.traceback[0]
+        where = f"{os.path.relpath(frame.filename, ROOT) if frame.filename.startswith(ROOT) else frame.filename}:{frame.lineno}"
+        print(f"  {stat.size_diff / 1024:>9.1f} KiB {stat.count_diff:>+8} blocks  {where}")
+
+    failures = []
+    if per_turn > args.budget:
+        failures.append(f"traced memory grew {per_turn:.1f} B/turn, budget {args.budget:.0f}")
+    if threads > base_threads + 2:
+        failures.append(f"thread count grew from {base_threads} to {threads}")
+    print(f"\nmemory growth {per_turn:.1f} B/turn (budget {args.budget:.0f}), threads {base_threads} -> {threads}")
+    if failures:
+        print("FAIL: " + "; ".join(failures))
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark: VedaAssistant cold start. Shows the slowest imports behind
+`import veda.core.assistant` (via python -X importtime), the time spent in
+VedaAssistant.__init__, and what the background warm-up later pays for each
+deferred subsystem.
+
+Run from the repository root (databases and caches go to a temp dir):
+    python benchmarks/bench_startup.py [top]      # default 20 imports
+"""
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from veda.utils.health import startup_report
+
+
+class HeadlessGUI:
+    def update_chat(self, sender, message, partial=False):
+        pass
+
+    def reset_voice_button(self):
+        pass
+
+
+def main():
+    top = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    os.chdir(ROOT)
+    print(f"{'cumulative ms':>14} {'self ms':>8}  import")
+    for cumulative, own, name in startup_report("veda.core.assistant", top):
+        print(f"{cumulative:>14.1f} {own:>8.1f}  {name}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        start = time.perf_counter()
+        from veda.core.assistant import VedaAssistant
+        imported = time.perf_counter() - start
+        assistant = VedaAssistant(HeadlessGUI())
+        print(f"\nimport veda.core.assistant: {imported * 1000:.0f} ms")
+        print(f"VedaAssistant.__init__:     {assistant.startup_timings['init'] * 1000:.0f} ms")
+
+        print("\nbackground warm-up (off the UI thread):")
+        for name, seconds in assistant.warm_up().items():
+            if name != "init":
+                print(f"  {name:>20}: {seconds * 1000:.0f} ms")
+        assistant.shutdown()
+        os.chdir(ROOT)
+
+
+if __name__ == "__main__":
+    main()
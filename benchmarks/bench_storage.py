@@ -0,0 +1,98 @@
+"""
+Benchmark: VedaMemory / TaskManager on the shared storage layer vs the
+legacy connect-commit-close per call.
+
+Run from the repository root:
+    python benchmarks/bench_storage.py
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from veda.core.memory import VedaMemory
+from veda.core.storage import VedaStorage
+from veda.features.tasks import TaskManager
+
+OPS = 2000
+
+
+class LegacyStore:
+    """The pre-storage behaviour: a fresh connection and commit for every call."""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        conn = sqlite3.connect(db_path)
+        conn.executescript('''
+            CREATE TABLE IF NOT EXISTS memory (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS interactions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, role TEXT, content TEXT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP);
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, task TEXT,
+                status TEXT DEFAULT 'pending', created_at DATETIME DEFAULT CURRENT_TIMESTAMP);
+        ''')
+        conn.close()
+
+    def _write(self, sql, params):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(sql, params)
+        conn.commit()
+        conn.close()
+
+    def set(self, key, value):
+        self._write("INSERT OR REPLACE INTO memory (key, value) VALUES (?, ?)", (key, value))
+
+    def get(self, key, default=None):
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute("SELECT value FROM memory WHERE key = ?", (key,)).fetchone()
+        conn.close()
+        return row[0] if row else default
+
+    def log_interaction(self, role, content):
+        self._write("INSERT INTO interactions (role, content) VALUES (?, ?)", (role, content))
+
+    def add_task(self, task):
+        self._write("INSERT INTO tasks (task) VALUES (?)", (task,))
+
+
+def ops_per_sec(fn, finish=None):
+    start = time.perf_counter()
+    for i in range(OPS):
+        fn(i)
+    if finish:
+        finish()
+    return OPS / (time.perf_counter() - start)
+
+
+def run(memory, tasks):
+    return {
+        "set": ops_per_sec(lambda i: memory.set(f"key{i % 50}", f"value{i}")),
+        "get": ops_per_sec(lambda i: memory.get(f"key{i % 50}")),
+        # Includes the final flush, so write-behind logging is timed until it hits disk
+        "log": ops_per_sec(lambda i: memory.log_interaction("user", f"message {i}"), getattr(memory, "flush", None)),
+        "add_task": ops_per_sec(lambda i: tasks.add_task(f"task {i}")),
+    }
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = LegacyStore(os.path.join(tmp, "legacy.db"))
+        before = run(legacy, legacy)
+
+        db_path = os.path.join(tmp, "shared.db")
+        memory = VedaMemory(db_path)
+        after = run(memory, TaskManager(db_path))
+        memory.close()
+        VedaStorage.for_path(db_path).close()
+
+    print(f"{'op':>9} {'before ops/s':>13} {'after ops/s':>12} {'speedup':>8}")
+    for op in before:
+        print(f"{op:>9} {before[op]:>13.0f} {after[op]:>12.0f} {after[op] / before[op]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
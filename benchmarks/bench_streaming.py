@@ -0,0 +1,72 @@
+"""
+Benchmark: time-to-first-token / time-to-first-audio for the streaming
+reply pipeline vs the old generate-everything-then-speak flow.
+
+Uses simulated generation and TTS timings (no Ollama or audio device):
+    python benchmarks/bench_streaming.py [tokens_per_sec] [synth_ms_per_char]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from veda.core.streaming import StreamingPipeline
+
+REPLY = (
+    "Certainly. The James Webb telescope orbits the second Lagrange point, about 1.5 million "
+    "kilometres from Earth. Its mirror is made of eighteen gold-coated beryllium segments. "
+    "It observes mostly in the infrared, which lets it see through dust clouds. "
+    "Would you like me to pull up its latest images?"
+)
+
+
+def fake_chunks(tokens_per_sec):
+    words = REPLY.split(" ")
+    for i, word in enumerate(words):
+        time.sleep(1.0 / tokens_per_sec)
+        yield word if i == len(words) - 1 else word + " "
+
+
+def fake_synthesize(text, ms_per_char):
+    time.sleep(len(text) * ms_per_char / 1000.0)
+
+
+def blocking_turn(tokens_per_sec, ms_per_char):
+    start = time.perf_counter()
+    text = "".join(fake_chunks(tokens_per_sec))
+    ttft = None  # the UI only sees the reply once it is complete
+    fake_synthesize(text, ms_per_char)
+    ttfa = time.perf_counter() - start
+    return ttft, ttfa, text
+
+
+def streaming_turn(tokens_per_sec, ms_per_char):
+    def speak(sentences, on_first_audio):
+        for sentence in sentences:
+            fake_synthesize(sentence, ms_per_char)
+            if on_first_audio:
+                on_first_audio()
+                on_first_audio = None
+
+    pipeline = StreamingPipeline(on_token=lambda chunk: None, speak=speak)
+    text = pipeline.run(fake_chunks(tokens_per_sec))
+    return pipeline.metrics["ttft"], pipeline.metrics["ttfa"], text
+
+
+def main():
+    tokens_per_sec = float(sys.argv[1]) if len(sys.argv) > 1 else 25.0
+    ms_per_char = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+
+    _, blocking_ttfa, blocking_text = blocking_turn(tokens_per_sec, ms_per_char)
+    ttft, ttfa, text = streaming_turn(tokens_per_sec, ms_per_char)
+    assert text == blocking_text
+
+    print(f"simulated {tokens_per_sec:.0f} tok/s, TTS {ms_per_char:.1f} ms/char")
+    print(f"{'mode':>10} {'first token ms':>15} {'first audio ms':>15}")
+    print(f"{'blocking':>10} {'(full reply)':>15} {blocking_ttfa * 1000:>15.0f}")
+    print(f"{'streaming':>10} {ttft * 1000:>15.0f} {ttfa * 1000:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Benchmark: chat transcript frame time with a long session behind it. The
+old VedaGUI path (one after(0) callback per update, every message kept in
+the text box) is compared with Transcript (updates coalesced to one flush
+per frame, bounded window). With the history loaded, a streamed reply and a
+few messages are posted from a worker thread as fast as possible while the
+event loop runs; frame time is the time spent in each pass of the loop.
+
+A plain tk.Text stands in for CTkTextbox (same API). Without a display
+(e.g. CI) an in-memory stand-in is used instead, which only measures the
+Python side, not Tk layout and rendering.
+
+Run from the repository root:
+    python benchmarks/bench_transcript.py [messages]      # default 100000
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from veda.ui.transcript import Transcript
+
+CHUNKS = 400
+MESSAGES = 50
+
+
+class LegacyTranscript:
+    """VedaGUI's previous update_chat/_update_chat_ui."""
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.streaming = False
+
+    def post(self, sender, message, partial=False):
+        self.widget.after(0, self._update_chat_ui, sender, message, partial)
+
+    def _update_chat_ui(self, sender, message, partial=False):
+        self.widget.configure(state="normal")
+        if partial:
+            if not self.streaming:
+                self.widget.insert("end", f"{sender}: ")
+                self.streaming = True
+            self.widget.insert("end", message)
+        else:
+            if self.streaming:
+                self.widget.insert("end", "\n\n")
+                self.streaming = False
+            if message:
+                self.widget.insert("end", f"{sender}: {message}\n\n")
+        self.widget.configure(state="disabled")
+        self.widget.see("end")
+
+
+class TextStandIn:
+    """Just enough of tk.Text (and its event loop) for Transcript, kept in memory."""
+
+    def __init__(self):
+        self.lines = [""]
+        self.callbacks = []
+        self.lock = threading.Lock()
+
+    def after(self, ms, callback, *args):
+        with self.lock:
+            self.callbacks.append((callback, args))
+
+    def after_idle(self, callback, *args):
+        self.after(0, callback, *args)
+
+    def update(self):
+        with self.lock:
+            callbacks, self.callbacks = self.callbacks, []
+        for callback, args in callbacks:
+            callback(*args)
+
+    def insert(self, index, text):
+        new = text.split("\n")
+        if index == "1.0":
+            new[-1] += self.lines[0]
+            self.lines[:1] = new
+        else:
+            new[0] = self.lines[-1] + new[0]
+            self.lines[-1:] = new
+
+    def delete(self, start, end):
+        del self.lines[:int(end.split(".")[0]) - 1]
+
+    def yview(self, *args):
+        return (0.99, 1.0)
+
+    def see(self, index):
+        pass
+
+    def configure(self, **options):
+        pass
+
+
+def make_widget():
+    try:
+        import tkinter
+        root = tkinter.Tk()
+    except Exception:
+        widget = TextStandIn()
+        pump, close, lines = widget.update, lambda: None, lambda: len(widget.lines)
+    else:
+        root.geometry("600x700")
+        widget = tkinter.Text(root, wrap="word")
+        widget.pack(fill="both", expand=True)
+        root.update()
+        pump, close, lines = root.update, root.destroy, lambda: int(widget.index("end-1c").split(".")[0])
+    # Count the event-loop callbacks each variant schedules
+    scheduled = [0]
+    after = widget.after
+
+    def counting_after(ms, callback, *args):
+        scheduled[0] += 1
+        return after(ms, callback, *args)
+    widget.after = counting_after
+    return widget, pump, close, lines, scheduled
+
+
+def run(name, make_transcript, messages):
+    widget, pump, close, lines, scheduled = make_widget()
+    transcript = make_transcript(widget)
+    start = time.perf_counter()
+    if isinstance(transcript, LegacyTranscript):
+        # Same end state as a long session: every message is in the text box
+        widget.insert("end", "".join(f"{'You' if i % 2 else 'Veda'}: message number {i} of the session\n\n"
+                                     for i in range(messages)))
+    else:
+        # Posted as a session would (one flush here; only the window stays in the widget)
+        for i in range(messages):
+            transcript.post("You" if i % 2 else "Veda", f"message number {i} of the session")
+        transcript.flush()
+    pump()
+    loaded = time.perf_counter() - start
+
+    def burst():
+        for i in range(CHUNKS):
+            transcript.post("Veda", f"tok{i} ", partial=True)
+        transcript.post("Veda", "")
+        for i in range(MESSAGES):
+            transcript.post("You", f"follow-up {i}")
+
+    scheduled[0] = 0
+    worker = threading.Thread(target=burst)
+    frames = []
+    start = time.perf_counter()
+    worker.start()
+    idle = 0
+    while worker.is_alive() or idle < 20:
+        t = time.perf_counter()
+        pump()
+        elapsed = time.perf_counter() - t
+        if elapsed > 0.0002:
+            frames.append(elapsed * 1000)
+            idle = 0
+        else:
+            idle += 1
+            time.sleep(0.001)
+    total = time.perf_counter() - start
+    worker.join()
+    held = lines()
+    close()
+
+    frames.sort()
+    p95 = frames[min(len(frames) - 1, int(len(frames) * 0.95))] if frames else 0.0
+    print(f"{name:>10} {loaded:>8.2f} {len(frames):>7} {frames[len(frames) // 2] if frames else 0.0:>9.2f} "
+          f"{p95:>9.2f} {frames[-1] if frames else 0.0:>9.2f} {total * 1000:>9.0f} {scheduled[0]:>10} {held:>8}")
+
+
+def main():
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"{messages} messages of history, then {CHUNKS} streamed chunks + {MESSAGES} messages from a worker")
+    try:
+        import tkinter
+        tkinter.Tk().destroy()
+    except Exception as e:
+        print(f"no display ({e.__class__.__name__}): using the in-memory text stand-in, Python cost only")
+    print(f"{'':>10} {'load s':>8} {'frames':>7} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'drain ms':>9} "
+          f"{'callbacks':>10} {'lines':>8}")
+    run("legacy", LegacyTranscript, messages)
+    run("bounded", Transcript, messages)
+
+
+if __name__ == "__main__":
+    main()
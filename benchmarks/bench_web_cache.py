@@ -0,0 +1,95 @@
+"""
+Benchmark: WebInfo's pooled, cached HTTP layer against a local stub server
+(no real network). Compares repeated lookups with the old per-call
+requests.get, and checks request coalescing and refresh-ahead by counting
+the requests the stub server actually receives.
+
+    python benchmarks/bench_web_cache.py [server_delay_ms]      # default 150
+"""
+import concurrent.futures
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from veda.features.web_info import WebInfo
+
+
+class StubWeather(BaseHTTPRequestHandler):
+    delay = 0.15
+    hits = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with StubWeather.lock:
+            StubWeather.hits += 1
+        time.sleep(self.delay)
+        body = b"Partly cloudy +18C"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def legacy_weather(base, city):
+    response = requests.get(f"{base}/{city}?format=%C+%t")
+    return response.text
+
+
+def timed(fn, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1000
+
+
+def main():
+    StubWeather.delay = (float(sys.argv[1]) if len(sys.argv) > 1 else 150.0) / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubWeather)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    web = WebInfo(weather_url=base + "/{city}")
+
+    n = 10
+    StubWeather.hits = 0
+    legacy_ms = timed(lambda: legacy_weather(base, "London"), n)
+    print(f"legacy requests.get:   {legacy_ms:7.1f} ms/lookup, {StubWeather.hits} server requests")
+    StubWeather.hits = 0
+    cached_ms = timed(lambda: web.get_weather("London"), n)
+    print(f"WebInfo (TTL cache):   {cached_ms:7.1f} ms/lookup, {StubWeather.hits} server requests")
+
+    StubWeather.hits = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=20) as pool:
+        start = time.perf_counter()
+        answers = list(pool.map(lambda _: web.get_weather("Paris"), range(20)))
+        elapsed = (time.perf_counter() - start) * 1000
+    print(f"20 concurrent misses:  {elapsed:7.1f} ms total, {StubWeather.hits} server request(s), "
+          f"{len(set(answers))} distinct answer(s)")
+
+    # Refresh-ahead: a hit late in the entry's life refetches in the background
+    web.WEATHER_TTL = 1.0
+    web.get_weather("Oslo")
+    time.sleep(0.9)
+    StubWeather.hits = 0
+    start = time.perf_counter()
+    web.get_weather("Oslo")
+    late_hit_ms = (time.perf_counter() - start) * 1000
+    time.sleep(StubWeather.delay + 0.2)
+    start = time.perf_counter()
+    web.get_weather("Oslo")
+    after_expiry_ms = (time.perf_counter() - start) * 1000
+    print(f"refresh-ahead:         late hit {late_hit_ms:.1f} ms, past original expiry {after_expiry_ms:.1f} ms, "
+          f"{StubWeather.hits} background request(s)")
+    print(f"cache stats: {web.cache.stats()}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+Local stand-ins for everything VedaAssistant talks to, so whole turns can be
+benchmarked offline:
+
+    FakeOllamaServer   - HTTP server speaking Ollama's /api/chat and /api/generate,
+                         with configurable prompt-eval latency and token rate
+    FakeTTS            - replaces the Edge TTS fetch (and playback) with fixed audio
+    WavRecognizer      - replaces microphone + speech recognition with WAV fixtures
+    HeadlessGUI        - the parts of VedaGUI the assistant calls, without Tk
+    HeadlessComponent  - records feature actions instead of touching the OS
+
+build_assistant() wires them into a real VedaAssistant (real planner, router,
+intent cache, memory, scheduler and voice pipeline).
+"""
+import asyncio
+import collections
+import json
+import os
+import re
+import sys
+import threading
+import time
+import wave
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from veda.core.actions import ACTIONS
+from veda.utils.sanitizer import VedaSanitizer
+
+REPLY = ("Certainly. Here is a short answer that runs for a couple of sentences, much like a real reply. "
+         "It gives the streaming and speech pipeline something realistic to work through.")
+USER_INPUT = re.compile(r'User input: "(.*)"', re.S)
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so the client's connection reuse is exercised
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        server = self.server
+        with server.lock:
+            server.requests[self.path] += 1
+        if self.path == "/api/generate":
+            self._send_json({"model": body.get("model"), "response": "", "done": True, "load_duration": 0})
+        elif self.path == "/api/chat":
+            self._chat(body)
+        else:
+            self._send_json({"error": f"unknown endpoint {self.path}"}, status=404)
+
+    def _chat(self, body):
+        server = self.server
+        messages = body.get("messages") or []
+        prompt_chars = sum(len(message.get("content", "")) for message in messages)
+        last = messages[-1].get("content", "") if messages else ""
+        if body.get("format") == "json":
+            match = USER_INPUT.search(last)
+            intent = server.labels.get(match.group(1) if match else "", "none")
+            result = {"intent": intent, "params": {}}
+            if "'reply'" in last:
+                result["reply"] = REPLY if intent == "none" else "Done."
+            tokens = [json.dumps(result)]
+            token_count = server.intent_tokens + (len(REPLY.split()) if result.get("reply") == REPLY else 0)
+        else:
+            words = REPLY.split()
+            tokens = [word + " " for word in words[:-1]] + words[-1:]
+            token_count = len(tokens)
+        stats = {"prompt_eval_count": prompt_chars // 4, "eval_count": token_count,
+                 "prompt_eval_duration": int(server.prompt_ms * 1e6),
+                 "eval_duration": int(token_count * server.token_ms * 1e6), "load_duration": 0}
+
+        with server.slots:
+            time.sleep(server.prompt_ms / 1000)
+            if not body.get("stream"):
+                time.sleep(token_count * server.token_ms / 1000)
+                self._send_json({"model": body.get("model"), "done": True,
+                                 "message": {"role": "assistant", "content": "".join(tokens)}, **stats})
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            try:
+                for token in tokens:
+                    time.sleep(server.token_ms / 1000 * token_count / len(tokens))
+                    self._chunk({"model": body.get("model"), "done": False,
+                                 "message": {"role": "assistant", "content": token}})
+                self._chunk({"model": body.get("model"), "done": True,
+                             "message": {"role": "assistant", "content": ""}, **stats})
+                self.wfile.write(b"0\r\n\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                with server.lock:
+                    server.requests["cancelled"] += 1  # the client closed the stream
+
+    def _chunk(self, payload):
+        data = (json.dumps(payload) + "\n").encode()
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def _send_json(self, payload, status=200):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeOllamaServer(ThreadingHTTPServer):
+    """
+    Answers chat requests with a fixed reply streamed at token_ms per token
+    after prompt_ms of "prompt eval". JSON-mode (intent) requests return the
+    label of the quoted user input from `labels` (sanitized text -> intent),
+    or 'none'. `parallel` bounds concurrent requests like OLLAMA_NUM_PARALLEL.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, labels=None, prompt_ms=150.0, token_ms=25.0, parallel=4, intent_tokens=12):
+        super().__init__(("127.0.0.1", 0), FakeOllamaHandler)
+        self.labels = {VedaSanitizer.clean_input(text): intent for text, intent in (labels or {}).items()}
+        self.prompt_ms = prompt_ms
+        self.token_ms = token_ms
+        self.intent_tokens = intent_tokens
+        self.slots = threading.Semaphore(parallel)
+        self.lock = threading.Lock()
+        self.requests = collections.Counter()
+        self.thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, name="fake-ollama", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class FakeTTS:
+    """
+    Stands in for Edge TTS: after first_byte_ms plus ms_per_char, returns
+    bytes_per_char bytes of placeholder audio per character. Playback sleeps
+    for the audio's length times playback_speed (0 skips it).
+    """
+
+    def __init__(self, first_byte_ms=150.0, ms_per_char=0.4, bytes_per_char=350, playback_speed=0.0):
+        self.first_byte_ms = first_byte_ms
+        self.ms_per_char = ms_per_char
+        self.bytes_per_char = bytes_per_char
+        self.playback_speed = playback_speed
+        self.fetched = 0
+        self.played = 0
+
+    async def fetch_speech(self, text):
+        await asyncio.sleep((self.first_byte_ms + self.ms_per_char * len(text)) / 1000)
+        self.fetched += 1
+        return b"\xff\xf3" * (self.bytes_per_char * max(1, len(text)) // 2)
+
+    def play_audio(self, data, generation=None):
+        self.played += 1
+        if self.playback_speed:
+            # ~48 kbit/s mp3, so 6000 bytes per second of speech
+            time.sleep(len(data) / 6000 * self.playback_speed)
+
+    def install(self, voice):
+        voice.fetch_speech = self.fetch_speech
+        voice.play_audio = self.play_audio
+        return self
+
+
+def write_fixture(path, text, rate=16000, seconds_per_word=0.32):
+    """A WAV of one tone burst per word, standing in for a recording of text."""
+    rng = np.random.default_rng(len(text))
+    parts = []
+    for _ in text.split():
+        n = int(rate * seconds_per_word)
+        t = np.arange(n) / rate
+        parts.append(np.sin(2 * np.pi * rng.uniform(180, 320) * t) * np.hanning(n) * 6000)
+        parts.append(rng.normal(0, 40, int(rate * 0.06)))
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(np.concatenate(parts).astype(np.int16).tobytes())
+
+
+class WavRecognizer:
+    """
+    Replaces microphone capture and recognition: each listen() reads the next
+    (wav_path, transcript) fixture, waits decode_ms (plus the recording's
+    length if realtime) and returns the transcript.
+    """
+
+    def __init__(self, fixtures, decode_ms=300.0, realtime=False):
+        self.fixtures = collections.deque(fixtures)
+        self.decode_ms = decode_ms
+        self.realtime = realtime
+        self.audio_seconds = 0.0
+
+    def listen(self):
+        if not self.fixtures:
+            return "None"
+        path, transcript = self.fixtures.popleft()
+        with wave.open(path, "rb") as wav:
+            wav.readframes(wav.getnframes())
+            seconds = wav.getnframes() / wav.getframerate()
+        self.audio_seconds += seconds
+        time.sleep(self.decode_ms / 1000 + (seconds if self.realtime else 0.0))
+        return transcript
+
+    def install(self, voice):
+        def listen():
+            voice.stop()  # barge-in, as VedaVoice.listen does
+            return self.listen()
+        voice.listen = listen
+        return self
+
+
+class HeadlessGUI:
+    """Records what the assistant shows; after() callbacks are kept, not run."""
+
+    def __init__(self, scheduler=None):
+        if scheduler is not None:
+            self.scheduler = scheduler
+        self.messages = 0
+        self.partials = 0
+        self.first_reply = None
+        self.voice_resets = 0
+        self.scheduled = []
+
+    def update_chat(self, sender, message, partial=False):
+        if partial:
+            self.partials += 1
+        else:
+            self.messages += 1
+        if sender == "Veda" and message and self.first_reply is None:
+            self.first_reply = time.perf_counter()
+
+    def reset_voice_button(self):
+        self.voice_resets += 1
+
+    def after(self, ms, callback):
+        self.scheduled.append((ms, callback))
+
+
+class HeadlessComponent:
+    """
+    Stands in for a feature component: every action is recorded and answered,
+    nothing is executed. latency maps method names to how long they take, in seconds.
+    """
+
+    def __init__(self, name, latency=None):
+        self.name = name
+        self.latency = latency or {}
+        self.calls = collections.Counter()
+
+    def __getattr__(self, method):
+        if method.startswith("__"):
+            raise AttributeError(method)
+
+        def action(*args):
+            self.calls[method] += 1
+            if self.latency.get(method):
+                time.sleep(self.latency[method])
+            return f"{self.name}.{method} done."
+        return action
+
+
+def build_assistant(server, gui=None, tts=None, recognizer=None, llm_strategy="speculative", trace_path=None):
+    """A VedaAssistant in the current directory, talking to server and the given stand-ins."""
+    os.environ["OLLAMA_HOST"] = server.url
+    from veda.core.assistant import VedaAssistant
+    assistant = VedaAssistant(gui or HeadlessGUI(), llm_strategy=llm_strategy, trace_path=trace_path)
+    for name in ACTIONS.components:
+        setattr(assistant, name, HeadlessComponent(name))
+    (tts or FakeTTS()).install(assistant.voice)
+    if recognizer is not None:
+        recognizer.install(assistant.voice)
+    return assistant
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far, in MiB (None if it cannot be read)."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024  # bytes on macOS, KiB elsewhere
+    except ImportError:
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss) / 1024 / 1024
+    except ImportError:
+        return None
@@ -0,0 +1,157 @@
+import importlib
+import threading
+
+# Param default meaning "use the whole cleaned command text"
+TEXT = object()
+
+class Action:
+    """
+    One user-facing action: its intent name, the component method that handles it,
+    its params (name, default) in call order, fast-path regex patterns (named groups
+    fill params) and the scheduler resource it runs under.
+    """
+
+    def __init__(self, intent, component, method, params=(), patterns=(), resource="system"):
+        self.intent = intent
+        self.component = component
+        self.method = method
+        self.params = tuple(params)
+        self.patterns = list(patterns)
+        self.resource = resource
+
+    def arguments(self, params, text):
+        args = []
+        for name, default in self.params:
+            value = params.get(name)
+            if value is None:
+                value = text if default is TEXT else default
+            args.append(value)
+        return args
+
+class ActionRegistry:
+    """
+    Single source of truth for actions.
+
+    TacticalFastPath patterns, the LLM intent prompt and VedaAssistant dispatch
+    are all derived from here, so adding an action means registering it once.
+    Components ("system", "web", ...) are imported and constructed lazily the
+    first time one of their actions runs.
+    """
+
+    def __init__(self):
+        self.actions = {}  # intent -> Action, in registration order
+        self.components = {}  # name -> (module, class name, takes_assistant)
+        self.lock = threading.RLock()  # a component may pull in another while being built
+
+    def register_component(self, name, module, class_name, takes_assistant=False):
+        self.components[name] = (module, class_name, takes_assistant)
+
+    def register(self, action):
+        if action.component not in self.components:
+            raise ValueError(f"Unknown component '{action.component}' for action '{action.intent}'")
+        self.actions[action.intent] = action
+        return action
+
+    def get(self, intent):
+        return self.actions.get(intent)
+
+    def intents(self):
+        return list(self.actions)
+
+    def patterns(self):
+        """Fast-path patterns per intent, in registration order."""
+        return {intent: list(action.patterns) for intent, action in self.actions.items() if action.patterns}
+
+    def prompt_intents(self):
+        """Intent list for the LLM prompt, with each intent's param names."""
+        described = []
+        for intent, action in self.actions.items():
+            names = [name for name, _ in action.params]
+            described.append(f"'{intent}'" + (f" (params: {', '.join(names)})" if names else ""))
+        return ", ".join(described + ["'none'"])
+
+    def load_component(self, name, assistant):
+        """Imports and constructs a component the first time it is needed."""
+        module_name, class_name, takes_assistant = self.components[name]
+        with self.lock:
+            component = assistant.__dict__.get(name)
+            if component is None:
+                cls = getattr(importlib.import_module(module_name), class_name)
+                component = cls(assistant) if takes_assistant else cls()
+                setattr(assistant, name, component)
+        return component
+
+    def dispatch(self, assistant, action, params, text):
+        component = getattr(assistant, action.component)
+        return getattr(component, action.method)(*action.arguments(params, text))
+
+ACTIONS = ActionRegistry()
+
+ACTIONS.register_component("system", "veda.features.system_control", "SystemControl")
+ACTIONS.register_component("web", "veda.features.web_info", "WebInfo")
+ACTIONS.register_component("tools", "veda.features.tools", "VedaTools")
+ACTIONS.register_component("tasks", "veda.features.tasks", "TaskManager")
+ACTIONS.register_component("modes", "veda.features.modes", "ModeManager", takes_assistant=True)
+ACTIONS.register_component("plans", "veda.core.plan", "PlanExecutor", takes_assistant=True)
+
+# Registration order is fast-path priority: the first matching pattern wins
+ACTIONS.register(Action(
+    "set_volume", "system", "set_volume", params=[("level", 50)], resource="volume",
+    patterns=[r"set volume to (?P<level>\d+)", r"volume (?P<level>\d+)", r"change volume to (?P<level>\d+)"],
+))
+ACTIONS.register(Action(
+    "set_brightness", "system", "set_brightness", params=[("level", 50)], resource="display",
+    patterns=[r"set brightness to (?P<level>\d+)", r"brightness (?P<level>\d+)"],
+))
+ACTIONS.register(Action(
+    "open_app", "system", "open_app", params=[("app_name", "")], resource="apps",
+    patterns=[r"open (?P<app_name>[\w\s.-]+)", r"launch (?P<app_name>[\w\s.-]+)", r"start (?P<app_name>[\w\s.-]+)"],
+))
+ACTIONS.register(Action(
+    "close_app", "system", "close_app", params=[("app_name", "")], resource="apps",
+    patterns=[r"close (?P<app_name>[\w\s.-]+)", r"kill (?P<app_name>[\w\s.-]+)", r"stop (?P<app_name>[\w\s.-]+)"],
+))
+ACTIONS.register(Action(
+    "find", "system", "find", params=[("query", TEXT)], resource="files",
+    patterns=[r"find (?P<query>[\w\s.-]+)", r"search for (?P<query>[\w\s.-]+)", r"where is (?P<query>[\w\s.-]+)"],
+))
+ACTIONS.register(Action(
+    "move", "system", "move", params=[("source", ""), ("destination", "")], resource="files",
+    patterns=[r"move (?P<source>[\w\s./\\]+) to (?P<destination>[\w\s./\\]+)"],
+))
+ACTIONS.register(Action(
+    "add_task", "tasks", "add_task", params=[("task", TEXT)], resource="tasks",
+    patterns=[r"add (?P<task>[\w\s.-]+) to my tasks", r"remind me to (?P<task>[\w\s.-]+)"],
+))
+ACTIONS.register(Action(
+    "list_tasks", "tasks", "list_tasks", resource="tasks",
+    patterns=[r"what are my tasks", r"show my tasks", r"list tasks"],
+))
+ACTIONS.register(Action(
+    "set_mode", "modes", "set_mode", params=[("mode", TEXT)], resource="modes",
+    patterns=[r"set mode to (?P<mode>[\w\s]+)", r"switch to (?P<mode>[\w\s]+) mode", r"engage (?P<mode>[\w\s]+) protocol"],
+))
+ACTIONS.register(Action(
+    "time", "tools", "get_time", resource="tools",
+    patterns=[r"what time", r"current time", r"the time"],
+))
+ACTIONS.register(Action(
+    "date", "tools", "get_date", resource="tools",
+    patterns=[r"what day", r"what is the date", r"today's date"],
+))
+ACTIONS.register(Action(
+    "screenshot", "system", "screenshot", resource="display",
+    patterns=[r"take a screenshot", r"screenshot"],
+))
+ACTIONS.register(Action(
+    "lock_pc", "system", "lock_pc",
+    patterns=[r"lock my pc", r"lock the computer", r"lock pc"],
+))
+ACTIONS.register(Action(
+    "weather", "web", "get_weather", params=[("city", "auto")], resource="web",
+    patterns=[r"weather in (?P<city>[\w\s]+)", r"weather for (?P<city>[\w\s]+)"],
+))
+ACTIONS.register(Action("web_search", "web", "search", params=[("query", TEXT)], resource="web"))
+ACTIONS.register(Action("note", "tools", "take_note", params=[("text", TEXT)], resource="tools"))
+# Several actions from one command, run by PlanExecutor (compound commands are split in TacticalFastPath)
+ACTIONS.register(Action("plan", "plans", "run_steps", params=[("steps", [])], resource="plans"))
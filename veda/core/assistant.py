@@ -1,127 +1,252 @@
+import importlib
+import threading
+import time
 from veda.core.llm import VedaLLM
 from veda.core.voice import VedaVoice
 from veda.core.planner import TacticalFastPath
 from veda.core.memory import VedaMemory
+from veda.core.intent_cache import IntentCache
+from veda.core.streaming import StreamingPipeline
+from veda.core.speculative import SpeculativeTurn
+from veda.core.scheduler import CommandScheduler
+from veda.core.tracing import TRACER, JsonlSink
 from veda.utils.sanitizer import VedaSanitizer
-from veda.features.system_control import SystemControl
-from veda.features.web_info import WebInfo
-from veda.features.tools import VedaTools
-from veda.features.tasks import TaskManager
-from veda.features.modes import ModeManager
+from veda.core.actions import ACTIONS
+from veda.utils.lazy import LazyProxy
+
+# Heavy third-party modules imported in the background after the window shows,
+# so the first command that needs one does not pay for the import
+WARM_IMPORTS = ("edge_tts", "requests", "duckduckgo_search", "pyautogui")
 
 class VedaAssistant:
-    def __init__(self, gui):
+    # How a turn that misses every local tier uses the model:
+    #   "serial"      - extract the intent, then generate a chat reply if it is 'none'
+    #   "speculative" - generate the chat reply while the intent is extracted; cancel it for actions
+    #   "combined"    - one structured call returning both intent and reply
+    # "speculative" needs Ollama to serve parallel requests (OLLAMA_NUM_PARALLEL > 1);
+    # with a single slot the speculative chat delays the intent call, so use "serial" there.
+    LLM_STRATEGIES = ("serial", "speculative", "combined")
+
+    def __init__(self, gui, llm_strategy="speculative", trace_path="veda_traces.jsonl"):
+        started = time.perf_counter()
+        if llm_strategy not in self.LLM_STRATEGIES:
+            raise ValueError(f"Unknown LLM strategy '{llm_strategy}'")
         self.gui = gui
+        self.llm_strategy = llm_strategy
+        # Per-turn stage timings; `python -m veda.core.tracing` prints percentiles from the file
+        self.trace_sink = None
+        if trace_path and not TRACER.enabled:
+            self.trace_sink = JsonlSink(trace_path)
+            TRACER.enable(self.trace_sink)
+        # Commands may run concurrently; shared subsystems are serialized through resource locks
+        self.scheduler = getattr(gui, "scheduler", None) or CommandScheduler()
         self.memory = VedaMemory()
+        # The GUI is built before the assistant owns the memory store, so its transcript gets the history here
+        if hasattr(gui, "attach_history"):
+            gui.attach_history(self.memory.history)
         self.llm = VedaLLM()
+        # Long-term facts/episodes; the top matches for each message are added to the chat prompt.
+        # Like the router, it imports numpy on first use or during warm-up
+        self.llm.retriever = LazyProxy("veda.core.retrieval", "MemoryRetriever", self.memory.db_path)
         self.voice = VedaVoice()
         self.planner = TacticalFastPath()
-        self.system = SystemControl()
-        self.web = WebInfo()
-        self.tools = VedaTools()
-        self.tasks = TaskManager()
-        self.modes = ModeManager(self)
+        # Builds its TF-IDF matrices (and imports numpy) on first use or during warm-up
+        self.router = LazyProxy("veda.core.router", "SemanticRouter")
+        # LLM intent results, keyed on sanitized text; reliable phrasings graduate to the fast-path
+        self.intent_cache = IntentCache(
+            self.memory.storage, (self.llm.model, VedaLLM.INTENTS), on_promote=self.planner.add_pattern
+        )
+        for intent, pattern in self.intent_cache.templates():
+            self.planner.add_pattern(intent, pattern)
+        self.stream_metrics = {}
+        self.wake_listener = None
+        self.startup_timings = {"init": time.perf_counter() - started}
+        self.warm_thread = None
+        # Tk runs after() callbacks from its main loop, i.e. once the window is up
+        if hasattr(gui, "after"):
+            gui.after(500, self.start_warm_up)
+
+    def __getattr__(self, name):
+        # Feature components (system, web, tools, tasks, modes) are built on first access
+        if name in ACTIONS.components:
+            return ACTIONS.load_component(name, self)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def start_warm_up(self):
+        """Initializes deferred subsystems on a background thread."""
+        if self.warm_thread is None:
+            self.warm_thread = threading.Thread(target=self.warm_up, name="veda-warm-up", daemon=True)
+            self.warm_thread.start()
+        return self.warm_thread
+
+    def warm_up(self):
+        """Imports and builds everything that was deferred at startup, recording how long each took."""
+        steps = [("llm", self.llm.warm_up), ("router", self.router.resolve), ("voice", self.voice.warm_up),
+                 ("history", self.memory.history.maintain), ("memories", self.llm.retriever.refresh)]
+        steps += [(name, lambda name=name: ACTIONS.load_component(name, self)) for name in ACTIONS.components]
+        steps += [(module, lambda module=module: importlib.import_module(module)) for module in WARM_IMPORTS]
+        for name, step in steps:
+            start = time.perf_counter()
+            try:
+                step()
+            except Exception as e:
+                # A missing optional dependency only matters when its feature is used
+                print(f"Warm-up of {name} skipped: {e}")
+                continue
+            self.startup_timings[name] = time.perf_counter() - start
+        return self.startup_timings
 
     def process_command(self, user_input):
         """Processes a user command, determines intent, and executes actions."""
+        with TRACER.turn(chars=len(user_input)) as turn:
+            self._process_command(user_input, turn)
+
+    def _process_command(self, user_input, turn):
         # Log to memory
-        self.memory.log_interaction("user", user_input)
+        with TRACER.span("memory.log"):
+            self.memory.log_interaction("user", user_input)
 
         # 1. Clean and Sanitize Input
-        cleaned_input = VedaSanitizer.clean_input(user_input)
+        with TRACER.span("sanitize"):
+            cleaned_input = VedaSanitizer.clean_input(user_input)
         if not cleaned_input:
             return
 
         # 2. Tactical Fast-Path (Survival Mode)
-        intent_data = self.planner.extract(cleaned_input)
+        tier = "fastpath"
+        with TRACER.span("fastpath"):
+            intent_data = self.planner.extract_plan(cleaned_input) or self.planner.extract(cleaned_input)
+
+        # 3. Previously resolved phrasings skip the model
+        if not intent_data:
+            tier = "intent_cache"
+            with TRACER.span("intent_cache"):
+                intent_data = self.intent_cache.get(cleaned_input)
 
-        # 3. Fallback to LLM for complex intent extraction
+        # 4. Semantic router: paraphrases of known commands, no model call
         if not intent_data:
-             intent_data = self.llm.extract_intent(cleaned_input)
+            tier = "router"
+            with TRACER.span("router"):
+                intent_data = self.router.route(cleaned_input)
 
+        # 5. Fallback to LLM for complex intent extraction
+        speculative = None
+        if not intent_data:
+            tier = "llm"
+            with self.scheduler.resource("llm"), TRACER.span("llm.intent", strategy=self.llm_strategy) as span:
+                if self.llm_strategy == "combined":
+                    intent_data = self.llm.extract_intent_and_reply(cleaned_input)
+                    kind = "combined"
+                else:
+                    if self.llm_strategy == "speculative":
+                        speculative = SpeculativeTurn(self.llm, cleaned_input).start()
+                    intent_data = self.llm.extract_intent(cleaned_input)
+                    kind = "intent"
+                span.set(prompt_tokens=self.llm.durations.get(kind, {}).get("prompt_eval_count"))
+                if intent_data.get("error"):
+                    span.set(error=intent_data["error"])
+
+        # The LLM's JSON is unchecked: anything but a string intent falls through to chat
         intent = intent_data.get("intent", "none")
+        intent = intent if isinstance(intent, str) else "none"
         params = intent_data.get("params", {})
+        params = params if isinstance(params, dict) else {}
+        turn.set(intent=intent, tier=tier)
 
         response = ""
         action_taken = False
 
-        # 4. Execute Feature based on Intent
-        if intent == "open_app":
-            app = params.get("app_name", "")
-            response = self.system.open_app(app)
-            action_taken = True
-        elif intent == "close_app":
-            app = params.get("app_name", "")
-            response = self.system.close_app(app)
-            action_taken = True
-        elif intent == "set_volume":
-            level = params.get("level", 50)
-            response = self.system.set_volume(level)
-            action_taken = True
-        elif intent == "set_brightness":
-            level = params.get("level", 50)
-            response = self.system.set_brightness(level)
-            action_taken = True
-        elif intent == "web_search":
-            query = params.get("query", cleaned_input)
-            response = self.web.search(query)
-            action_taken = True
-        elif intent == "weather":
-            city = params.get("city", "auto")
-            response = self.web.get_weather(city)
-            action_taken = True
-        elif intent == "screenshot":
-            response = self.system.screenshot()
-            action_taken = True
-        elif intent == "lock_pc":
-            response = self.system.lock_pc()
-            action_taken = True
-        elif intent == "time":
-            response = self.tools.get_time()
-            action_taken = True
-        elif intent == "date":
-            response = self.tools.get_date()
-            action_taken = True
-        elif intent == "note":
-            note_text = params.get("text", cleaned_input)
-            response = self.tools.take_note(note_text)
-            action_taken = True
-        elif intent == "find":
-            query = params.get("query", cleaned_input)
-            response = self.system.find(query)
-            action_taken = True
-        elif intent == "move":
-            source = params.get("source", "")
-            destination = params.get("destination", "")
-            response = self.system.move(source, destination)
-            action_taken = True
-        elif intent == "add_task":
-            task = params.get("task", cleaned_input)
-            response = self.tasks.add_task(task)
-            action_taken = True
-        elif intent == "list_tasks":
-            response = self.tasks.list_tasks()
-            action_taken = True
-        elif intent == "set_mode":
-            mode = params.get("mode", cleaned_input)
-            response = self.modes.set_mode(mode)
+        # 6. Execute Feature based on Intent (registry lookup; components load on first use)
+        action = ACTIONS.get(intent)
+        if action:
+            if speculative:
+                speculative.cancel()
+            with self.scheduler.resource(action.resource), TRACER.span("action", intent=intent):
+                response = ACTIONS.dispatch(self, action, params, cleaned_input)
             action_taken = True
 
-        # 5. If no specific action or we want a conversational response
+        # Cached only once the result has run without raising, so a bad one isn't replayed
+        if tier == "llm":
+            self.intent_cache.put(cleaned_input, intent_data)
+
+        # 7. If no specific action or we want a conversational response, stream it
         if not action_taken or "none" in intent:
-            response = self.llm.chat(cleaned_input)
+            if intent_data.get("reply"):
+                # The combined call already produced the reply
+                response = intent_data["reply"]
+                self.gui.update_chat("Veda", response)
+                with TRACER.span("speak", chars=len(response)):
+                    self.voice.speak_async(response)
+            else:
+                response = self.respond_streaming(cleaned_input, speculative.chunks() if speculative else None)
+        else:
+            # 8. Update UI and Speak (returns while audio is still playing)
+            self.gui.update_chat("Veda", response)
+            with TRACER.span("speak", chars=len(str(response))):
+                self.voice.speak_async(response)
 
         # Log assistant response
-        self.memory.log_interaction("assistant", response)
+        with TRACER.span("memory.log"):
+            self.memory.log_interaction("assistant", response)
 
-        # 6. Update UI and Speak
-        self.gui.update_chat("Veda", response)
-        self.voice.speak(response)
+    def respond_streaming(self, text, chunks=None):
+        """
+        Streams a conversational reply to the chat window and speech, sentence by sentence.
+        chunks is an already running generation (speculative turns); otherwise one is started.
+        """
+        # First audio usually starts after this returns, so it is attached to the turn's trace as its own record
+        trace = TRACER.current()
+        pipeline = StreamingPipeline(
+            on_token=lambda chunk: self.gui.update_chat("Veda", chunk, partial=True),
+            speak=self.voice.speak_stream,
+            on_first_audio=lambda metrics: TRACER.record(trace, "ttfa", metrics["ttfa"])
+        )
+        with self.scheduler.resource("llm"), TRACER.span("llm.chat") as span:
+            response = pipeline.run(chunks if chunks is not None else self.llm.chat_stream(text))
+            metrics = pipeline.metrics
+            span.set(prompt_tokens=self.llm.durations.get("chat", {}).get("prompt_eval_count"),
+                     ttft_ms=metrics["ttft"] * 1000 if metrics.get("ttft") is not None else None,
+                     sentences=metrics.get("sentences"))
+        self.gui.update_chat("Veda", "")
+        self.stream_metrics = pipeline.metrics
+        return response
 
     def listen_and_process(self):
         """Listens for voice input and processes it."""
-        query = self.voice.listen()
-        if query != "None":
-            self.gui.update_chat("You", query)
-            self.process_command(query)
+        with TRACER.turn("voice_turn"):
+            with self.scheduler.resource("audio"), TRACER.span("listen") as span:
+                query = self.voice.listen()
+                span.set(recognized=query != "None")
+            if query != "None":
+                self.gui.update_chat("You", query)
+                self.process_command(query)
         self.gui.reset_voice_button()
+
+    def start_wake_word(self, detector, source=None):
+        """
+        Starts always-on listening: when detector (see veda.core.wake_word)
+        fires, the listener pauses, a voice command is taken and processed,
+        and listening resumes afterwards.
+        """
+        from veda.core.wake_word import MicrophoneSource, WakeWordListener
+        self.wake_listener = WakeWordListener(source or MicrophoneSource(), detector, on_wake=self._on_wake)
+        return self.wake_listener.start()
+
+    def _on_wake(self):
+        future = self.scheduler.submit(self.listen_and_process)
+        if future is None:
+            self.wake_listener.resume()  # queue full: keep listening instead of going deaf
+        else:
+            future.add_done_callback(lambda _: self.wake_listener.resume())
+
+    def shutdown(self):
+        """Flushes queued interaction logs and stops speech before the app exits."""
+        if self.wake_listener is not None:
+            self.wake_listener.stop()
+        self.scheduler.shutdown()
+        if "plans" in self.__dict__:
+            self.plans.shutdown()
+        self.voice.shutdown()
+        self.memory.close()
+        if self.trace_sink is not None and TRACER.sink is self.trace_sink:
+            TRACER.disable()
@@ -0,0 +1,124 @@
+import collections
+import re
+
+def estimate_tokens(text):
+    """Cheap token estimate (~4 chars per token) used for budgeting without a tokenizer."""
+    return max(1, (len(text) + 3) // 4)
+
+class ConversationContext:
+    """
+    Token-budgeted chat history for VedaLLM.
+
+    Always keeps the system prompt plus a sliding window of the most recent
+    messages. Once the window no longer fits in max_tokens, the oldest turns
+    are evicted and folded into a compact rolling summary that is sent as a
+    second system message, itself capped at summary_tokens.
+    """
+
+    def __init__(self, system_prompt, max_tokens=2048, summary_tokens=256, max_messages=40, summarizer=None):
+        self.system_prompt = system_prompt
+        self.max_tokens = max_tokens
+        self.summary_tokens = summary_tokens
+        self.max_messages = max_messages
+        # Optional callable(old_summary, evicted_messages) -> new summary, e.g. an LLM call
+        self.summarizer = summarizer
+        self.summary = ""
+        self.turns = collections.deque()  # (message, tokens)
+        self.turn_tokens = 0
+        self.prompt_tokens = collections.deque(maxlen=500)
+        self.requests = 0
+        self.evicted_messages = 0
+
+    def add(self, role, content):
+        tokens = estimate_tokens(content) + 4  # role and framing overhead
+        self.turns.append(({"role": role, "content": content}, tokens))
+        self.turn_tokens += tokens
+        self._trim()
+
+    def discard_last(self, role, content):
+        """Drops the newest turn if it is this message (e.g. a request that was cancelled)."""
+        if self.turns and self.turns[-1][0] == {"role": role, "content": content}:
+            _, tokens = self.turns.pop()
+            self.turn_tokens -= tokens
+            return True
+        return False
+
+    def _system_tokens(self):
+        tokens = estimate_tokens(self.system_prompt) + 4
+        if self.summary:
+            tokens += estimate_tokens(self.summary) + 4
+        return tokens
+
+    def _trim(self):
+        evicted = []
+        # Keep at least the newest message, even if it alone exceeds the budget
+        while len(self.turns) > 1 and (
+            len(self.turns) > self.max_messages
+            or self._system_tokens() + self.turn_tokens > self.max_tokens
+        ):
+            message, tokens = self.turns.popleft()
+            self.turn_tokens -= tokens
+            evicted.append(message)
+            # Summaries grow with each eviction, so fold as we go to stay within budget
+            if len(evicted) >= 2 or self._system_tokens() + self.turn_tokens > self.max_tokens:
+                self._fold(evicted)
+                evicted = []
+        if evicted:
+            self._fold(evicted)
+
+    def _fold(self, messages):
+        self.evicted_messages += len(messages)
+        if self.summarizer:
+            try:
+                self.summary = self._cap(self.summarizer(self.summary, messages))
+                return
+            except Exception as e:
+                print(f"Context summarizer failed, using extractive summary: {e}")
+        notes = [f"{m['role']}: {self._gist(m['content'])}" for m in messages]
+        self.summary = self._cap("; ".join(filter(None, [self.summary] + notes)))
+
+    @staticmethod
+    def _gist(text, limit=120):
+        first = re.split(r"(?<=[.!?])\s", text.strip(), maxsplit=1)[0]
+        return first if len(first) <= limit else first[:limit - 3] + "..."
+
+    def _cap(self, summary):
+        # Drop the oldest notes first when the summary outgrows its budget
+        limit = self.summary_tokens * 4
+        if len(summary) <= limit:
+            return summary
+        return "..." + summary[-(limit - 3):]
+
+    def messages(self):
+        """Returns the message list to send for the next request."""
+        messages = [{"role": "system", "content": self.system_prompt}]
+        if self.summary:
+            messages.append({"role": "system", "content": f"Summary of earlier conversation: {self.summary}"})
+        messages.extend(message for message, _ in self.turns)
+        return messages
+
+    def record_request(self, estimated, actual=None):
+        """Records prompt tokens for one request (actual count from the model if reported)."""
+        self.requests += 1
+        self.prompt_tokens.append(actual if actual else estimated)
+
+    def prompt_token_estimate(self):
+        return self._system_tokens() + self.turn_tokens
+
+    def metrics(self):
+        recent = list(self.prompt_tokens)
+        return {
+            "requests": self.requests,
+            "last_prompt_tokens": recent[-1] if recent else 0,
+            "avg_prompt_tokens": sum(recent) / len(recent) if recent else 0,
+            "max_prompt_tokens": max(recent) if recent else 0,
+            "window_messages": len(self.turns),
+            "evicted_messages": self.evicted_messages,
+            "summary_tokens": estimate_tokens(self.summary) if self.summary else 0,
+            "budget_tokens": self.max_tokens,
+        }
+
+    def reset(self):
+        self.summary = ""
+        self.turns.clear()
+        self.turn_tokens = 0
@@ -0,0 +1,226 @@
+import datetime
+import gzip
+import json
+import os
+import threading
+import time
+from veda.core.schema import ensure_schema
+
+class InteractionHistory:
+    """
+    Read side of the interactions log: search and paging over past turns, plus retention.
+
+    Content is indexed with an FTS5 table kept in sync by triggers, and
+    timestamp / (role, timestamp) indexes serve the time and role queries.
+    Every query is keyset-paginated: it returns (rows, cursor) and the cursor
+    is passed back to fetch the next (older) page, so deep pages cost the
+    same as the first. compact() moves rows older than the retention window
+    into gzip-compressed JSON-lines segments, one per month.
+    """
+
+    COLUMNS = "id, role, content, timestamp"
+
+    def __init__(self, storage, archive_dir="veda_history_archive", retention_days=180, before_read=None):
+        self.storage = storage
+        self.archive_dir = archive_dir
+        self.retention_days = retention_days
+        # Called before every query (VedaMemory flushes its write-behind queue here)
+        self.before_read = before_read
+        self.lock = threading.Lock()
+        self._fts_built = False
+        self._init_db()
+
+    def _init_db(self):
+        ensure_schema(self.storage)
+        # The FTS table is missing when SQLite was built without FTS5: fall back to LIKE scans
+        self.fts = self.storage.query_one(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'interactions_fts'"
+        ) is not None
+
+    def _get_meta(self, key):
+        row = self.storage.query_one("SELECT value FROM history_meta WHERE key = ?", (key,))
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self.storage.execute("INSERT OR REPLACE INTO history_meta (key, value) VALUES (?, ?)", (key, value))
+
+    @property
+    def fts_ready(self):
+        """False while rows logged before the FTS index existed are not yet indexed."""
+        if self.fts and not self._fts_built:
+            self._fts_built = self._get_meta("fts_built") == "1"
+        return self._fts_built
+
+    def build_index(self):
+        """Indexes rows that predate the FTS table (once; slow on a large history)."""
+        if self.fts and not self.fts_ready:
+            self.storage.execute("INSERT INTO interactions_fts(interactions_fts) VALUES ('rebuild')")
+            self._set_meta("fts_built", "1")
+
+    def maintain(self):
+        """Background upkeep: finish the FTS backfill, then apply retention."""
+        self.build_index()
+        return self.compact()
+
+    def _rows(self, rows):
+        return [{"id": row[0], "role": row[1], "content": row[2], "timestamp": row[3]} for row in rows]
+
+    def _page(self, rows, limit):
+        rows = self._rows(rows)
+        cursor = (rows[-1]["timestamp"], rows[-1]["id"]) if len(rows) == limit else None
+        return rows, cursor
+
+    def _prepare(self):
+        if self.before_read:
+            self.before_read()
+
+    def search(self, text, limit=20, cursor=None, role=None):
+        """Turns containing all words of text, newest first."""
+        self._prepare()
+        words = text.split()
+        if not words:
+            return [], None
+        before = cursor[1] if cursor else None
+        if self.fts_ready:
+            match = " ".join('"' + word.replace('"', '""') + '"' for word in words)
+            # Filtering by role happens after the FTS lookup, so scan a few pages at a time
+            batch_size = limit if role is None else limit * 4
+            found = []
+            while len(found) < limit:
+                batch = self._fts_page(match, before, batch_size)
+                found += [row for row in batch if role is None or row[1] == role]
+                if len(batch) < batch_size:
+                    break
+                before = batch[-1][0]
+            return self._page(found[:limit], limit)
+
+        conditions = ["content LIKE ? ESCAPE '\\'"] * len(words)
+        params = ["%" + word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%" for word in words]
+        if role is not None:
+            conditions.append("role = ?")
+            params.append(role)
+        if before:
+            conditions.append("id < ?")
+            params.append(before)
+        rows = self.storage.query(
+            f"SELECT {self.COLUMNS} FROM interactions WHERE {' AND '.join(conditions)} ORDER BY id DESC LIMIT ?",
+            params + [limit]
+        )
+        return self._page(rows, limit)
+
+    def _fts_page(self, match, before, limit):
+        # rowid order is log order, and FTS5 walks it backwards without sorting the matches
+        inner = "SELECT rowid FROM interactions_fts WHERE interactions_fts MATCH ?"
+        params = [match]
+        if before:
+            inner += " AND rowid < ?"
+            params.append(before)
+        return self.storage.query(
+            f"SELECT {self.COLUMNS} FROM interactions WHERE id IN ({inner} ORDER BY rowid DESC LIMIT ?) "
+            "ORDER BY id DESC",
+            params + [limit]
+        )
+
+    def by_role(self, role, limit=20, cursor=None):
+        """Turns by one role ('user' / 'assistant'), newest first."""
+        self._prepare()
+        where, params = "role = ?", [role]
+        if cursor:
+            where += " AND (timestamp, id) < (?, ?)"
+            params += list(cursor)
+        rows = self.storage.query(
+            f"SELECT {self.COLUMNS} FROM interactions INDEXED BY idx_interactions_role "
+            f"WHERE {where} ORDER BY timestamp DESC, id DESC LIMIT ?",
+            params + [limit]
+        )
+        return self._page(rows, limit)
+
+    def by_time(self, start=None, end=None, limit=20, cursor=None):
+        """Turns with start <= timestamp < end (UTC 'YYYY-MM-DD HH:MM:SS' or datetime), newest first."""
+        self._prepare()
+        conditions, params = [], []
+        if start is not None:
+            conditions.append("timestamp >= ?")
+            params.append(self._stamp(start))
+        if end is not None:
+            conditions.append("timestamp < ?")
+            params.append(self._stamp(end))
+        if cursor:
+            conditions.append("(timestamp, id) < (?, ?)")
+            params += list(cursor)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self.storage.query(
+            f"SELECT {self.COLUMNS} FROM interactions INDEXED BY idx_interactions_timestamp "
+            f"{where} ORDER BY timestamp DESC, id DESC LIMIT ?",
+            params + [limit]
+        )
+        return self._page(rows, limit)
+
+    @staticmethod
+    def _stamp(value):
+        if isinstance(value, datetime.datetime):
+            if value.tzinfo is not None:
+                value = value.astimezone(datetime.timezone.utc)
+            return value.strftime("%Y-%m-%d %H:%M:%S")
+        return value
+
+    def compact(self, retention_days=None, batch_rows=50000):
+        """
+        Archives rows older than the retention window into monthly segments
+        (archive_dir/interactions-YYYY-MM.jsonl.gz) and deletes them from the
+        database. Each batch is written and synced before its rows are deleted.
+        """
+        retention_days = self.retention_days if retention_days is None else retention_days
+        if retention_days is None:
+            return {"archived": 0, "segments": []}
+        cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=retention_days)
+        cutoff = cutoff.strftime("%Y-%m-%d %H:%M:%S")
+        start = time.perf_counter()
+        archived = 0
+        segments = set()
+        with self.lock:
+            while True:
+                rows = self.storage.query(
+                    f"SELECT {self.COLUMNS} FROM interactions INDEXED BY idx_interactions_timestamp "
+                    "WHERE timestamp < ? ORDER BY timestamp, id LIMIT ?",
+                    (cutoff, batch_rows)
+                )
+                if not rows:
+                    break
+                by_month = {}
+                for row in rows:
+                    by_month.setdefault(str(row[3])[:7], []).append(row)
+                os.makedirs(self.archive_dir, exist_ok=True)
+                for month, month_rows in by_month.items():
+                    path = self.segment_path(month)
+                    # Appending adds a gzip member; readers see one continuous stream
+                    with open(path, "ab") as raw:
+                        with gzip.GzipFile(fileobj=raw, mode="wb") as segment:
+                            for row in self._rows(month_rows):
+                                segment.write((json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8"))
+                        raw.flush()
+                        os.fsync(raw.fileno())
+                    segments.add(path)
+                with self.storage.transaction() as conn:
+                    conn.executemany("DELETE FROM interactions WHERE id = ?", [(row[0],) for row in rows])
+                archived += len(rows)
+        return {"archived": archived, "segments": sorted(segments), "seconds": time.perf_counter() - start}
+
+    def segment_path(self, month):
+        return os.path.join(self.archive_dir, f"interactions-{month}.jsonl.gz")
+
+    def archived_months(self):
+        if not os.path.isdir(self.archive_dir):
+            return []
+        names = sorted(os.listdir(self.archive_dir))
+        return [name[len("interactions-"):-len(".jsonl.gz")] for name in names
+                if name.startswith("interactions-") and name.endswith(".jsonl.gz")]
+
+    def read_archive(self, month):
+        """Yields the archived rows of one month ('YYYY-MM')."""
+        path = self.segment_path(month)
+        if not os.path.exists(path):
+            return
+        with gzip.open(path, "rt", encoding="utf-8") as segment:
+            for line in segment:
+                yield json.loads(line)
@@ -0,0 +1,209 @@
+import collections
+import hashlib
+import json
+import re
+import threading
+import time
+from veda.core.matcher import CompiledIntentMatcher, literal_prefix
+from veda.core.schema import ensure_schema
+
+class IntentCache:
+    """
+    Cache of LLM intent extraction results, persisted in SQLite.
+
+    Keyed on the sanitized command text. A small in-memory LRU sits in front
+    of the table; entries expire after ttl seconds and the table is capped
+    at max_entries (least recently used rows go first). The whole cache is
+    dropped when the intent list (version) changes.
+
+    Each stored result is also turned into a template: the text becomes an
+    anchored regex with its param values turned into named groups. Once
+    promote_after separately resolved phrasings fit the same template with
+    the same intent and params (e.g. "open notepad", "open chrome", "open
+    paint"), and no cached phrasing that fits it disagrees, the template is
+    promoted to the fast-path, so the command (with any value) is matched
+    without reaching the model. Templates must start with literal text of
+    at least the matcher's KEY_SIZE, so a bare value like a whole search
+    query never becomes a catch-all.
+    """
+
+    def __init__(self, storage, version, ttl=7 * 24 * 3600, max_entries=5000,
+                 memory_entries=256, promote_after=3, on_promote=None):
+        self.storage = storage
+        self.version = hashlib.sha1(repr(version).encode("utf-8")).hexdigest()
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.promote_after = promote_after
+        self.on_promote = on_promote  # callable(intent, pattern)
+        self.memory = collections.OrderedDict()  # key -> [intent, params, hits, created_at]
+        self.lock = threading.Lock()
+        self.writes = 0
+        self._init_db()
+
+    def _init_db(self):
+        ensure_schema(self.storage)
+        row = self.storage.query_one("SELECT value FROM intent_cache_meta WHERE key = 'version'")
+        if not row or row[0] != self.version:
+            self.invalidate()
+
+    @staticmethod
+    def normalize(text):
+        return " ".join(text.lower().split())
+
+    def invalidate(self):
+        """Drops every cached result and learned template."""
+        with self.lock:
+            self.memory.clear()
+        self.storage.executescript('''
+            DELETE FROM intent_cache;
+            DELETE FROM fastpath_templates;
+        ''')
+        self.storage.execute(
+            "INSERT OR REPLACE INTO intent_cache_meta (key, value) VALUES ('version', ?)", (self.version,)
+        )
+
+    def templates(self):
+        """Returns the learned (intent, pattern) templates, oldest first; unanchored ones are dropped."""
+        rows = self.storage.query("SELECT intent, pattern FROM fastpath_templates ORDER BY created_at")
+        loose = [(pattern,) for _, pattern in rows if not self.is_anchored(pattern)]
+        if loose:
+            self.storage.executemany("DELETE FROM fastpath_templates WHERE pattern = ?", loose)
+        return [(intent, pattern) for intent, pattern in rows if self.is_anchored(pattern)]
+
+    def get(self, text):
+        """Returns the cached intent result for text, or None."""
+        key = self.normalize(text)
+        now = time.time()
+        with self.lock:
+            entry = self.memory.get(key)
+            if entry is not None:
+                self.memory.move_to_end(key)
+        if entry is None:
+            row = self.storage.query_one(
+                "SELECT intent, params, hits, created_at FROM intent_cache WHERE key = ?", (key,)
+            )
+            if row is None:
+                return None
+            entry = [row[0], json.loads(row[1]), row[2], row[3]]
+            with self.lock:
+                self._remember(key, entry)
+
+        if now - entry[3] > self.ttl:
+            with self.lock:
+                self.memory.pop(key, None)
+            self.storage.execute("DELETE FROM intent_cache WHERE key = ?", (key,))
+            return None
+
+        with self.lock:
+            entry[2] += 1
+            hits = entry[2]
+        self.storage.execute(
+            "UPDATE intent_cache SET hits = ?, last_used = ? WHERE key = ?", (hits, now, key)
+        )
+        return {"intent": entry[0], "params": dict(entry[1]), "confidence": 0.9, "source": "cache"}
+
+    def put(self, text, result):
+        """Caches a successful LLM extraction result."""
+        if not isinstance(result, dict) or result.get("error"):
+            return
+        intent = result.get("intent", "none")
+        params = result.get("params") or {}
+        if not isinstance(intent, str) or not isinstance(params, dict):
+            return
+        key = self.normalize(text)
+        now = time.time()
+        entry = [intent, params, 0, now]
+        with self.lock:
+            self._remember(key, entry)
+            self.writes += 1
+            trim = self.writes % 100 == 0
+        self.storage.execute(
+            "INSERT OR REPLACE INTO intent_cache (key, intent, params, hits, created_at, last_used) "
+            "VALUES (?, ?, ?, 0, ?, ?)",
+            (key, intent, json.dumps(params), now, now)
+        )
+        if trim:
+            self._trim()
+        self._promote(key, intent, params)
+
+    def _remember(self, key, entry):
+        self.memory[key] = entry
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def _trim(self):
+        self.storage.execute(
+            "DELETE FROM intent_cache WHERE key IN ("
+            " SELECT key FROM intent_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+
+    @staticmethod
+    def build_template(text, params):
+        """Turns a resolved phrasing into an anchored regex, or None if its params can't be located."""
+        spans = []
+        for name, value in sorted(params.items(), key=lambda item: -len(str(item[1]))):
+            if not isinstance(value, (str, int, float)) or not re.fullmatch(r"[A-Za-z_]\w*", name):
+                return None
+            value = str(value).lower().strip()
+            start = text.find(value) if value else -1
+            end = start + len(value)
+            if start < 0 or any(start < s_end and s_start < end for s_start, s_end, _, _ in spans):
+                return None
+            spans.append((start, end, name, r"\d+" if value.isdigit() else r".+?"))
+
+        pieces = []
+        pos = 0
+        for start, end, name, group in sorted(spans):
+            pieces.append(re.escape(text[pos:start]))
+            pieces.append(f"(?P<{name}>{group})")
+            pos = end
+        pieces.append(re.escape(text[pos:]))
+        return "^" + "".join(pieces) + "$"
+
+    @staticmethod
+    def is_anchored(pattern):
+        """True if every match of pattern starts with enough literal text to be a real phrasing."""
+        return len(literal_prefix(pattern).strip()) >= CompiledIntentMatcher.KEY_SIZE
+
+    def _promote(self, key, intent, params):
+        """Promotes key's template once promote_after cached phrasings agree on it."""
+        if intent == "none":
+            return
+        pattern = self.build_template(key, params)
+        if pattern is None or not self.is_anchored(pattern):
+            return
+        try:
+            compiled = re.compile(pattern)
+        except re.error:
+            return
+        if self.storage.query_one("SELECT 1 FROM fastpath_templates WHERE pattern = ?", (pattern,)):
+            return
+
+        # Every phrasing that fits the template starts with its literal prefix
+        prefix = literal_prefix(pattern)
+        rows = self.storage.query(
+            "SELECT key, intent, params FROM intent_cache WHERE substr(key, 1, ?) = ? AND created_at > ?",
+            (len(prefix), prefix, time.time() - self.ttl)
+        )
+        agreeing = 0
+        for other, other_intent, other_params in rows:
+            match = compiled.fullmatch(other)
+            if match is None:
+                continue
+            expected = {name: str(value).lower().strip() for name, value in json.loads(other_params).items()}
+            found = {name: value.strip() for name, value in match.groupdict().items()}
+            if other_intent != intent or found != expected:
+                return
+            agreeing += 1
+        if agreeing < self.promote_after:
+            return
+        cursor = self.storage.execute(
+            "INSERT OR IGNORE INTO fastpath_templates (pattern, intent, created_at) VALUES (?, ?, ?)",
+            (pattern, intent, time.time())
+        )
+        # Another thread may have promoted the same template in the meantime
+        if cursor.rowcount and self.on_promote:
+            self.on_promote(intent, pattern)
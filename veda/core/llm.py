@@ -1,9 +1,42 @@
-import ollama
 import json
+import threading
+from veda.core.actions import ACTIONS
+from veda.core.context import ConversationContext, estimate_tokens
+
+# Compound commands come back as one 'plan' intent; "after" lists the steps a step must wait for
+PLAN_HINT = (
+    "If the user asks for several actions at once, use intent 'plan' with params "
+    "{\"steps\": [{\"intent\": ..., \"params\": {...}, \"after\": [indexes of earlier steps it depends on]}]}."
+)
 
 class VedaLLM:
-    def __init__(self, model="llama3.2:3b"):
+    """
+    Chat and intent extraction against a local Ollama model.
+
+    All requests go through one ollama.Client, so its HTTP connection is
+    reused, and every request carries keep_alive so the model stays loaded
+    between turns. warm_up() loads the model ahead of the first request.
+    Ollama's load / prompt-eval / eval durations for the last request of each
+    kind are kept in self.durations.
+    """
+
+    # Intents extract_intent may return (from the action registry); also versions the intent cache
+    INTENTS = tuple(ACTIONS.intents()) + ("none",)
+
+    def __init__(self, model="llama3.2:3b", context_tokens=2048, host=None, keep_alive="30m",
+                 num_predict=256, intent_num_predict=160):
         self.model = model
+        self.host = host
+        self.keep_alive = keep_alive
+        # Both kinds of request share num_ctx: changing it between calls makes Ollama reload the model
+        num_ctx = context_tokens + num_predict
+        self.chat_options = {"num_ctx": num_ctx, "num_predict": num_predict}
+        self.intent_options = {"num_ctx": num_ctx, "num_predict": intent_num_predict, "temperature": 0}
+        self._client = None
+        self.client_lock = threading.Lock()
+        self.durations = {}
+        # Optional MemoryRetriever: relevant long-term memories are added to chat prompts
+        self.retriever = None
         self.system_prompt = (
             "You are Veda, an advanced AI assistant inspired by Jarvis and Friday from Marvel. "
             "You are professional, efficient, and slightly witty. You are running on Windows 11. "
@@ -11,26 +44,150 @@ class VedaLLM:
             "Keep your responses concise but helpful, as they will be spoken aloud. "
             "You have a female voice. If a user asks who you are, identify as Veda."
         )
-        self.messages = [
-            {"role": "system", "content": self.system_prompt}
-        ]
+        # Bounded history: system prompt + rolling summary + recent turns within the token budget
+        self.context = ConversationContext(self.system_prompt, max_tokens=context_tokens)
+
+    @property
+    def client(self):
+        """The shared Ollama client, created (and ollama imported) on first use."""
+        if self._client is None:
+            with self.client_lock:
+                if self._client is None:
+                    import ollama  # deferred: pulls in httpx, only needed once the model is called
+                    self._client = ollama.Client(host=self.host)
+        return self._client
+
+    def warm_up(self):
+        """Loads the model into memory without generating anything; returns its durations."""
+        try:
+            # Same num_ctx as real requests, or the first of them would load the model again
+            response = self.client.generate(
+                model=self.model, prompt="", keep_alive=self.keep_alive,
+                options={"num_ctx": self.chat_options["num_ctx"]}
+            )
+            return self._record("warm_up", response)
+        except Exception as e:
+            print(f"LLM warm-up failed: {e}")
+            return {}
+
+    def _record(self, kind, response):
+        """Keeps Ollama's timings (nanoseconds in the response) for the last request of a kind, in ms."""
+        timings = {}
+        for field in ("load_duration", "prompt_eval_duration", "eval_duration", "total_duration"):
+            value = response.get(field)
+            if value is not None:
+                timings[field.replace("duration", "ms")] = value / 1e6
+        for field in ("prompt_eval_count", "eval_count"):
+            if response.get(field) is not None:
+                timings[field] = response.get(field)
+        self.durations[kind] = timings
+        if timings.get("load_ms", 0) > 1000:
+            print(f"LLM {kind}: model load took {timings['load_ms']:.0f} ms")
+        return timings
+
+    @property
+    def messages(self):
+        """The message list the next chat request will send."""
+        return self.context.messages()
+
+    def prompt_snapshot(self):
+        """The chat history and its token estimate, for a stream started on another thread (see chat_stream)."""
+        return self.messages, self.context.prompt_token_estimate()
+
+    def _chat_messages(self, user_input, messages=None):
+        """The chat history (or the given messages) plus, after the system prompt, memories relevant to user_input."""
+        messages = self.messages if messages is None else list(messages)
+        if self.retriever is not None:
+            try:
+                memory = self.retriever.context_message(user_input)
+            except Exception as e:
+                print(f"Memory retrieval failed: {e}")
+                memory = None
+            if memory:
+                messages.insert(1, memory)
+        return messages
 
     def chat(self, user_input):
         """Generates a response from the LLM based on user input."""
-        self.messages.append({"role": "user", "content": user_input})
+        self.context.add("user", user_input)
 
         try:
-            response = ollama.chat(
+            response = self.client.chat(
                 model=self.model,
-                messages=self.messages
+                messages=self._chat_messages(user_input),
+                options=self.chat_options,
+                keep_alive=self.keep_alive
             )
+            self._record("chat", response)
+            self.context.record_request(self.context.prompt_token_estimate(), response.get('prompt_eval_count'))
             assistant_response = response['message']['content']
-            self.messages.append({"role": "assistant", "content": assistant_response})
+            self.context.add("assistant", assistant_response)
             return assistant_response
         except Exception as e:
             # Enhanced error handling for Ollama
             return f"Error connecting to Ollama: {str(e)}. I'm operating in Survival Mode for now."
 
+    def chat_stream(self, user_input, cancel=None, history=None, snapshot=None):
+        """
+        Like chat(), but yields the response in chunks as the model generates it.
+        Setting the optional cancel Event stops generation and takes the turn back out of the history.
+        If a history list is given, the turn's (role, content) messages go there instead of the
+        chat history, for callers that only keep the turn if it is used (see add_history). Such
+        callers usually run the stream on another thread: they pass a prompt_snapshot() taken while
+        holding the "llm" resource, so the stream never reads the chat history while it changes.
+        """
+        if history is None:
+            self.context.add("user", user_input)
+            messages = self._chat_messages(user_input)
+            estimated = self.context.prompt_token_estimate()
+        else:
+            base, estimated = snapshot if snapshot is not None else self.prompt_snapshot()
+            messages = self._chat_messages(user_input, base) + [{"role": "user", "content": user_input}]
+            estimated += estimate_tokens(user_input) + 4
+            history.append(("user", user_input))
+        parts = []
+
+        try:
+            stream = self.client.chat(
+                model=self.model,
+                messages=messages,
+                stream=True,
+                options=self.chat_options,
+                keep_alive=self.keep_alive
+            )
+            for chunk in stream:
+                if cancel is not None and cancel.is_set():
+                    # Closing the stream drops the HTTP response, which makes Ollama stop generating
+                    getattr(stream, "close", lambda: None)()
+                    if history is None:
+                        self.context.discard_last("user", user_input)
+                    else:
+                        history.clear()
+                    return
+                piece = chunk['message']['content']
+                if piece:
+                    parts.append(piece)
+                    yield piece
+                if chunk.get('done'):
+                    self._record("chat", chunk)
+                    self.context.record_request(estimated, chunk.get('prompt_eval_count'))
+        except Exception as e:
+            error = f"Error connecting to Ollama: {str(e)}. I'm operating in Survival Mode for now."
+            if not parts:
+                yield error
+                return
+            print(f"LLM stream interrupted: {e}")
+
+        if history is None:
+            self.context.add("assistant", "".join(parts))
+        else:
+            history.append(("assistant", "".join(parts)))
+
+    def add_history(self, messages):
+        """Adds (role, content) messages collected by chat_stream(history=...) to the chat history."""
+        for role, content in messages:
+            self.context.add(role, content)
+
     def extract_intent(self, user_input):
         """
         Extracts specific commands/intents from user input using the LLM.
@@ -39,16 +196,22 @@ class VedaLLM:
         intent_prompt = (
             "Analyze the following user input and determine if they want to perform a system action. "
             "Respond ONLY with a JSON object containing 'intent' and 'params'. "
-            "Possible intents: 'open_app', 'close_app', 'set_volume', 'set_brightness', 'web_search', 'weather', 'screenshot', 'lock_pc', 'time', 'date', 'note', 'find', 'move', 'none'. "
+            f"Possible intents: {ACTIONS.prompt_intents()}. "
+            f"{PLAN_HINT} "
             f"User input: \"{user_input}\""
         )
 
         try:
-            response = ollama.chat(
+            # Constrained output: JSON mode, greedy decoding and a small token cap
+            response = self.client.chat(
                 model=self.model,
                 messages=[{"role": "system", "content": "You are a command parser. Output only JSON."},
-                          {"role": "user", "content": intent_prompt}]
+                          {"role": "user", "content": intent_prompt}],
+                format="json",
+                options=self.intent_options,
+                keep_alive=self.keep_alive
             )
+            self._record("intent", response)
             # Try to parse the JSON response
             content = response['message']['content']
             # Find the first { and last } to handle any extra text
@@ -60,7 +223,48 @@ class VedaLLM:
         except Exception as e:
             # Added error handling to prevent crash when Ollama is down
             print(f"LLM Intent Extraction failed: {e}")
-            return {"intent": "none", "params": {}}
+            # 'error' marks the result as a failure so it is never cached
+            return {"intent": "none", "params": {}, "error": str(e)}
+
+    def extract_intent_and_reply(self, user_input):
+        """
+        One structured call that returns the intent, its params and a conversational
+        reply together, so a chat turn needs a single model round-trip.
+        The reply (under "reply") is only meant to be used when the intent is 'none'.
+        """
+        instruction = (
+            "Decide if the user wants to perform a system action and also reply to them. "
+            "Respond ONLY with a JSON object containing 'intent', 'params' and 'reply'. "
+            f"Possible intents: {ACTIONS.prompt_intents()}. "
+            f"{PLAN_HINT} "
+            f"User input: \"{user_input}\""
+        )
+        messages = self._chat_messages(user_input) + [{"role": "user", "content": instruction}]
+
+        try:
+            response = self.client.chat(
+                model=self.model,
+                messages=messages,
+                format="json",
+                options=self.chat_options,
+                keep_alive=self.keep_alive
+            )
+            self._record("combined", response)
+            result = json.loads(response['message']['content'])
+            if not isinstance(result, dict):
+                raise ValueError("model did not return a JSON object")
+            reply = str(result.get("reply") or "")
+            if result.get("intent", "none") == "none" and reply:
+                self.context.add("user", user_input)
+                self.context.add("assistant", reply)
+            return {"intent": result.get("intent", "none"), "params": result.get("params") or {}, "reply": reply}
+        except Exception as e:
+            print(f"LLM combined call failed: {e}")
+            return {"intent": "none", "params": {}, "error": str(e)}
 
     def reset_history(self):
-        self.messages = [{"role": "system", "content": self.system_prompt}]
+        self.context.reset()
+
+    def context_metrics(self):
+        """Prompt-size metrics for the chat history."""
+        return self.context.metrics()
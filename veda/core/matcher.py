@@ -0,0 +1,84 @@
+import re
+
+_META = set(".^$*+?{}[]|()")
+_QUANTIFIERS = set("*+?{")
+
+
+def literal_prefix(pattern):
+    """Returns the literal text every match of `pattern` must start with ('' if unknown)."""
+    if re.search(r"(?<!\\)\|", pattern):
+        return ""  # an alternation may start with any of its branches
+    prefix = []
+    i = 1 if pattern.startswith("^") else 0  # a start anchor doesn't change the prefix
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            nxt = pattern[i + 1:i + 2]
+            if not nxt or nxt.isalnum():
+                break  # \d, \w, \b ... are classes or assertions, not literals
+            char, step = nxt, 2
+        elif char in _META:
+            break
+        else:
+            step = 1
+        if pattern[i + step:i + step + 1] in _QUANTIFIERS:
+            break  # a quantified char may be absent or repeated
+        prefix.append(char)
+        i += step
+    return "".join(prefix)
+
+
+class CompiledIntentMatcher:
+    """
+    Matches text against many intent patterns without trying every pattern.
+
+    Patterns are declared per intent with named groups, e.g.
+    r"set volume to (?P<level>\\d+)"; the group names become the params.
+    Each pattern is compiled once and indexed by the first KEY_SIZE chars
+    of its literal prefix. A lookup only runs the patterns whose key occurs
+    in the text, in declaration order, so the first declared pattern that
+    matches still wins, exactly like the old re.search loop.
+    """
+
+    KEY_SIZE = 3
+
+    def __init__(self, patterns):
+        self.slots = []  # declaration order: (intent, compiled, literal prefix)
+        self.index = {}  # key -> [slot, ...]
+        self.unindexed = []  # slots whose literal prefix is too short to key on
+        for intent, intent_patterns in patterns.items():
+            for pattern in intent_patterns:
+                self.add(intent, pattern)
+
+    def add(self, intent, pattern):
+        """Appends a pattern; it ranks after every pattern added before it."""
+        slot = len(self.slots)
+        prefix = literal_prefix(pattern)
+        self.slots.append((intent, re.compile(pattern), prefix))
+        if len(prefix) >= self.KEY_SIZE:
+            self.index.setdefault(prefix[:self.KEY_SIZE], []).append(slot)
+        else:
+            self.unindexed.append(slot)
+
+    def candidates(self, text):
+        """Returns the slots that can possibly match `text`, in declaration order."""
+        found = set(self.unindexed)
+        size = self.KEY_SIZE
+        index = self.index
+        for i in range(len(text) - size + 1):
+            slots = index.get(text[i:i + size])
+            if slots:
+                found.update(slots)
+        return sorted(found)
+
+    def match(self, text):
+        """Returns (intent, params) for the first matching pattern, or None."""
+        for slot in self.candidates(text):
+            intent, compiled, prefix = self.slots[slot]
+            if prefix not in text:
+                continue
+            match = compiled.search(text)
+            if match:
+                params = {name: value.strip() for name, value in match.groupdict().items() if value is not None}
+                return intent, params
+        return None
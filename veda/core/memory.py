@@ -1,55 +1,160 @@
-import sqlite3
-import os
+import atexit
+import datetime
+import queue
 import threading
+import time
+from veda.core.storage import VedaStorage
+from veda.core.history import InteractionHistory
+from veda.core.schema import ensure_schema
+
+_FLUSH = object()
+_STOP = object()
+
+class InteractionLogger:
+    """
+    Write-behind logger for the interactions table.
+
+    log() only enqueues, so the caller never waits on disk. A background
+    writer drains the queue and inserts each batch with one executemany in
+    a single transaction, once batch_size rows are waiting or flush_interval
+    seconds have passed since the first one.
+    """
+
+    def __init__(self, storage, batch_size=64, flush_interval=0.5):
+        self.storage = storage
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, name="veda-log-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def log(self, role, content):
+        # Stamp at enqueue time so delayed writes keep the real order and time
+        timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        if self.closed:
+            self._write([(role, content, timestamp)])
+            return
+        self.queue.put((role, content, timestamp))
+
+    def flush(self, timeout=None):
+        """Blocks until everything logged so far is on disk."""
+        if self.closed:
+            return
+        self.queue.put(_FLUSH)
+        if timeout is None:
+            self.queue.join()
+            return
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+    def close(self):
+        """Flushes pending rows and stops the writer thread."""
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(_STOP)
+        self.thread.join()
+        atexit.unregister(self.close)
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            taken = 1
+            batch = []
+            stop = item is _STOP
+            if item is not _FLUSH and not stop:
+                batch.append(item)
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self.queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    taken += 1
+                    if item is _FLUSH:
+                        break
+                    if item is _STOP:
+                        stop = True
+                        break
+                    batch.append(item)
+            if stop:
+                # Drain whatever was queued before close() so nothing is lost
+                while True:
+                    try:
+                        item = self.queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    taken += 1
+                    if item is not _FLUSH and item is not _STOP:
+                        batch.append(item)
+
+            if batch:
+                self._write(batch)
+            for _ in range(taken):
+                self.queue.task_done()
+            if stop:
+                return
+
+    def _write(self, batch):
+        try:
+            self.storage.executemany(
+                "INSERT INTO interactions (role, content, timestamp) VALUES (?, ?, ?)", batch
+            )
+        except Exception as e:
+            print(f"Interaction log write failed ({len(batch)} rows dropped): {e}")
 
 class VedaMemory:
-    def __init__(self, db_path="veda_memory.db"):
+    """
+    The unified memory store: key/value memory, the interaction log, tasks,
+    long-term facts and episodes, and the intent cache all live in one
+    database, opened through the shared VedaStorage and kept at the current
+    schema version by ensure_schema().
+    """
+
+    def __init__(self, db_path="veda_memory.db", archive_dir="veda_history_archive", retention_days=180):
         self.db_path = db_path
-        self.lock = threading.Lock()
-        self._init_db()
-
-    def _init_db(self):
-        with self.lock:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS memory (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-            ''')
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS interactions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    role TEXT,
-                    content TEXT,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            conn.commit()
-            conn.close()
+        self.storage = VedaStorage.for_path(db_path)
+        ensure_schema(self.storage)
+        self.logger = InteractionLogger(self.storage)
+        # Searchable, paginated view of the log; queries first flush what is still queued
+        self.history = InteractionHistory(
+            self.storage, archive_dir=archive_dir, retention_days=retention_days, before_read=self.flush
+        )
 
     def set(self, key, value):
-        with self.lock:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("INSERT OR REPLACE INTO memory (key, value) VALUES (?, ?)", (key, value))
-            conn.commit()
-            conn.close()
+        self.storage.execute("INSERT OR REPLACE INTO memory (key, value) VALUES (?, ?)", (key, value))
 
     def get(self, key, default=None):
-        with self.lock:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT value FROM memory WHERE key = ?", (key,))
-            row = cursor.fetchone()
-            conn.close()
-            return row[0] if row else default
+        row = self.storage.query_one("SELECT value FROM memory WHERE key = ?", (key,))
+        return row[0] if row else default
+
+    def store_fact(self, fact):
+        self.storage.execute("INSERT INTO facts (fact) VALUES (?)", (fact,))
+
+    def store_episode(self, episode):
+        self.storage.execute("INSERT INTO episodes (episode) VALUES (?)", (episode,))
+
+    def fetch_facts(self, limit=100):
+        """Most recent facts first; use MemoryRetriever to find relevant ones."""
+        return self.storage.query("SELECT id, fact FROM facts ORDER BY id DESC LIMIT ?", (limit,))
+
+    def fetch_episodes(self, limit=100):
+        return self.storage.query("SELECT id, episode FROM episodes ORDER BY id DESC LIMIT ?", (limit,))
 
     def log_interaction(self, role, content):
-        with self.lock:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("INSERT INTO interactions (role, content) VALUES (?, ?)", (role, content))
-            conn.commit()
-            conn.close()
+        """Queues an interaction; it reaches disk in the next batch."""
+        self.logger.log(role, content)
+
+    def flush(self):
+        """Writes out any queued interactions."""
+        self.logger.flush()
+
+    def close(self):
+        """Flushes queued interactions and stops the background writer."""
+        self.logger.close()
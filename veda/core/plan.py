@@ -0,0 +1,200 @@
+import concurrent.futures
+import threading
+import time
+from veda.core.actions import ACTIONS
+from veda.core.tracing import TRACER
+
+class PlanStep:
+    """
+    One action of a plan: an intent from the action registry, its params,
+    the indexes of earlier steps it must wait for (`after`) and an optional
+    timeout in seconds. Plans are written as data, e.g.
+        {"intent": "open_app", "params": {"app_name": "notepad"}, "after": [0]}
+    """
+
+    def __init__(self, intent, params=None, after=(), timeout=None, text=""):
+        self.intent = intent
+        self.params = dict(params or {})
+        self.after = list(after)
+        self.timeout = timeout
+        self.text = text
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Builds a step from plan data, which may come straight from the LLM: a step
+        that isn't a dict gets intent "none" (reported as unknown), a malformed
+        params/after/timeout is dropped.
+        """
+        if not isinstance(data, dict):
+            return cls("none")
+        intent = data.get("intent")
+        params = data.get("params")
+        after = data.get("after")
+        timeout = data.get("timeout")
+        text = data.get("text")
+        if isinstance(after, int) and not isinstance(after, bool):
+            after = [after]
+        try:
+            timeout = float(timeout) if timeout is not None else None
+        except (TypeError, ValueError):
+            timeout = None
+        return cls(
+            intent if isinstance(intent, str) else "none",
+            params if isinstance(params, dict) else None,
+            [i for i in after if isinstance(i, int)] if isinstance(after, list) else (),
+            timeout if timeout is not None and timeout > 0 else None,
+            text if isinstance(text, str) else "",
+        )
+
+class StepResult:
+    def __init__(self, intent):
+        self.intent = intent
+        self.status = "pending"  # done, failed, timed out, skipped or unknown
+        self.response = None
+        self.error = None
+        self.seconds = 0.0
+
+    def problem(self):
+        """What to tell the user about a step that did not complete, or None."""
+        action = self.intent.replace("_", " ")
+        reasons = {
+            "failed": f"failed: {self.error}",
+            "timed out": "took too long",
+            "skipped": "was skipped because an earlier step did not complete",
+            "unknown": "is not something I can do",
+        }
+        reason = reasons.get(self.status)
+        if self.intent == "none" and reason:
+            return "One of the steps was not something I can do."
+        return f"The {action} step {reason}." if reason else None
+
+class PlanResult:
+    def __init__(self, steps, seconds):
+        self.steps = steps
+        self.seconds = seconds
+
+    @property
+    def ok(self):
+        return all(step.status == "done" for step in self.steps)
+
+    def problems(self):
+        return [problem for problem in (step.problem() for step in self.steps) if problem]
+
+    @property
+    def response(self):
+        """One spoken response: each completed step's reply in plan order, then what went wrong."""
+        done = [str(step.response).strip() for step in self.steps if step.status == "done" and step.response]
+        return " ".join(done + self.problems()) or "Done."
+
+class PlanExecutor:
+    """
+    Runs multi-step plans (compound commands, LLM plans, mode protocols).
+
+    Steps whose dependencies are complete run concurrently on a small worker
+    pool, each under its action's scheduler resource as in process_command.
+    Besides the explicit `after` indexes, a step waits for the previous step
+    on the same resource, so e.g. "close chrome then open chrome" keeps its
+    order. A step that runs past its timeout is reported as timed out and
+    its dependents are skipped; if it was still queued for its resource it
+    will not run at all.
+    """
+
+    def __init__(self, assistant, max_workers=4, step_timeout=15.0):
+        self.assistant = assistant
+        self.step_timeout = step_timeout
+        self.pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="veda-plan")
+
+    def run_steps(self, steps):
+        """Action handler for the 'plan' intent: runs the steps and returns the combined response."""
+        if not isinstance(steps, list) or not steps:
+            return "I couldn't work out the steps for that."
+        try:
+            return self.run(steps).response
+        except Exception as e:
+            print(f"Plan failed: {e}")
+            return "Sorry, I couldn't carry out that plan."
+
+    def run(self, steps):
+        start = time.perf_counter()
+        steps = [step if isinstance(step, PlanStep) else PlanStep.from_dict(step) for step in steps]
+        results = [StepResult(step.intent) for step in steps]
+        with TRACER.span("plan", steps=len(steps)):
+            self._execute(steps, results, TRACER.current())
+        return PlanResult(results, time.perf_counter() - start)
+
+    def _dependencies(self, steps, actions):
+        dependencies = []
+        last_on_resource = {}
+        for index, (step, action) in enumerate(zip(steps, actions)):
+            # Only earlier steps count, which also rules out cycles
+            needs = {i for i in step.after if isinstance(i, int) and 0 <= i < index}
+            if action is not None:
+                if action.resource in last_on_resource:
+                    needs.add(last_on_resource[action.resource])
+                last_on_resource[action.resource] = index
+            dependencies.append(needs)
+        return dependencies
+
+    def _execute(self, steps, results, trace):
+        # Plans don't nest: an inner plan would queue behind the outer one on the "plans" resource
+        actions = [ACTIONS.get(step.intent) if step.intent != "plan" else None for step in steps]
+        dependencies = self._dependencies(steps, actions)
+        for action, result in zip(actions, results):
+            if action is None:
+                result.status = "unknown"
+
+        waiting = {i for i, result in enumerate(results) if result.status == "pending"}
+        running = {}  # future -> (index, deadline, cancel event, started)
+        while waiting or running:
+            for index in sorted(waiting):
+                statuses = [results[i].status for i in dependencies[index]]
+                if any(status not in ("done", "pending") for status in statuses):
+                    results[index].status = "skipped"
+                    waiting.discard(index)
+                elif all(status == "done" for status in statuses):
+                    waiting.discard(index)
+                    step = steps[index]
+                    cancel = threading.Event()
+                    future = self.pool.submit(self._run_step, actions[index], step, cancel)
+                    timeout = step.timeout if step.timeout is not None else self.step_timeout
+                    started = time.perf_counter()
+                    running[future] = (index, started + timeout, cancel, started)
+            if not running:
+                # Everything left waits on a step that never completed
+                for index in waiting:
+                    results[index].status = "skipped"
+                break
+
+            now = time.perf_counter()
+            next_deadline = min(deadline for _, deadline, _, _ in running.values())
+            done, _ = concurrent.futures.wait(running, timeout=max(0.0, next_deadline - now),
+                                              return_when=concurrent.futures.FIRST_COMPLETED)
+            now = time.perf_counter()
+            for future in list(running):
+                index, deadline, cancel, started = running[future]
+                result = results[index]
+                if future in done:
+                    try:
+                        result.response = future.result()
+                        result.status = "done"
+                    except Exception as e:
+                        result.status = "failed"
+                        result.error = str(e)
+                elif now >= deadline:
+                    cancel.set()
+                    result.status = "timed out"
+                else:
+                    continue
+                result.seconds = now - started
+                del running[future]
+                TRACER.record(trace, "plan.step", result.seconds, intent=result.intent, status=result.status)
+
+    def _run_step(self, action, step, cancel):
+        with self.assistant.scheduler.resource(action.resource):
+            if cancel.is_set():
+                return None  # timed out while queued for the resource
+            return ACTIONS.dispatch(self.assistant, action, step.params, step.text)
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
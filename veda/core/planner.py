@@ -1,100 +1,52 @@
 import re
+from veda.core.actions import ACTIONS
+from veda.core.matcher import CompiledIntentMatcher
+from veda.utils.sanitizer import VedaSanitizer
+
+# Clause separators in compound commands; a "then" makes the clause wait for the one before it
+CLAUSE_SEPARATOR = re.compile(r"\s*[,;]\s*(?:and then\s+|and\s+|then\s+)?|\s+and then\s+|\s+then\s+|\s+and\s+")
 
 class TacticalFastPath:
-    def __init__(self):
-        # Define patterns for survival mode (instant extraction without LLM)
-        self.patterns = {
-            "set_volume": [
-                r"set volume to (\d+)",
-                r"volume (\d+)",
-                r"change volume to (\d+)"
-            ],
-            "set_brightness": [
-                r"set brightness to (\d+)",
-                r"brightness (\d+)"
-            ],
-            "open_app": [
-                r"open ([\w\s.-]+)",
-                r"launch ([\w\s.-]+)",
-                r"start ([\w\s.-]+)"
-            ],
-            "close_app": [
-                r"close ([\w\s.-]+)",
-                r"kill ([\w\s.-]+)",
-                r"stop ([\w\s.-]+)"
-            ],
-            "find": [
-                r"find ([\w\s.-]+)",
-                r"search for ([\w\s.-]+)",
-                r"where is ([\w\s.-]+)"
-            ],
-            "move": [
-                r"move ([\w\s./\\]+) to ([\w\s./\\]+)"
-            ],
-            "add_task": [
-                r"add ([\w\s.-]+) to my tasks",
-                r"remind me to ([\w\s.-]+)"
-            ],
-            "list_tasks": [
-                r"what are my tasks",
-                r"show my tasks",
-                r"list tasks"
-            ],
-            "set_mode": [
-                r"set mode to ([\w\s]+)",
-                r"switch to ([\w\s]+) mode",
-                r"engage ([\w\s]+) protocol"
-            ],
-            "time": [
-                r"what time",
-                r"current time",
-                r"the time"
-            ],
-            "date": [
-                r"what day",
-                r"what is the date",
-                r"today's date"
-            ],
-            "screenshot": [
-                r"take a screenshot",
-                r"screenshot"
-            ],
-            "lock_pc": [
-                r"lock my pc",
-                r"lock the computer",
-                r"lock pc"
-            ],
-            "weather": [
-                r"weather in ([\w\s]+)",
-                r"weather for ([\w\s]+)"
-            ]
-        }
+    def __init__(self, patterns=None):
+        # Patterns for survival mode (instant extraction without LLM), declared on each action
+        self.patterns = patterns if patterns is not None else ACTIONS.patterns()
+        # Named groups double as param names; all patterns compile into one indexed matcher
+        self.matcher = CompiledIntentMatcher(self.patterns)
+
+    def add_pattern(self, intent, pattern):
+        """Registers an extra pattern at runtime, e.g. a template learned from the LLM."""
+        self.patterns.setdefault(intent, []).append(pattern)
+        self.matcher.add(intent, pattern)
 
     def extract(self, text):
-        """Attempts to extract intent and params using regex."""
+        """Attempts to extract intent and params using the compiled matcher."""
         text = text.lower().strip()
 
-        for intent, patterns in self.patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, text)
-                if match:
-                    params = {}
-                    if intent == "set_volume" or intent == "set_brightness":
-                        params["level"] = match.group(1)
-                    elif intent == "open_app" or intent == "close_app":
-                        params["app_name"] = match.group(1).strip()
-                    elif intent == "find":
-                        params["query"] = match.group(1).strip()
-                    elif intent == "move":
-                        params["source"] = match.group(1).strip()
-                        params["destination"] = match.group(2).strip()
-                    elif intent == "add_task":
-                        params["task"] = match.group(1).strip()
-                    elif intent == "set_mode":
-                        params["mode"] = match.group(1).strip()
-                    elif intent == "weather":
-                        params["city"] = match.group(1).strip()
-
-                    return {"intent": intent, "params": params, "confidence": 1.0}
+        result = self.matcher.match(text)
+        if result:
+            intent, params = result
+            return {"intent": intent, "params": params, "confidence": 1.0}
 
         return None
+
+    def extract_plan(self, text):
+        """
+        Splits a compound command ("close chrome, set volume to 20 and open notepad")
+        into a 'plan' of steps. Only applies when every clause is itself a fast-path
+        command, so e.g. "remind me to buy milk and eggs" stays a single command.
+        """
+        text = text.lower().strip()
+        pieces = CLAUSE_SEPARATOR.split(text)
+        separators = CLAUSE_SEPARATOR.findall(text)
+        if len(pieces) < 2:
+            return None
+
+        steps = []
+        for index, piece in enumerate(pieces):
+            clause = VedaSanitizer.clean_input(piece)
+            result = self.extract(clause) if clause else None
+            if not result or result["intent"] == "plan":
+                return None
+            after = [index - 1] if index and "then" in separators[index - 1] else []
+            steps.append({"intent": result["intent"], "params": result["params"], "after": after, "text": clause})
+        return {"intent": "plan", "params": {"steps": steps}, "confidence": 1.0}
@@ -0,0 +1,221 @@
+import json
+import math
+import os
+import re
+import threading
+import zlib
+from veda.core.context import estimate_tokens
+from veda.core.schema import ensure_schema
+from veda.core.storage import VedaStorage
+
+try:
+    import numpy as np
+    NUMPY = True
+except ImportError:
+    NUMPY = False
+
+class MemoryRetriever:
+    """
+    Finds the long-term memories (the facts and episodes tables of the
+    memory store) most relevant to a message.
+
+    Each memory is embedded as a sparse hashed bag of words and character
+    4-grams (sublinear TF, L2-normalised); IDF weights are applied on the
+    query side, so new rows never require re-embedding old ones. The sparse
+    vectors are kept in append-only files next to the SQLite database
+    (<db>.indices, .weights, .ids and .json) and loaded into an in-memory
+    column index (postings per feature), so a query only touches the
+    postings of its own features. refresh() embeds just the rows added since
+    the last run and merges them into the index.
+    """
+
+    TABLES = (("facts", "fact"), ("episodes", "episode"))
+
+    def __init__(self, db_path="veda_memory.db", dims=1 << 18, top_k=5, min_score=0.12, max_tokens=200):
+        self.db_path = db_path
+        self.dims = dims
+        self.top_k = top_k
+        self.min_score = min_score
+        self.max_tokens = max_tokens
+        self.enabled = NUMPY
+        self.storage = VedaStorage.for_path(db_path)
+        self.lock = threading.Lock()
+        self.loaded = False
+        self.watermarks = {table: 0 for table, _ in self.TABLES}
+        ensure_schema(self.storage)
+
+    def _path(self, suffix):
+        return f"{self.db_path}.{suffix}"
+
+    def _features(self, text):
+        counts = {}
+        for word in re.findall(r"[a-z0-9']+", text.lower()):
+            padded = f" {word} "
+            grams = [padded[i:i + 4] for i in range(len(padded) - 3)]
+            grams.append(f"w:{word}")
+            for gram in grams:
+                index = zlib.crc32(gram.encode("utf-8")) % self.dims
+                counts[index] = counts.get(index, 0) + 1
+        return counts
+
+    def _embed(self, text):
+        """Returns the sparse vector of text as (feature indices, weights)."""
+        feats = self._features(text)
+        indices = np.fromiter(feats.keys(), dtype=np.uint32, count=len(feats))
+        weights = 1.0 + np.log(np.fromiter(feats.values(), dtype=np.float32, count=len(feats)))
+        if len(weights):
+            weights /= float(np.linalg.norm(weights))
+        return indices, weights
+
+    def _load(self):
+        keys = np.zeros((0, 3), dtype=np.int64)  # (table index, row id, feature count)
+        indices = np.zeros(0, dtype=np.uint32)
+        weights = np.zeros(0, dtype=np.float16)
+        meta_path = self._path("json")
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("dims") == self.dims:
+                count, nnz = meta["count"], meta["nnz"]
+                stored_keys = np.fromfile(self._path("ids"), dtype=np.int64)
+                stored_indices = np.fromfile(self._path("indices"), dtype=np.uint32)
+                stored_weights = np.fromfile(self._path("weights"), dtype=np.float16)
+                # Anything written after the last metadata update is dropped and re-embedded
+                if len(stored_keys) >= count * 3 and len(stored_indices) >= nnz and len(stored_weights) >= nnz:
+                    keys = stored_keys[:count * 3].reshape(count, 3)
+                    indices, weights = stored_indices[:nnz], stored_weights[:nnz]
+                    self.watermarks.update(meta["watermarks"])
+        self.keys = keys[:, :2].copy()
+        self.nnz = len(indices)
+        # Column index: for feature c, rows[col_ptr[c]:col_ptr[c + 1]] hold the memories using it
+        rows = np.repeat(np.arange(len(keys), dtype=np.int32), keys[:, 2])
+        order = np.argsort(indices, kind="stable")
+        self.rows = rows[order]
+        self.values = weights[order].astype(np.float32)
+        self.col_ptr = np.zeros(self.dims + 1, dtype=np.int64)
+        np.cumsum(np.bincount(indices, minlength=self.dims), out=self.col_ptr[1:])
+        # Cut off anything the metadata does not cover before appending to the files again
+        for suffix, size in (("ids", keys.nbytes), ("indices", indices.nbytes), ("weights", weights.nbytes)):
+            path = self._path(suffix)
+            if os.path.exists(path) and os.path.getsize(path) > size:
+                os.truncate(path, size)
+        self.loaded = True
+
+    def _persist(self, keys, indices, weights):
+        with open(self._path("ids"), "ab") as f:
+            keys.astype(np.int64).tofile(f)
+        with open(self._path("indices"), "ab") as f:
+            indices.astype(np.uint32).tofile(f)
+        with open(self._path("weights"), "ab") as f:
+            weights.astype(np.float16).tofile(f)
+        meta = {"dims": self.dims, "count": len(self.keys), "nnz": self.nnz, "watermarks": self.watermarks}
+        tmp_path = self._path("json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self._path("json"))
+
+    def _merge(self, new_keys, vectors):
+        """Adds embedded rows to the column index (appended at the end of each feature's postings)."""
+        first_row = len(self.keys)
+        cols = np.concatenate([indices for indices, _ in vectors])
+        values = np.concatenate([weights for _, weights in vectors])
+        rows = np.repeat(np.arange(first_row, first_row + len(vectors), dtype=np.int32),
+                         [len(indices) for indices, _ in vectors])
+        order = np.argsort(cols, kind="stable")
+        cols, rows, values = cols[order], rows[order], values[order]
+        positions = self.col_ptr[cols.astype(np.int64) + 1]
+        self.rows = np.insert(self.rows, positions, rows)
+        self.values = np.insert(self.values, positions, values)
+        self.col_ptr[1:] += np.cumsum(np.bincount(cols, minlength=self.dims))
+        self.keys = np.vstack([self.keys, new_keys[:, :2]])
+        self.nnz += len(cols)
+        return cols, values
+
+    def refresh(self):
+        """Embeds memories added since the last refresh; returns how many were added."""
+        if not self.enabled:
+            return 0
+        with self.lock:
+            if not self.loaded:
+                self._load()
+            vectors, keys = [], []
+            for table_index, (table, column) in enumerate(self.TABLES):
+                rows = self.storage.query(
+                    f"SELECT id, {column} FROM {table} WHERE id > ? ORDER BY id", (self.watermarks[table],)
+                )
+                for row_id, text in rows:
+                    vector = self._embed(text)
+                    vectors.append(vector)
+                    keys.append((table_index, row_id, len(vector[0])))
+                if rows:
+                    self.watermarks[table] = rows[-1][0]
+            if not vectors:
+                return 0
+            keys = np.array(keys, dtype=np.int64)
+            self._merge(keys, vectors)
+            self._persist(keys, np.concatenate([v[0] for v in vectors]), np.concatenate([v[1] for v in vectors]))
+            return len(keys)
+
+    def add_fact(self, fact):
+        self.storage.execute("INSERT INTO facts (fact) VALUES (?)", (fact,))
+        self.refresh()
+
+    def add_episode(self, episode):
+        self.storage.execute("INSERT INTO episodes (episode) VALUES (?)", (episode,))
+        self.refresh()
+
+    def search(self, text, k=None):
+        """Returns up to k (score, kind, text) memories relevant to text, best first."""
+        if not self.enabled:
+            return []
+        self.refresh()
+        k = k or self.top_k
+        feats = self._features(text)
+        with self.lock:
+            count = len(self.keys)
+            if not feats or not count:
+                return []
+            columns = np.fromiter(feats.keys(), dtype=np.int64, count=len(feats))
+            starts, ends = self.col_ptr[columns], self.col_ptr[columns + 1]
+            doc_freq = (ends - starts).astype(np.float32)
+            idf = np.log((1 + count) / (1 + doc_freq)) + 1.0
+            weights = (1.0 + np.log(np.fromiter(feats.values(), dtype=np.float32, count=len(feats)))) * idf
+            weights /= math.sqrt(float(weights @ weights))
+            # Only the postings of the query's own features are read
+            rows = np.concatenate([self.rows[s:e] for s, e in zip(starts, ends)])
+            contributions = np.concatenate([self.values[s:e] * w for s, e, w in zip(starts, ends, weights)])
+            keys = self.keys
+        scores = np.bincount(rows, weights=contributions, minlength=count)
+        if len(scores) > k:
+            top = np.argpartition(-scores, k)[:k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top])]
+        hits = [(float(scores[i]), int(keys[i][0]), int(keys[i][1])) for i in top if scores[i] >= self.min_score]
+        return self._texts(hits)
+
+    def _texts(self, hits):
+        found = {}
+        for table_index, (table, column) in enumerate(self.TABLES):
+            ids = [row_id for _, t, row_id in hits if t == table_index]
+            if ids:
+                placeholders = ",".join("?" * len(ids))
+                for row_id, text in self.storage.query(
+                    f"SELECT id, {column} FROM {table} WHERE id IN ({placeholders})", ids
+                ):
+                    found[(table_index, row_id)] = text
+        return [(score, self.TABLES[t][1], found[(t, row_id)]) for score, t, row_id in hits if (t, row_id) in found]
+
+    def context_message(self, text):
+        """A system message with the memories relevant to text (within max_tokens), or None."""
+        lines = []
+        used = 0
+        for _, kind, memory in self.search(text):
+            tokens = estimate_tokens(memory) + 2
+            if used + tokens > self.max_tokens:
+                break
+            lines.append(f"- {memory}")
+            used += tokens
+        if not lines:
+            return None
+        return {"role": "system", "content": "Relevant things you remember:\n" + "\n".join(lines)}
@@ -0,0 +1,150 @@
+import json
+import math
+import os
+import re
+import zlib
+
+try:
+    import numpy as np
+    NUMPY = True
+except ImportError:
+    NUMPY = False
+
+DEFAULT_EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "intent_examples.json")
+
+_UNITS = {
+    "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7,
+    "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12, "thirteen": 13,
+    "fourteen": 14, "fifteen": 15, "sixteen": 16, "seventeen": 17, "eighteen": 18, "nineteen": 19,
+}
+_TENS = {
+    "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50,
+    "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90,
+}
+_LEVEL_WORDS = {"mute": 0, "silent": 0, "max": 100, "maximum": 100, "full": 100, "half": 50}
+
+def parse_level(text):
+    """Finds a 0-100 level in text, in digits or words ("seventy five", "a hundred", "mute")."""
+    match = re.search(r"\b(\d{1,3})\b", text)
+    if match:
+        return min(int(match.group(1)), 100)
+    words = re.findall(r"[a-z]+", text)
+    for i, word in enumerate(words):
+        if word == "hundred":
+            return 100
+        if word in _TENS:
+            value = _TENS[word]
+            if i + 1 < len(words) and words[i + 1] in _UNITS and _UNITS[words[i + 1]] < 10:
+                value += _UNITS[words[i + 1]]
+            return value
+        if word in _UNITS and word != "one":
+            return _UNITS[word]
+    for word in words:
+        if word in _LEVEL_WORDS:
+            return _LEVEL_WORDS[word]
+    return None
+
+class SemanticRouter:
+    """
+    Middle routing tier between TacticalFastPath and the LLM.
+
+    Every labelled example utterance is embedded as a hashed bag of character
+    n-grams and words (TF-IDF weighted, L2-normalised). A command is routed to
+    the intent of its most similar example when the cosine similarity clears
+    `threshold` and beats the best other intent by `margin`; otherwise the
+    router abstains and the LLM decides. Intents with params are only routed
+    when the params can be filled in (see SLOTS).
+    """
+
+    # Param fillers for routable intents that take params
+    SLOTS = {
+        "set_volume": {"level": parse_level},
+        "set_brightness": {"level": parse_level},
+    }
+
+    def __init__(self, examples=None, threshold=0.45, margin=0.04, dims=4096):
+        self.threshold = threshold
+        self.margin = margin
+        self.dims = dims
+        self.enabled = NUMPY
+        if not self.enabled:
+            return
+        if examples is None:
+            with open(DEFAULT_EXAMPLES, "r", encoding="utf-8") as f:
+                examples = json.load(f)
+
+        self.labels = []
+        texts = []
+        for intent, utterances in examples.items():
+            for utterance in utterances:
+                self.labels.append(intent)
+                texts.append(utterance)
+        self.intents = sorted(set(self.labels))
+        self.label_ids = np.array([self.intents.index(label) for label in self.labels])
+
+        features = [self._features(text) for text in texts]
+        doc_freq = np.zeros(dims, dtype=np.float32)
+        for feats in features:
+            doc_freq[list(feats)] += 1
+        self.idf = np.log((1 + len(texts)) / (1 + doc_freq)).astype(np.float32) + 1.0
+
+        self.matrix = np.zeros((len(texts), dims), dtype=np.float32)
+        for row, feats in enumerate(features):
+            self.matrix[row] = self._dense(feats)
+
+    def _features(self, text):
+        """Hashed feature counts: char 3/4-grams of each word plus whole words."""
+        counts = {}
+        for word in re.findall(r"[a-z0-9']+", text.lower()):
+            padded = f" {word} "
+            grams = [padded[i:i + n] for n in (3, 4) for i in range(len(padded) - n + 1)]
+            grams.append(f"w:{word}")
+            for gram in grams:
+                index = zlib.crc32(gram.encode("utf-8")) % self.dims
+                counts[index] = counts.get(index, 0) + 1
+        return counts
+
+    def _dense(self, feats):
+        vector = np.zeros(self.dims, dtype=np.float32)
+        if feats:
+            indices = np.fromiter(feats.keys(), dtype=np.int64)
+            counts = np.fromiter(feats.values(), dtype=np.float32)
+            vector[indices] = (1.0 + np.log(counts)) * self.idf[indices]
+            norm = float(np.linalg.norm(vector))
+            if norm:
+                vector /= norm
+        return vector
+
+    def scores(self, text):
+        """Returns {intent: best cosine similarity} for text."""
+        feats = self._features(text)
+        if not feats:
+            return {}
+        indices = np.fromiter(feats.keys(), dtype=np.int64)
+        weights = (1.0 + np.log(np.fromiter(feats.values(), dtype=np.float32))) * self.idf[indices]
+        weights /= math.sqrt(float(weights @ weights))
+        # Only the query's non-zero columns contribute to the dot products
+        similarities = self.matrix[:, indices] @ weights
+        best = np.full(len(self.intents), -1.0, dtype=np.float32)
+        np.maximum.at(best, self.label_ids, similarities)
+        return dict(zip(self.intents, best.tolist()))
+
+    def route(self, text):
+        """Returns an intent result for confident matches, or None to defer to the LLM."""
+        if not self.enabled:
+            return None
+        ranked = sorted(self.scores(text).items(), key=lambda item: -item[1])
+        if not ranked:
+            return None
+        intent, score = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        if score < self.threshold or score - runner_up < self.margin:
+            return None
+
+        params = {}
+        for name, fill in self.SLOTS.get(intent, {}).items():
+            value = fill(text)
+            if value is None:
+                return None
+            params[name] = value
+        return {"intent": intent, "params": params, "confidence": round(score, 3), "source": "semantic"}
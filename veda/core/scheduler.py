@@ -0,0 +1,158 @@
+import collections
+import concurrent.futures
+import contextlib
+import threading
+import time
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+class FairLock:
+    """FIFO lock: waiters acquire in arrival order, so a resource behaves like a queue."""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.next_ticket = 0
+        self.serving = 0
+
+    def acquire(self):
+        with self.condition:
+            ticket = self.next_ticket
+            self.next_ticket += 1
+            while self.serving != ticket:
+                self.condition.wait()
+
+    def release(self):
+        with self.condition:
+            self.serving += 1
+            self.condition.notify_all()
+
+    def waiting(self):
+        with self.condition:
+            return max(0, self.next_ticket - self.serving - 1)
+
+class CommandScheduler:
+    """
+    Runs user commands on a bounded worker pool.
+
+    Commands run in parallel, but each shared subsystem is guarded by a FIFO
+    resource lock ("llm", "audio", "system", ...) taken with resource(), so
+    conflicting stages of different commands are serialized while unrelated
+    stages overlap. submit() applies backpressure once max_pending commands
+    are queued or running, and a command that waited longer than stale_after
+    seconds is dropped instead of run (its on_drop callback, if any, is
+    called instead so the caller can tell the user).
+    """
+
+    def __init__(self, max_workers=4, max_pending=16, stale_after=30.0):
+        self.max_pending = max_pending
+        self.stale_after = stale_after
+        self.pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="veda-command")
+        self.lock = threading.Lock()
+        self.resources = {}
+        self.pending = set()
+        self.running = 0
+        self.counts = collections.Counter()
+        self.wait_ms = collections.deque(maxlen=1000)
+        self.run_ms = collections.deque(maxlen=1000)
+        self.resource_wait_ms = collections.defaultdict(lambda: collections.deque(maxlen=1000))
+        self.resource_hold_ms = collections.defaultdict(lambda: collections.deque(maxlen=1000))
+
+    def submit(self, fn, *args, on_drop=None, **kwargs):
+        """
+        Queues fn(*args, **kwargs); returns a Future, or None if the queue is full.
+        on_drop() runs on the worker thread if the command goes stale before it starts.
+        """
+        with self.lock:
+            if len(self.pending) >= self.max_pending:
+                self.counts["rejected"] += 1
+                return None
+            self.counts["submitted"] += 1
+            queued_at = time.perf_counter()
+            future = self.pool.submit(self._run, queued_at, fn, args, kwargs, on_drop)
+            self.pending.add(future)
+        future.add_done_callback(self._finished)
+        return future
+
+    def _run(self, queued_at, fn, args, kwargs, on_drop):
+        waited = time.perf_counter() - queued_at
+        with self.lock:
+            self.wait_ms.append(waited * 1000)
+            stale = waited > self.stale_after
+            if stale:
+                self.counts["stale"] += 1
+            else:
+                self.running += 1
+        if stale:
+            if on_drop is not None:
+                on_drop()
+            return None
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self.lock:
+                self.running -= 1
+                self.run_ms.append((time.perf_counter() - start) * 1000)
+
+    def _finished(self, future):
+        with self.lock:
+            self.pending.discard(future)
+            if future.cancelled():
+                self.counts["cancelled"] += 1
+            elif future.exception() is not None:
+                self.counts["failed"] += 1
+                print(f"Command failed: {future.exception()}")
+            else:
+                self.counts["completed"] += 1
+
+    def cancel_pending(self):
+        """Cancels every command that has not started yet; returns how many were dropped."""
+        with self.lock:
+            pending = list(self.pending)
+        return sum(1 for future in pending if future.cancel())
+
+    @contextlib.contextmanager
+    def resource(self, name):
+        """Holds the named resource for the duration of the block (FIFO among waiters)."""
+        with self.lock:
+            lock = self.resources.setdefault(name, FairLock())
+        start = time.perf_counter()
+        lock.acquire()
+        acquired = time.perf_counter()
+        try:
+            yield
+        finally:
+            lock.release()
+            with self.lock:
+                self.resource_wait_ms[name].append((acquired - start) * 1000)
+                self.resource_hold_ms[name].append((time.perf_counter() - acquired) * 1000)
+
+    def metrics(self):
+        with self.lock:
+            queued = len(self.pending) - self.running
+            resources = {
+                name: {
+                    "waiting": lock.waiting(),
+                    "wait_ms_p95": _percentile(self.resource_wait_ms[name], 0.95),
+                    "hold_ms_p95": _percentile(self.resource_hold_ms[name], 0.95),
+                }
+                for name, lock in self.resources.items()
+            }
+            return {
+                "queue_depth": queued,
+                "running": self.running,
+                **dict(self.counts),
+                "wait_ms_p50": _percentile(self.wait_ms, 0.5),
+                "wait_ms_p95": _percentile(self.wait_ms, 0.95),
+                "run_ms_p50": _percentile(self.run_ms, 0.5),
+                "run_ms_p95": _percentile(self.run_ms, 0.95),
+                "resources": resources,
+            }
+
+    def shutdown(self, wait=False):
+        self.cancel_pending()
+        self.pool.shutdown(wait=wait)
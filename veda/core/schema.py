@@ -0,0 +1,108 @@
+import sqlite3
+
+# Versioned schema of the unified memory store (veda_memory.db).
+#
+# Each migration runs once, in order, inside one transaction that also bumps
+# PRAGMA user_version. Never edit a released migration: append a new one.
+# Version 1-4 use IF NOT EXISTS so databases created before versioning are
+# adopted as they are.
+
+def _history_fts(conn):
+    existed = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'interactions_fts'"
+    ).fetchone()
+    try:
+        conn.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS interactions_fts USING fts5(
+                content, content='interactions', content_rowid='id'
+            )
+        ''')
+    except sqlite3.OperationalError:
+        return  # SQLite without FTS5: InteractionHistory falls back to LIKE scans
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS interactions_ai AFTER INSERT ON interactions BEGIN
+            INSERT INTO interactions_fts(rowid, content) VALUES (new.id, new.content);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS interactions_ad AFTER DELETE ON interactions BEGIN
+            INSERT INTO interactions_fts(interactions_fts, rowid, content) VALUES ('delete', old.id, old.content);
+        END
+    ''')
+    if not existed and not conn.execute("SELECT 1 FROM interactions LIMIT 1").fetchone():
+        # Nothing to backfill; otherwise InteractionHistory.build_index() does it in the background
+        conn.execute("INSERT OR REPLACE INTO history_meta (key, value) VALUES ('fts_built', '1')")
+
+MIGRATIONS = [
+    (1, "core tables", '''
+        CREATE TABLE IF NOT EXISTS memory (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+        CREATE TABLE IF NOT EXISTS interactions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            role TEXT,
+            content TEXT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            task TEXT,
+            status TEXT DEFAULT 'pending',
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        );
+    '''),
+    (2, "long-term memory (from the veda2.0 MemoryManager)", '''
+        CREATE TABLE IF NOT EXISTS facts (
+            id INTEGER PRIMARY KEY,
+            fact TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS episodes (
+            id INTEGER PRIMARY KEY,
+            episode TEXT NOT NULL
+        );
+    '''),
+    (3, "intent cache", '''
+        CREATE TABLE IF NOT EXISTS intent_cache (
+            key TEXT PRIMARY KEY,
+            intent TEXT,
+            params TEXT,
+            hits INTEGER DEFAULT 0,
+            created_at REAL,
+            last_used REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_intent_cache_last_used ON intent_cache(last_used);
+        CREATE TABLE IF NOT EXISTS fastpath_templates (
+            pattern TEXT PRIMARY KEY,
+            intent TEXT,
+            created_at REAL
+        );
+        CREATE TABLE IF NOT EXISTS intent_cache_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    '''),
+    (4, "history indexes", '''
+        CREATE INDEX IF NOT EXISTS idx_interactions_timestamp ON interactions(timestamp);
+        CREATE INDEX IF NOT EXISTS idx_interactions_role ON interactions(role, timestamp);
+        CREATE TABLE IF NOT EXISTS history_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    '''),
+    (5, "history full-text index", _history_fts),
+    (6, "import log", '''
+        CREATE TABLE IF NOT EXISTS imported_sources (
+            path TEXT PRIMARY KEY,
+            kind TEXT,
+            rows INTEGER,
+            imported_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        );
+    '''),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+def ensure_schema(storage):
+    """Brings the database behind storage up to SCHEMA_VERSION (cheap once it is)."""
+    return storage.migrate(MIGRATIONS)
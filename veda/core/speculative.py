@@ -0,0 +1,59 @@
+import queue
+import threading
+
+class SpeculativeTurn:
+    """
+    Starts generating the chat reply for a turn while its intent is still
+    being extracted.
+
+    start() streams llm.chat_stream(text) into a buffer on a background
+    thread. If the intent turns out to be 'none', chunks() hands the buffered
+    and remaining tokens to the streaming pipeline, so the reply no longer
+    waits for a second model round-trip. If it is an action, cancel() stops the
+    generation. The turn only enters the chat history once chunks() has been
+    consumed (under the caller's "llm" resource), so a cancelled reply leaves
+    no trace however far the worker got, and the turn lands in order with
+    other commands' turns.
+    (Ollama only runs both requests at once when OLLAMA_NUM_PARALLEL allows it;
+    otherwise the two requests queue up and it behaves like the serial path.)
+    """
+
+    _DONE = object()
+
+    def __init__(self, llm, text):
+        self.llm = llm
+        self.text = text
+        self.buffer = queue.Queue()
+        self.cancelled = threading.Event()
+        self.history = []  # the turn's messages, written by the worker before _DONE
+        self.snapshot = None
+        self.thread = None
+
+    def start(self):
+        """Call while holding the "llm" resource: the prompt is taken from the chat history here, not on the worker."""
+        self.snapshot = self.llm.prompt_snapshot()
+        self.thread = threading.Thread(target=self._generate, name="veda-speculative-chat", daemon=True)
+        self.thread.start()
+        return self
+
+    def _generate(self):
+        try:
+            for chunk in self.llm.chat_stream(self.text, cancel=self.cancelled, history=self.history,
+                                              snapshot=self.snapshot):
+                self.buffer.put(chunk)
+        finally:
+            self.buffer.put(self._DONE)
+
+    def chunks(self):
+        """Yields the reply's chunks: whatever was buffered first, then live ones."""
+        while True:
+            chunk = self.buffer.get()
+            if chunk is self._DONE:
+                if not self.cancelled.is_set():
+                    self.llm.add_history(self.history)
+                return
+            yield chunk
+
+    def cancel(self):
+        """Stops the speculative reply (the worker exits at its next chunk) and drops its turn."""
+        self.cancelled.set()
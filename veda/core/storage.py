@@ -0,0 +1,166 @@
+import contextlib
+import sqlite3
+import threading
+
+
+def _statements(script):
+    """Splits an SQL script into complete statements (trigger bodies stay whole)."""
+    statement = ""
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            yield statement.strip()
+            statement = ""
+    if statement.strip():
+        yield statement.strip()
+
+
+class VedaStorage:
+    """
+    Shared SQLite access layer.
+
+    One instance exists per database file and hands every thread its own
+    long-lived connection, so callers no longer pay for a connect/close on
+    each query. Connections run in WAL mode with tuned pragmas, and since
+    they stay open, sqlite3's per-connection statement cache keeps the
+    prepared statements around between calls. Connections of threads that
+    have exited (e.g. one per speculative turn) are closed when the next
+    connection is opened, so they do not pile up over a long session.
+    """
+
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-8000",
+        "PRAGMA busy_timeout=5000",
+    )
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def for_path(cls, db_path):
+        """Returns the shared storage for a database file."""
+        with cls._instances_lock:
+            storage = cls._instances.get(db_path)
+            if storage is None:
+                storage = cls(db_path)
+                cls._instances[db_path] = storage
+            return storage
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.local = threading.local()
+        self.write_lock = threading.Lock()
+        self.connections = []  # (owning thread, connection)
+        self.connections_lock = threading.Lock()
+        self.schema_version = None
+
+    def connection(self):
+        """Returns this thread's connection, opening it on first use."""
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+            for pragma in self.PRAGMAS:
+                conn.execute(pragma)
+            self.local.conn = conn
+            with self.connections_lock:
+                self._close_orphans()
+                self.connections.append((threading.current_thread(), conn))
+        return conn
+
+    def _close_orphans(self):
+        """Closes the connections of threads that have exited (caller holds connections_lock)."""
+        alive = []
+        for thread, conn in self.connections:
+            if thread.is_alive():
+                alive.append((thread, conn))
+                continue
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self.connections = alive
+
+    def query(self, sql, params=()):
+        """Runs a read query and returns all rows."""
+        return self.connection().execute(sql, params).fetchall()
+
+    def query_one(self, sql, params=()):
+        """Runs a read query and returns the first row, or None."""
+        return self.connection().execute(sql, params).fetchone()
+
+    def execute(self, sql, params=()):
+        """Runs a single write in its own transaction and returns the cursor."""
+        conn = self.connection()
+        with self.write_lock, conn:
+            return conn.execute(sql, params)
+
+    def executemany(self, sql, rows):
+        """Runs a batch of writes in one transaction."""
+        conn = self.connection()
+        with self.write_lock, conn:
+            return conn.executemany(sql, rows)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Yields this thread's connection inside one write transaction."""
+        conn = self.connection()
+        with self.write_lock, conn:
+            yield conn
+
+    def executescript(self, script):
+        """Runs schema/DDL statements."""
+        conn = self.connection()
+        with self.write_lock, conn:
+            conn.executescript(script)
+
+    def migrate(self, migrations):
+        """
+        Applies the (version, name, step) migrations newer than the database's
+        PRAGMA user_version, in order. step is an SQL script or a callable
+        taking the connection; each runs in its own transaction together with
+        the version bump, so a failed migration leaves the previous version.
+        """
+        target = migrations[-1][0] if migrations else 0
+        if self.schema_version == target:
+            return target
+        conn = self.connection()
+        with self.write_lock:
+            # IMMEDIATE takes the write lock up front, so two processes cannot both apply a step
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                current = conn.execute("PRAGMA user_version").fetchone()[0]
+                for version, name, step in migrations:
+                    if version <= current:
+                        continue
+                    if callable(step):
+                        step(conn)
+                    else:
+                        for statement in _statements(step):
+                            conn.execute(statement)
+                    conn.execute(f"PRAGMA user_version = {int(version)}")
+                    conn.commit()
+                    current = version
+                    conn.execute("BEGIN IMMEDIATE")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        self.schema_version = current
+        return current
+
+    def close(self):
+        """Closes every connection opened through this storage."""
+        with self.connections_lock:
+            for _, conn in self.connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self.connections.clear()
+        self.local = threading.local()
+        with self._instances_lock:
+            if self._instances.get(self.db_path) is self:
+                del self._instances[self.db_path]
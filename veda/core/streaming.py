@@ -0,0 +1,94 @@
+import queue
+import re
+import threading
+import time
+
+class SentenceSplitter:
+    """Accumulates streamed text and releases it one complete sentence at a time."""
+
+    BOUNDARY = re.compile(r"(?<=[.!?;:])[\"')\]]*\s+|\n+")
+
+    def __init__(self, min_chars=12):
+        # Very short fragments ("Hi.", "1.") are held back and merged into the next sentence
+        self.min_chars = min_chars
+        self.buffer = ""
+
+    def feed(self, chunk):
+        self.buffer += chunk
+        sentences = []
+        start = 0
+        for match in self.BOUNDARY.finditer(self.buffer):
+            sentence = self.buffer[start:match.end()].strip()
+            if len(sentence) >= self.min_chars:
+                sentences.append(sentence)
+                start = match.end()
+        self.buffer = self.buffer[start:]
+        return sentences
+
+    def flush(self):
+        rest = self.buffer.strip()
+        self.buffer = ""
+        return [rest] if rest else []
+
+class StreamingPipeline:
+    """
+    Pipes a streamed LLM reply to the UI and to speech as it is generated.
+
+    Tokens are handed to on_token as they arrive. Completed sentences go on a
+    queue consumed by speak(sentences, on_first_audio) in a separate thread,
+    so the first sentence is being synthesized and played while later ones
+    are still generating. Time-to-first-token and time-to-first-audio are
+    recorded in `metrics`.
+    """
+
+    def __init__(self, on_token=None, speak=None, splitter=None, on_first_audio=None):
+        self.on_token = on_token
+        self.speak = speak
+        # Called with the metrics dict once audio starts; speak() may return before playback ends
+        self.on_first_audio = on_first_audio
+        self.splitter = splitter or SentenceSplitter()
+        self.metrics = {}
+
+    def run(self, chunks):
+        """Consumes the chunk iterator, waits for speak() to return and returns the full text."""
+        start = time.perf_counter()
+        self.metrics = {"ttft": None, "ttfa": None, "sentences": 0}
+        sentences = queue.Queue()
+        speaker = None
+
+        def first_audio():
+            if self.metrics["ttfa"] is None:
+                self.metrics["ttfa"] = time.perf_counter() - start
+                if self.on_first_audio:
+                    self.on_first_audio(self.metrics)
+
+        if self.speak:
+            speaker = threading.Thread(
+                target=self.speak, args=(iter(sentences.get, None), first_audio),
+                name="veda-stream-speaker", daemon=True
+            )
+            speaker.start()
+
+        parts = []
+        try:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                if self.metrics["ttft"] is None:
+                    self.metrics["ttft"] = time.perf_counter() - start
+                parts.append(chunk)
+                if self.on_token:
+                    self.on_token(chunk)
+                for sentence in self.splitter.feed(chunk):
+                    self.metrics["sentences"] += 1
+                    sentences.put(sentence)
+            for sentence in self.splitter.flush():
+                self.metrics["sentences"] += 1
+                sentences.put(sentence)
+        finally:
+            self.metrics["generation"] = time.perf_counter() - start
+            sentences.put(None)
+            if speaker:
+                speaker.join()
+            self.metrics["total"] = time.perf_counter() - start
+        return "".join(parts)
@@ -0,0 +1,363 @@
+import argparse
+import atexit
+import collections
+import functools
+import itertools
+import json
+import math
+import os
+import threading
+import time
+from json.encoder import encode_basestring_ascii
+
+# Compact output and no circular-reference check: traces are plain trees of dicts and lists
+_ENCODER = json.JSONEncoder(default=str, check_circular=False, separators=(",", ":"))
+_SPAN_JSON = '{"name":%s,"parent":%d,"at_ms":%.3f,"ms":%.3f%s}'
+_TRACE_JSON = '{"trace":%s,"ts":%.3f,"name":%s,"ms":%.3f,"attrs":%s,"spans":[%s]}'
+
+@functools.lru_cache(maxsize=256)
+def _name_json(name):
+    # Span names and attribute keys come from a small fixed set, so their encoding is cached
+    return _ENCODER.encode(name)
+
+def _attrs_json(attrs):
+    """Encodes span attributes; flat scalar ones (nearly all of them) without going through the encoder."""
+    parts = []
+    for key, value in attrs.items():
+        kind = value.__class__
+        if key.__class__ is not str:
+            return _ENCODER.encode(attrs)
+        if kind is str:
+            value = encode_basestring_ascii(value)
+        elif kind is int or (kind is float and math.isfinite(value)):
+            value = repr(value)
+        elif value is None:
+            value = "null"
+        elif kind is bool:
+            value = "true" if value else "false"
+        else:
+            return _ENCODER.encode(attrs)
+        parts.append(f"{_name_json(key)}:{value}")
+    return "{" + ",".join(parts) + "}"
+
+class Span:
+    """
+    One timed stage. The outermost span of a thread is the trace (a turn);
+    spans opened inside it nest under whichever span is current. Attributes
+    are set at creation or later with set(); an exception leaving the span is
+    recorded under "error" and re-raised.
+
+    A finished inner span is kept in its trace as a plain (name, parent,
+    start, end, attrs) tuple rather than as itself, so a trace waiting for
+    the writer holds no objects the garbage collector has to keep scanning.
+    """
+
+    __slots__ = ("tracer", "name", "attrs", "stack", "parent", "number", "start", "end", "trace_id", "wall", "spans")
+
+    def __init__(self, tracer, name, attrs, stack=None):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.stack = stack
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+        return self
+
+    def __enter__(self):
+        stack = self.stack
+        if stack is None:
+            # A turn() opened inside another turn nests in it like a span
+            stack = self.stack = self.tracer._stack()
+        if stack:
+            self.parent = stack[-1].number
+            spans = stack[0].spans
+            spans.append(None)  # filled in on exit, so spans stay in start order
+            self.number = len(spans)  # position in the written trace; the root is 0
+        else:
+            self.number = 0
+            self.trace_id = self.tracer._next_id()
+            self.wall = time.time()
+            self.spans = []
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end = end = time.perf_counter()
+        if exc_type is not None:
+            self.attrs["error"] = f"{exc_type.__name__}: {exc}"
+        stack = self.stack
+        stack.pop()
+        if stack:
+            stack[0].spans[self.number - 1] = (self.name, self.parent, self.start, end, self.attrs)
+        else:
+            self.tracer._emit(self)
+        return False
+
+    def to_json(self):
+        """
+        The trace as one JSON line for the sink; times are ms, span starts relative
+        to the trace. Spans are formatted directly rather than through dicts, as
+        this runs for every trace on the writer thread.
+        """
+        start = self.start
+        spans = []
+        for name, parent, span_start, span_end, attrs in filter(None, self.spans):
+            spans.append(_SPAN_JSON % (
+                _name_json(name), parent, (span_start - start) * 1000, (span_end - span_start) * 1000,
+                f',"attrs":{_attrs_json(attrs)}' if attrs else "",
+            ))
+        return _TRACE_JSON % (_ENCODER.encode(self.trace_id), self.wall, _name_json(self.name),
+                              (self.end - start) * 1000, _attrs_json(self.attrs), ",".join(spans))
+
+class _NoopSpan:
+    """Stands in for a span when tracing is off or no turn is active."""
+
+    __slots__ = ()
+
+    def set(self, **attrs):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+NOOP_SPAN = _NoopSpan()
+
+class Tracer:
+    """
+    Per-turn latency tracing.
+
+    turn() opens a trace, span() a stage inside the current thread's trace
+    (a no-op outside one), and annotate() adds attributes to the innermost
+    open span. Finished traces are handed to the sink, which does the JSON
+    encoding and file I/O on its own thread; with no sink every call is a
+    no-op, so instrumented code costs next to nothing when tracing is off.
+    Work that finishes after its turn (speech playing out) can still be
+    attached to it with record().
+    """
+
+    def __init__(self, sink=None):
+        self.sink = sink
+        self.local = threading.local()
+        self.ids = itertools.count(1)
+        self.prefix = f"{os.getpid():x}{int(time.time()) & 0xffffff:06x}"
+
+    @property
+    def enabled(self):
+        return self.sink is not None
+
+    def enable(self, sink):
+        self.sink = sink
+        return self
+
+    def disable(self):
+        """Stops tracing and closes the sink, writing out what it still holds."""
+        sink, self.sink = self.sink, None
+        if sink is not None:
+            sink.close()
+
+    def _stack(self):
+        stack = getattr(self.local, "stack", None)
+        if stack is None:
+            stack = self.local.stack = []
+        return stack
+
+    def _next_id(self):
+        return f"{self.prefix}-{next(self.ids):x}"
+
+    def turn(self, name="turn", **attrs):
+        if self.sink is None:
+            return NOOP_SPAN
+        return Span(self, name, attrs)
+
+    def span(self, name, **attrs):
+        if self.sink is None:
+            return NOOP_SPAN
+        stack = getattr(self.local, "stack", None)
+        if not stack:
+            return NOOP_SPAN
+        return Span(self, name, attrs, stack)
+
+    def annotate(self, **attrs):
+        stack = getattr(self.local, "stack", None)
+        if stack and self.sink is not None:
+            stack[-1].attrs.update(attrs)
+
+    def current(self):
+        """The trace (root span) open on this thread, or None."""
+        stack = getattr(self.local, "stack", None)
+        return stack[0] if stack else None
+
+    def record(self, trace, name, seconds, **attrs):
+        """Adds a finished stage to an already emitted trace, as its own record with the same trace id."""
+        if self.sink is None or trace is None:
+            return
+        span = Span(self, name, attrs)
+        span.end = time.perf_counter()
+        span.start = span.end - seconds
+        span.trace_id = trace.trace_id
+        span.wall = time.time() - seconds
+        span.spans = []
+        self._emit(span)
+
+    def _emit(self, trace):
+        sink = self.sink
+        if sink is not None:
+            sink.emit(trace)
+
+class JsonlSink:
+    """
+    Appends traces as JSON lines on a background writer thread. When the
+    file passes max_bytes it is rotated to path.1 (path.1 to path.2, ...),
+    keeping at most `backups` old files.
+
+    emit() only appends to a deque (no lock, no thread wake-up); the writer
+    wakes every flush_interval, or early once batch_size traces are waiting,
+    so the calling thread does next to no work per trace.
+    """
+
+    def __init__(self, path="veda_traces.jsonl", max_bytes=5_000_000, backups=3, batch_size=256, flush_interval=1.0):
+        self.path = os.path.abspath(path)
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_interval = flush_interval
+        self.pending = collections.deque()
+        self.wakeup = threading.Event()
+        self.closed = False
+        self.dropped = 0
+        self.thread = threading.Thread(target=self._run, name="veda-trace-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def emit(self, trace):
+        if not self.closed:
+            self.pending.append(trace)
+            if len(self.pending) == self.batch_size:
+                self.wakeup.set()
+
+    def flush(self):
+        """Blocks until everything emitted so far is written."""
+        if self.closed:
+            return
+        # The writer sets the marker once it reaches it, i.e. after writing everything before it
+        marker = threading.Event()
+        self.pending.append(marker)
+        self.wakeup.set()
+        while not marker.wait(0.1):
+            if self.closed or not self.thread.is_alive():
+                return
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.wakeup.set()
+        self.thread.join()
+        atexit.unregister(self.close)
+
+    def _run(self):
+        while True:
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+            stopping = self.closed
+            while self.pending:
+                batch = []
+                markers = []
+                while self.pending and len(batch) < self.batch_size:
+                    item = self.pending.popleft()
+                    (markers if isinstance(item, threading.Event) else batch).append(item)
+                try:
+                    self._write(batch)
+                except Exception as e:
+                    self.dropped += len(batch)
+                    print(f"Trace write failed: {e}")
+                for marker in markers:
+                    marker.set()
+            if stopping:
+                return
+
+    def _write(self, traces):
+        if not traces:
+            return
+        lines = "".join(trace.to_json() + "\n" for trace in traces)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            size = f.tell()
+        if size >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self):
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+def trace_files(path):
+    """The trace file and its rotated backups, oldest first."""
+    backups = []
+    i = 1
+    while os.path.exists(f"{path}.{i}"):
+        backups.append(f"{path}.{i}")
+        i += 1
+    return backups[::-1] + ([path] if os.path.exists(path) else [])
+
+def load_traces(path):
+    for file_path in trace_files(path):
+        with open(file_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue  # a line cut short by a crash
+
+def _percentile(ordered, pct):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))] if ordered else 0.0
+
+def stage_report(path):
+    """Per stage name: count, errors and p50/p95/p99 duration in ms, over every trace in the files."""
+    durations = {}
+    errors = {}
+    for trace in load_traces(path):
+        for span in [trace] + trace.get("spans", []):
+            durations.setdefault(span["name"], []).append(span["ms"])
+            if "error" in (span.get("attrs") or {}):
+                errors[span["name"]] = errors.get(span["name"], 0) + 1
+    report = {}
+    for name, values in durations.items():
+        values.sort()
+        report[name] = {
+            "count": len(values),
+            "errors": errors.get(name, 0),
+            "p50": _percentile(values, 0.5),
+            "p95": _percentile(values, 0.95),
+            "p99": _percentile(values, 0.99),
+        }
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-stage latency percentiles from Veda trace files.")
+    parser.add_argument("path", nargs="?", default="veda_traces.jsonl", help="trace file (default: veda_traces.jsonl)")
+    args = parser.parse_args(argv)
+
+    report = stage_report(args.path)
+    if not report:
+        print(f"{args.path}: no traces")
+        return
+    print(f"{'stage':<18} {'count':>7} {'errors':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, stats in sorted(report.items(), key=lambda item: -item[1]["p95"]):
+        print(f"{name:<18} {stats['count']:>7} {stats['errors']:>6} "
+              f"{stats['p50']:>9.2f} {stats['p95']:>9.2f} {stats['p99']:>9.2f}")
+
+# Process-wide tracer; off until a sink is enabled (VedaAssistant does this at startup)
+TRACER = Tracer()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import collections
+import hashlib
+import os
+import threading
+
+class AudioCache:
+    """
+    Content-addressed LRU cache for synthesized speech.
+
+    Entries are keyed by a hash of (voice, text). Hot entries live in memory
+    (bounded by memory_bytes); every entry is also written to an on-disk
+    tier under cache_dir, which is trimmed oldest-access-first once it
+    grows past disk_bytes.
+    """
+
+    def __init__(self, cache_dir="veda_tts_cache", memory_bytes=8 * 1024 * 1024, disk_bytes=64 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self.memory = collections.OrderedDict()
+        self.memory_used = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_used = None  # computed lazily on first write
+
+    @staticmethod
+    def key(text, voice):
+        return hashlib.sha256(f"{voice}\0{text}".encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.mp3")
+
+    def get(self, text, voice):
+        key = self.key(text, voice)
+        with self.lock:
+            data = self.memory.get(key)
+            if data is not None:
+                self.memory.move_to_end(key)
+                self.hits += 1
+                return data
+        try:
+            path = self._path(key)
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)  # mtime doubles as last-access time for eviction
+        except OSError:
+            with self.lock:
+                self.misses += 1
+            return None
+        with self.lock:
+            self.hits += 1
+            self._remember(key, data)
+        return data
+
+    def put(self, text, voice, data):
+        if not data:
+            return
+        key = self.key(text, voice)
+        with self.lock:
+            self._remember(key, data)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._path(key)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            with self.lock:
+                if self.disk_used is None:
+                    self.disk_used = self._scan_disk_usage()
+                else:
+                    self.disk_used += len(data)
+                if self.disk_used > self.disk_bytes:
+                    self._evict_disk()
+        except OSError as e:
+            print(f"TTS cache write failed: {e}")
+
+    def _remember(self, key, data):
+        if len(data) > self.memory_bytes:
+            return
+        old = self.memory.pop(key, None)
+        if old is not None:
+            self.memory_used -= len(old)
+        self.memory[key] = data
+        self.memory_used += len(data)
+        while self.memory_used > self.memory_bytes:
+            _, evicted = self.memory.popitem(last=False)
+            self.memory_used -= len(evicted)
+
+    def _entries(self):
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".mp3"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _scan_disk_usage(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict_disk(self):
+        # Trim to 90% of the cap so we don't rescan on every write near the limit
+        target = self.disk_bytes * 0.9
+        entries = sorted(self._entries())
+        used = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if used <= target:
+                break
+            try:
+                os.remove(path)
+                used -= size
+            except OSError:
+                pass
+        self.disk_used = used
+
+    def stats(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_entries": len(self.memory),
+                "memory_bytes": self.memory_used,
+                "disk_bytes": self.disk_used,
+            }
@@ -1,18 +1,70 @@
 import asyncio
-import edge_tts
-import pyttsx3
-import speech_recognition as sr
-import pygame
-import os
-import tempfile
+import concurrent.futures
+import io
+import threading
+import time
+from veda.core.tts_cache import AudioCache
+from veda.core.tracing import TRACER
 
 class VedaVoice:
-    def __init__(self, online_voice="en-US-AvaNeural"):
+    """
+    Speech output (edge-tts with a pyttsx3 fallback) and microphone input.
+
+    The audio libraries are imported and initialized on first use, or ahead of
+    time by warm_up(), so constructing the voice does not hold up startup.
+    """
+
+    def __init__(self, online_voice="en-US-AvaNeural", cache_dir="veda_tts_cache"):
         self.online_voice = online_voice
-        self.offline_engine = pyttsx3.init()
-        self.setup_offline_voice()
-        self.recognizer = sr.Recognizer()
-        pygame.mixer.init()
+        self.cache = AudioCache(cache_dir)
+        self.playback_done = threading.Event()
+        self._offline_engine = None
+        self._recognizer = None
+        self._pygame = None
+        self.init_lock = threading.Lock()
+
+        # Bumped by stop(); queued speech from an older generation is dropped
+        self.generation = 0
+        # Playback and pyttsx3 stay on one thread so they never overlap
+        self.playback = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="veda-playback")
+        # One long-lived event loop for all edge-tts work instead of asyncio.run per utterance
+        self.loop = asyncio.new_event_loop()
+        self.loop_thread = threading.Thread(target=self._run_loop, name="veda-voice-loop", daemon=True)
+        self.loop_thread.start()
+        self.speech_queue = asyncio.run_coroutine_threadsafe(self._start_worker(), self.loop).result()
+
+    @property
+    def offline_engine(self):
+        """pyttsx3 engine, created on first offline speech (always on the playback thread)."""
+        if self._offline_engine is None:
+            import pyttsx3
+            self._offline_engine = pyttsx3.init()
+            self.setup_offline_voice()
+        return self._offline_engine
+
+    @property
+    def recognizer(self):
+        if self._recognizer is None:
+            import speech_recognition as sr
+            self._recognizer = sr.Recognizer()
+        return self._recognizer
+
+    def mixer(self):
+        """Returns pygame with its mixer initialized, importing it on first use."""
+        if self._pygame is None:
+            with self.init_lock:
+                if self._pygame is None:
+                    import pygame
+                    pygame.mixer.init()
+                    self._pygame = pygame
+        return self._pygame
+
+    def warm_up(self):
+        """Initializes the audio stack ahead of the first utterance (call from a background thread)."""
+        self.mixer()
+        self.recognizer
+        # pyttsx3 must live on the thread that later drives it
+        self.playback.submit(lambda: self.offline_engine).result()
 
     def setup_offline_voice(self):
         """Sets the offline engine to a female voice if available."""
@@ -22,38 +74,199 @@ class VedaVoice:
                 self.offline_engine.setProperty('voice', voice.id)
                 break
 
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    async def _start_worker(self):
+        # Synthesis of queued sentences runs ahead of playback, at most two at a time
+        self.synth_slots = asyncio.Semaphore(2)
+        speech_queue = asyncio.Queue()
+        self.worker = self.loop.create_task(self._speech_worker(speech_queue))
+        return speech_queue
+
+    async def synthesize_online(self, text):
+        """Returns the mp3 bytes for text, from the audio cache or else from Edge TTS."""
+        data = self.cache.get(text, self.online_voice)
+        if data is not None:
+            return data
+        data = await self.fetch_speech(text)
+        self.cache.put(text, self.online_voice, data)
+        return data
+
+    async def fetch_speech(self, text):
+        """Uses Edge TTS to generate speech straight into memory and returns the mp3 bytes."""
+        import edge_tts
+        communicate = edge_tts.Communicate(text, self.online_voice)
+        buffer = io.BytesIO()
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                buffer.write(chunk["data"])
+        return buffer.getvalue()
+
+    async def _synthesize_limited(self, text):
+        async with self.synth_slots:
+            return await self.synthesize_online(text)
+
     async def speak_online(self, text):
         """Uses Edge TTS to generate and play speech."""
-        communicate = edge_tts.Communicate(text, self.online_voice)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as tmp_file:
-            await communicate.save(tmp_file.name)
-            self.play_audio(tmp_file.name)
-            os.unlink(tmp_file.name)
+        data = await self.synthesize_online(text)
+        await self.loop.run_in_executor(self.playback, self.play_audio, data)
 
     def speak_offline(self, text):
         """Uses pyttsx3 for offline speech."""
         self.offline_engine.say(text)
         self.offline_engine.runAndWait()
 
-    def play_audio(self, file_path):
-        """Plays an audio file using pygame."""
-        pygame.mixer.music.load(file_path)
-        pygame.mixer.music.play()
-        while pygame.mixer.music.get_busy():
-            pygame.time.Clock().tick(10)
-        pygame.mixer.music.unload()  # Unload to release the file lock on Windows
+    def play_audio(self, data, generation=None):
+        """
+        Plays in-memory mp3 audio using pygame and blocks until it finishes or stop() is called.
+        generation is the utterance's speech generation: if stop() ran since, nothing is played.
+        """
+        pygame = self.mixer()
+        try:
+            sound = pygame.mixer.Sound(file=io.BytesIO(data))
+        except pygame.error:
+            # SDL_mixer builds without mp3 support for Sound can still stream it as music
+            pygame.mixer.music.load(io.BytesIO(data), "mp3")
+            if not self._start_playback(generation):
+                pygame.mixer.music.unload()
+                return
+            pygame.mixer.music.play()
+            while pygame.mixer.music.get_busy() and not self.playback_done.is_set():
+                pygame.time.Clock().tick(10)
+            pygame.mixer.music.stop()
+            pygame.mixer.music.unload()
+            return
+        # The decoded length is known up front, so wait once instead of polling
+        if not self._start_playback(generation):
+            return
+        sound.play()
+        if self.playback_done.wait(sound.get_length()):
+            sound.stop()
+
+    def _start_playback(self, generation):
+        """Re-arms the stop flag; False if stop() has already dropped this utterance."""
+        self.playback_done.clear()
+        # stop() bumps the generation before setting the flag, so a stop the clear undid shows up here
+        return generation is None or generation == self.generation
+
+    @staticmethod
+    def _resolve(future, value):
+        if not future.done():
+            future.set_result(value)
+
+    async def _speech_worker(self, speech_queue):
+        while True:
+            generation, text, task, future, on_start, trace, queued_at = await speech_queue.get()
+            if generation != self.generation or future.cancelled():
+                task.cancel()
+                self._resolve(future, False)
+                continue
+            try:
+                data = await task
+            except asyncio.CancelledError:
+                self._resolve(future, False)
+                continue
+            except Exception as e:
+                print(f"Online TTS failed, falling back to offline: {e}")
+                data = None
+            if generation != self.generation:
+                self._resolve(future, False)
+                continue
+            # Speech outlives its turn, so it is attached to the turn's trace as a separate record
+            TRACER.record(trace, "tts", time.perf_counter() - queued_at,
+                          audio_bytes=len(data) if data is not None else 0, offline=data is None)
+            if on_start:
+                on_start()
+            try:
+                if data is None:
+                    await self.loop.run_in_executor(self.playback, self.speak_offline, text)
+                else:
+                    await self.loop.run_in_executor(self.playback, self.play_audio, data, generation)
+                # False when stop() cut this utterance short
+                self._resolve(future, generation == self.generation)
+            except Exception as e:
+                print(f"Playback failed: {e}")
+                if not future.done():
+                    future.set_exception(e)
+
+    def speak_async(self, text, on_start=None):
+        """
+        Queues text for speech and returns immediately.
+        The returned Future resolves to True once spoken, or False if interrupted.
+        on_start is called when its audio begins playing.
+        """
+        future = concurrent.futures.Future()
+        generation = self.generation
+        trace = TRACER.current()
+        queued_at = time.perf_counter()
+
+        def enqueue():
+            task = self.loop.create_task(self._synthesize_limited(text))
+            self.speech_queue.put_nowait((generation, text, task, future, on_start, trace, queued_at))
+
+        self.loop.call_soon_threadsafe(enqueue)
+        return future
 
     def speak(self, text):
-        """Main speak method that tries online TTS first, then falls back to offline."""
+        """Main speak method: online TTS with offline fallback, blocking until done."""
+        return self.speak_async(text).result()
+
+    def speak_stream(self, sentences, on_first_audio=None):
+        """
+        Queues sentences for speech as they arrive from an iterable.
+        Later sentences synthesize while earlier ones play; returns the last sentence's Future.
+        """
+        last = None
+        for sentence in sentences:
+            last = self.speak_async(sentence, on_start=on_first_audio)
+            on_first_audio = None
+        return last
+
+    def stop(self):
+        """Interrupts current speech and drops everything queued (barge-in)."""
+        self.generation += 1
+        self.playback_done.set()
+        pygame = self._pygame
+        if pygame is not None:
+            # Nothing can be playing if the mixer was never started
+            try:
+                pygame.mixer.stop()
+                pygame.mixer.music.stop()
+            except pygame.error:
+                pass
+        self.loop.call_soon_threadsafe(self._drain_queue)
+
+    def _drain_queue(self):
+        while not self.speech_queue.empty():
+            _, _, task, future, *_ = self.speech_queue.get_nowait()
+            task.cancel()
+            self._resolve(future, False)
+
+    def shutdown(self):
+        """Stops speech and the background loop."""
+        self.stop()
         try:
-            # edge-tts is async, so we run it in a new event loop or the current one
-            asyncio.run(self.speak_online(text))
+            asyncio.run_coroutine_threadsafe(self._stop_worker(), self.loop).result(timeout=2)
         except Exception as e:
-            print(f"Online TTS failed, falling back to offline: {e}")
-            self.speak_offline(text)
+            print(f"Voice worker did not stop cleanly: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.loop_thread.join(timeout=2)
+        self.playback.shutdown(wait=False)
+
+    async def _stop_worker(self):
+        self.worker.cancel()
+        try:
+            await self.worker
+        except asyncio.CancelledError:
+            pass
 
     def listen(self):
         """Listens for user input via microphone."""
+        # Barge-in: the user talking over Veda cuts her off
+        self.stop()
+        import speech_recognition as sr
         with sr.Microphone() as source:
             print("Listening...")
             self.recognizer.pause_threshold = 1
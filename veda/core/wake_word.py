@@ -0,0 +1,341 @@
+import collections
+import threading
+import time
+import wave
+
+try:
+    import numpy as np
+    NUMPY = True
+except ImportError:
+    NUMPY = False
+
+class MicrophoneSource:
+    """16-bit mono PCM frames from the default microphone (PyAudio, imported on open)."""
+
+    def __init__(self, rate=16000, frame_ms=30, device_index=None):
+        self.rate = rate
+        self.frame_samples = rate * frame_ms // 1000
+        self.device_index = device_index
+        self.audio = None
+        self.stream = None
+
+    def open(self):
+        import pyaudio
+        self.audio = pyaudio.PyAudio()
+        self.stream = self.audio.open(
+            format=pyaudio.paInt16, channels=1, rate=self.rate, input=True,
+            frames_per_buffer=self.frame_samples, input_device_index=self.device_index
+        )
+
+    def read(self):
+        """Blocks for one frame; returns its bytes."""
+        return self.stream.read(self.frame_samples, exception_on_overflow=False)
+
+    def close(self):
+        if self.stream is not None:
+            self.stream.stop_stream()
+            self.stream.close()
+            self.audio.terminate()
+            self.stream = None
+
+class WavSource:
+    """
+    Frames from 16-bit mono WAV files, for tests and benchmarks: the files are
+    played back in order (in real time if realtime=True) and read() returns
+    None once they are exhausted.
+    """
+
+    def __init__(self, paths, frame_ms=30, realtime=False):
+        self.paths = [paths] if isinstance(paths, str) else list(paths)
+        self.frame_ms = frame_ms
+        self.realtime = realtime
+        self.rate = None
+        self.frame_samples = None
+        self.frames = collections.deque()
+
+    def open(self):
+        if self.rate is not None:
+            return  # reopened after a pause: carry on where playback stopped
+        for path in self.paths:
+            with wave.open(path, "rb") as wav:
+                if wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+                    raise ValueError(f"{path}: expected 16-bit mono audio")
+                if self.rate is None:
+                    self.rate = wav.getframerate()
+                    self.frame_samples = self.rate * self.frame_ms // 1000
+                elif wav.getframerate() != self.rate:
+                    raise ValueError(f"{path}: sample rate differs from {self.rate}")
+                data = wav.readframes(wav.getnframes())
+            step = self.frame_samples * 2
+            self.frames.extend(data[i:i + step] for i in range(0, len(data) - step + 1, step))
+        self.next_frame_at = time.monotonic()
+
+    def read(self):
+        if not self.frames:
+            return None
+        if self.realtime:
+            self.next_frame_at += self.frame_ms / 1000
+            delay = self.next_frame_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        return self.frames.popleft()
+
+    def close(self):
+        pass
+
+class EnergyVAD:
+    """
+    Frame-level voice activity from RMS energy against an adaptive noise floor.
+    A segment starts after start_frames loud frames and ends after
+    hangover_frames quiet ones.
+    """
+
+    def __init__(self, ratio=3.0, min_rms=300.0, start_frames=2, hangover_frames=8):
+        self.ratio = ratio
+        self.min_rms = min_rms
+        self.start_frames = start_frames
+        self.hangover_frames = hangover_frames
+        self.noise_floor = min_rms / ratio
+        self.loud = 0
+        self.quiet = 0
+        self.active = False
+
+    def update(self, samples):
+        """Returns 'start', 'end' or None for this frame."""
+        rms = float(np.sqrt(np.mean(samples.astype(np.float32) ** 2))) if len(samples) else 0.0
+        speech = rms > max(self.min_rms, self.noise_floor * self.ratio)
+        if not speech:
+            # Track the background level only while nobody is talking
+            self.noise_floor = 0.95 * self.noise_floor + 0.05 * rms
+        if not self.active:
+            self.loud = self.loud + 1 if speech else 0
+            if self.loud >= self.start_frames:
+                self.active = True
+                self.quiet = 0
+                return "start"
+            return None
+        self.quiet = 0 if speech else self.quiet + 1
+        if self.quiet >= self.hangover_frames:
+            self.active = False
+            self.loud = 0
+            return "end"
+        return None
+
+def log_mel_features(samples, rate, n_mels=26, win_ms=25, hop_ms=10):
+    """Per-frame log mel energies, shape (frames, n_mels), normalised per frame so level does not matter."""
+    win = rate * win_ms // 1000
+    hop = rate * hop_ms // 1000
+    n_fft = 1 << (win - 1).bit_length()
+    x = samples.astype(np.float32) / 32768.0
+    if len(x) < win:
+        x = np.pad(x, (0, win - len(x)))
+    count = 1 + (len(x) - win) // hop
+    frames = np.lib.stride_tricks.as_strided(x, (count, win), (x.strides[0] * hop, x.strides[0]))
+    power = np.abs(np.fft.rfft(frames * np.hamming(win), n_fft)) ** 2
+    feats = np.log(power @ _mel_filters(rate, n_fft, n_mels).T + 1e-8)
+    return feats - feats.mean(axis=1, keepdims=True)
+
+_MEL_CACHE = {}
+
+def _mel_filters(rate, n_fft, n_mels):
+    key = (rate, n_fft, n_mels)
+    if key not in _MEL_CACHE:
+        mel = lambda hz: 2595 * np.log10(1 + hz / 700.0)
+        hz = lambda m: 700 * (10 ** (m / 2595.0) - 1)
+        points = hz(np.linspace(mel(60), mel(rate / 2), n_mels + 2))
+        bins = np.floor((n_fft + 1) * points / rate).astype(int)
+        filters = np.zeros((n_mels, n_fft // 2 + 1), dtype=np.float32)
+        for m in range(1, n_mels + 1):
+            left, center, right = bins[m - 1], bins[m], bins[m + 1]
+            filters[m - 1, left:center] = (np.arange(left, center) - left) / max(center - left, 1)
+            filters[m - 1, center:right] = (right - np.arange(center, right)) / max(right - center, 1)
+        _MEL_CACHE[key] = filters
+    return _MEL_CACHE[key]
+
+def _subsequence_dtw(template, query):
+    """DTW distance of template against its best-matching stretch of query, per template frame."""
+    cost = np.sqrt(((template[:, None, :] - query[None, :, :]) ** 2).sum(axis=2))
+    rows, cols = cost.shape
+    acc = np.empty((rows, cols), dtype=np.float64)
+    acc[0] = cost[0]  # the match may start anywhere in the query...
+    for i in range(1, rows):
+        acc[i, 0] = acc[i - 1, 0] + cost[i, 0]
+        diagonal = np.minimum(acc[i - 1, 1:], acc[i - 1, :-1])
+        row = acc[i]
+        for j in range(1, cols):
+            row[j] = cost[i, j] + min(diagonal[j - 1], row[j - 1])
+    return float(acc[-1].min() / rows)  # ...and end anywhere
+
+class TemplateDetector:
+    """
+    On-device keyword spotting by template matching: a few recordings of the
+    wake word are enrolled, and a speech segment fires when its log-mel
+    features align (subsequence DTW) with one of them more closely than the
+    threshold. The default threshold is derived from how far the enrolled
+    samples are from each other, so without an explicit threshold at least
+    two samples must be enrolled.
+    """
+
+    def __init__(self, rate=16000, threshold=None, slack=1.5):
+        self.rate = rate
+        self.templates = []
+        self.threshold = threshold
+        self.slack = slack
+
+    def enroll(self, wav_paths):
+        recordings = []
+        for path in wav_paths:
+            with wave.open(path, "rb") as wav:
+                recordings.append(np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16))
+        if self.threshold is None and len(self.templates) + len(recordings) < 2:
+            raise ValueError("Enroll at least two wake word samples, or pass a threshold")
+        self.templates += [log_mel_features(samples, self.rate) for samples in recordings]
+        if self.threshold is None:
+            # Leave-one-out: score each sample the way detect() would, against the other templates
+            scores = [min(_subsequence_dtw(template, query) for template in self.templates if template is not query)
+                      for query in self.templates]
+            self.threshold = max(scores) * self.slack
+        return self
+
+    def score(self, samples):
+        feats = log_mel_features(samples, self.rate)
+        return min(_subsequence_dtw(template, feats) for template in self.templates)
+
+    def detect(self, samples):
+        return bool(self.templates) and self.score(samples) <= self.threshold
+
+class VoskDetector:
+    """Keyword spotting with a local Vosk model restricted to the wake word (optional dependency)."""
+
+    def __init__(self, model_path, wake_word="veda", rate=16000):
+        import json
+        from vosk import Model, KaldiRecognizer
+        self.json = json
+        self.wake_word = wake_word
+        self.recognizer = KaldiRecognizer(Model(model_path), rate, json.dumps([wake_word, "[unk]"]))
+
+    def detect(self, samples):
+        self.recognizer.AcceptWaveform(samples.tobytes())
+        text = self.json.loads(self.recognizer.FinalResult()).get("text", "")
+        return self.wake_word in text.split()
+
+class WakeWordListener:
+    """
+    Always-on wake word detection on a background thread.
+
+    Frames from the source go into a ring buffer holding the last pre_roll
+    seconds. Silent frames only cost an RMS computation; when the energy VAD
+    opens a segment, its audio (including the pre-roll) is collected until
+    the VAD closes it or max_segment seconds pass, and only then is it given
+    to the detector. On a detection the listener pauses itself and calls
+    on_wake(); full speech recognition runs after that, and resume() restarts
+    listening. metrics() reports detections and the thread's CPU usage.
+    """
+
+    def __init__(self, source, detector, on_wake, vad=None, pre_roll=0.3, max_segment=1.5):
+        if not NUMPY:
+            raise RuntimeError("Wake word detection needs numpy")
+        self.source = source
+        self.detector = detector
+        self.on_wake = on_wake
+        self.vad = vad or EnergyVAD()
+        self.pre_roll = pre_roll
+        self.max_segment = max_segment
+        self.running = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.counts = collections.Counter()
+        self.cpu_seconds = 0.0
+        self.audio_seconds = 0.0
+        self.detect_ms = collections.deque(maxlen=100)
+
+    def start(self):
+        self.running.set()
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="veda-wake-word", daemon=True)
+            self.thread.start()
+        return self
+
+    def pause(self):
+        self.running.clear()
+
+    def resume(self):
+        self.running.set()
+
+    def stop(self):
+        self.stopped.set()
+        self.running.set()  # let a paused loop notice the stop
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout=2)
+
+    def _run(self):
+        while not self.stopped.is_set():
+            self.running.wait()
+            if self.stopped.is_set():
+                break
+            self.source.open()
+            try:
+                exhausted = self._listen()
+            finally:
+                self.source.close()
+            if exhausted:
+                break  # end of a WAV fixture
+
+    def _listen(self):
+        """Runs until paused or stopped; returns True if the source ran out of audio."""
+        rate = self.source.rate
+        frame_seconds = self.source.frame_samples / rate
+        ring = collections.deque(maxlen=max(1, int(self.pre_roll / frame_seconds)))
+        segment = None
+        max_frames = int(self.max_segment / frame_seconds)
+        cpu_start = time.thread_time()
+        try:
+            while self.running.is_set() and not self.stopped.is_set():
+                data = self.source.read()
+                if data is None:
+                    return True
+                samples = np.frombuffer(data, dtype=np.int16)
+                self.counts["frames"] += 1
+                self.audio_seconds += frame_seconds
+                event = self.vad.update(samples)
+                if segment is None:
+                    ring.append(samples)
+                    if event == "start":
+                        self.counts["segments"] += 1
+                        segment = list(ring)
+                    continue
+                segment.append(samples)
+                if event == "end" or len(segment) >= max_frames:
+                    audio = np.concatenate(segment)
+                    segment = None
+                    ring.clear()
+                    if self._check(audio):
+                        return False
+        finally:
+            self.cpu_seconds += time.thread_time() - cpu_start
+        return False
+
+    def _check(self, audio):
+        start = time.perf_counter()
+        fired = self.detector.detect(audio)
+        self.detect_ms.append((time.perf_counter() - start) * 1000)
+        if not fired:
+            return False
+        self.counts["detections"] += 1
+        self.pause()
+        try:
+            self.on_wake()
+        except Exception as e:
+            print(f"Wake word handler failed: {e}")
+        return True
+
+    def metrics(self):
+        """Detections, segments checked and CPU use (% of one core per second of audio)."""
+        detect_ms = sorted(self.detect_ms)
+        return {
+            **dict(self.counts),
+            "audio_seconds": self.audio_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "cpu_percent": 100.0 * self.cpu_seconds / self.audio_seconds if self.audio_seconds else 0.0,
+            "detect_ms_p50": detect_ms[len(detect_ms) // 2] if detect_ms else 0.0,
+        }
@@ -0,0 +1,133 @@
+import collections
+import concurrent.futures
+import threading
+import time
+
+class ResponseCache:
+    """
+    TTL cache for slow remote lookups.
+
+    get(key, fetch, ttl) returns a cached value while it is fresh. Concurrent
+    misses on the same key are coalesced into one fetch whose result every
+    caller shares. A hit in the last `refresh_ahead` fraction of an entry's
+    lifetime also triggers a background refetch, so popular entries are
+    replaced before they expire instead of making a caller wait. Failed
+    fetches are never cached.
+    """
+
+    def __init__(self, max_entries=256, refresh_ahead=0.2, max_refresh_workers=2):
+        self.max_entries = max_entries
+        self.refresh_ahead = refresh_ahead
+        self.entries = collections.OrderedDict()  # key -> (value, fetched_at, ttl)
+        self.inflight = {}  # key -> Future of the fetch in progress
+        self.lock = threading.Lock()
+        self.refresher = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_refresh_workers, thread_name_prefix="veda-web-refresh"
+        )
+        self.counts = collections.Counter()
+
+    def get(self, key, fetch, ttl):
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                value, fetched_at, _ = entry
+                age = now - fetched_at
+                if age < ttl:
+                    self.entries.move_to_end(key)
+                    self.counts["hits"] += 1
+                    if age >= ttl * (1 - self.refresh_ahead) and key not in self.inflight:
+                        self._start_fetch(key, fetch, ttl, background=True)
+                    return value
+            future = self.inflight.get(key)
+            if future is None:
+                self.counts["misses"] += 1
+                future = self._start_fetch(key, fetch, ttl)
+                leader = True
+            else:
+                self.counts["coalesced"] += 1
+                leader = False
+        if leader:
+            self._fetch(key, fetch, ttl, future)
+        return future.result()
+
+    def _start_fetch(self, key, fetch, ttl, background=False):
+        # Called with self.lock held
+        future = concurrent.futures.Future()
+        self.inflight[key] = future
+        if background:
+            self.counts["refreshes"] += 1
+            self.refresher.submit(self._fetch, key, fetch, ttl, future)
+        return future
+
+    def _fetch(self, key, fetch, ttl, future):
+        try:
+            value = fetch()
+        except Exception as e:
+            with self.lock:
+                self.inflight.pop(key, None)
+                self.counts["errors"] += 1
+            future.set_exception(e)
+            return
+        with self.lock:
+            self.inflight.pop(key, None)
+            self.entries[key] = (value, time.monotonic(), ttl)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        future.set_result(value)
+
+    def invalidate(self, key=None):
+        with self.lock:
+            if key is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(key, None)
+
+    def stats(self):
+        with self.lock:
+            return {"entries": len(self.entries), "inflight": len(self.inflight), **dict(self.counts)}
+
+    def close(self):
+        self.refresher.shutdown(wait=False)
+
+class HttpClient:
+    """
+    Pooled HTTP access for the web features: one requests.Session (keep-alive
+    connections, retries on connect errors) and a strict (connect, read)
+    timeout on every request. requests is imported on first use.
+    """
+
+    def __init__(self, timeout=(3.05, 8), pool_size=8, retries=1, user_agent="Veda/2.0"):
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.retries = retries
+        self.user_agent = user_agent
+        self._session = None
+        self.lock = threading.Lock()
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self.lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size,
+                                          max_retries=self.retries)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    session.headers["User-Agent"] = self.user_agent
+                    self._session = session
+        return self._session
+
+    def get_text(self, url, params=None):
+        """GETs url and returns the body; raises on timeouts and non-2xx responses."""
+        response = self.session.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.text
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
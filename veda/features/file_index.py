@@ -0,0 +1,209 @@
+import os
+import sqlite3
+import threading
+import time
+from veda.core.storage import VedaStorage
+
+class FileIndex:
+    """
+    Persistent filename index backing SystemControl.find.
+
+    A background crawler walks the roots with os.scandir and stores every file
+    in SQLite, with an FTS5 trigram index over file names for substring search
+    at any depth. Directory mtimes are recorded, so a refresh only re-lists
+    directories whose entries changed and merely stats the rest.
+    """
+
+    BATCH_ROWS = 5000
+    PREFIX_CANDIDATES = 200
+    CANDIDATES = 300
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """Returns the app-wide index over the user's common folders, starting its crawler."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                home = os.path.expanduser("~")
+                roots = [os.path.join(home, folder) for folder in ("Documents", "Desktop", "Downloads", "Pictures")]
+                cls._shared = cls(roots)
+                cls._shared.start()
+            return cls._shared
+
+    def __init__(self, roots, db_path="veda_file_index.db", refresh_interval=300):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.storage = VedaStorage.for_path(db_path)
+        self.refresh_interval = refresh_interval
+        self.ready = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.last_refresh = {}
+        self._init_db()
+
+    def _init_db(self):
+        self.storage.executescript('''
+            CREATE TABLE IF NOT EXISTS files (
+                id INTEGER PRIMARY KEY,
+                path TEXT UNIQUE,
+                name TEXT,
+                stem_key TEXT,
+                dir TEXT,
+                depth INTEGER,
+                mtime REAL,
+                size INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS idx_files_dir ON files(dir);
+            CREATE INDEX IF NOT EXISTS idx_files_stem ON files(stem_key);
+            CREATE TABLE IF NOT EXISTS dirs (
+                path TEXT PRIMARY KEY,
+                parent TEXT,
+                mtime REAL
+            );
+        ''')
+        try:
+            self.storage.executescript('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS files_fts USING fts5(
+                    name, content='files', content_rowid='id', tokenize='trigram'
+                );
+                CREATE TRIGGER IF NOT EXISTS files_ai AFTER INSERT ON files BEGIN
+                    INSERT INTO files_fts(rowid, name) VALUES (new.id, new.name);
+                END;
+                CREATE TRIGGER IF NOT EXISTS files_ad AFTER DELETE ON files BEGIN
+                    INSERT INTO files_fts(files_fts, rowid, name) VALUES ('delete', old.id, old.name);
+                END;
+            ''')
+            self.fts = True
+        except sqlite3.OperationalError:
+            # SQLite without FTS5/trigram: fall back to LIKE scans
+            self.fts = False
+        if self.storage.query_one("SELECT 1 FROM files LIMIT 1"):
+            self.ready.set()  # a previous run's index is usable while we refresh
+
+    def start(self):
+        """Starts the background crawler (initial build, then periodic refresh)."""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="veda-file-index", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+
+    def _run(self):
+        while not self.stopped.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"File index refresh failed: {e}")
+            self.stopped.wait(self.refresh_interval)
+
+    def refresh(self):
+        """Brings the index up to date; returns stats about the work done."""
+        start = time.perf_counter()
+        known = {}
+        children = {}
+        for path, parent, mtime in self.storage.query("SELECT path, parent, mtime FROM dirs"):
+            known[path] = mtime
+            children.setdefault(parent, []).append(path)
+
+        seen = set()
+        listed = 0
+        dirs_rows, file_rows, relisted = [], [], []
+        stack = [(root, None, 0) for root in self.roots]
+        while stack:
+            path, parent, depth = stack.pop()
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+            seen.add(path)
+            if known.get(path) == mtime:
+                # Nothing was added, removed or renamed here; only descend
+                stack.extend((child, path, depth + 1) for child in children.get(path, ()))
+                continue
+
+            listed += 1
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append((entry.path, path, depth + 1))
+                            elif entry.is_file():
+                                stat = entry.stat()
+                                stem_key = os.path.splitext(entry.name)[0].lower()
+                                file_rows.append((entry.path, entry.name, stem_key, path, depth, stat.st_mtime, stat.st_size))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+            relisted.append((path,))
+            dirs_rows.append((path, parent, mtime))
+            if len(file_rows) >= self.BATCH_ROWS:
+                self._write(relisted, dirs_rows, file_rows)
+                dirs_rows, file_rows, relisted = [], [], []
+
+        self._write(relisted, dirs_rows, file_rows)
+        removed = [(path,) for path in known if path not in seen]
+        if removed:
+            with self.storage.transaction() as conn:
+                conn.executemany("DELETE FROM files WHERE dir = ?", removed)
+                conn.executemany("DELETE FROM dirs WHERE path = ?", removed)
+
+        self.ready.set()
+        self.last_refresh = {
+            "seconds": time.perf_counter() - start,
+            "dirs_seen": len(seen),
+            "dirs_listed": listed,
+            "dirs_removed": len(removed),
+        }
+        return self.last_refresh
+
+    def _write(self, relisted, dirs_rows, file_rows):
+        if not relisted:
+            return
+        with self.storage.transaction() as conn:
+            # Re-listed directories are replaced wholesale, which also drops deleted files
+            conn.executemany("DELETE FROM files WHERE dir = ?", relisted)
+            conn.executemany(
+                "INSERT OR IGNORE INTO files (path, name, stem_key, dir, depth, mtime, size) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                file_rows
+            )
+            conn.executemany("INSERT OR REPLACE INTO dirs (path, parent, mtime) VALUES (?, ?, ?)", dirs_rows)
+
+    def search(self, query, limit=5):
+        """Returns matching file paths, best first: exact name, name prefix, then shallow and recent."""
+        q = query.lower().strip()
+        if not q:
+            return []
+        # Exact and prefix matches on the name stem come from an index range scan (exact sorts first)
+        stem = os.path.splitext(q)[0] or q
+        rows = self.storage.query(
+            "SELECT path, name, depth, mtime FROM files WHERE stem_key >= ? AND stem_key < ? LIMIT ?",
+            (stem, stem + "\uffff", self.PREFIX_CANDIDATES)
+        )
+        if self.fts and len(q) >= 3:
+            rows += self.storage.query(
+                "SELECT f.path, f.name, f.depth, f.mtime FROM files_fts JOIN files f ON f.id = files_fts.rowid "
+                "WHERE files_fts MATCH ? LIMIT ?",
+                ('"' + q.replace('"', '""') + '"', self.CANDIDATES)
+            )
+        else:
+            escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            rows += self.storage.query(
+                "SELECT path, name, depth, mtime FROM files WHERE name LIKE ? ESCAPE '\\' LIMIT ?",
+                (f"%{escaped}%", self.CANDIDATES)
+            )
+
+        def rank(row):
+            name = row[1].lower()
+            return (name != q and os.path.splitext(name)[0] != q, not name.startswith(q), row[2], -row[3])
+
+        results = []
+        for row in sorted(rows, key=rank):
+            if q in row[1].lower() and row[0] not in results:
+                results.append(row[0])
+                if len(results) == limit:
+                    break
+        return results
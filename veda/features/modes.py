@@ -1,28 +1,37 @@
+# Mode protocols as data: plan steps (see veda.core.plan) and what Veda says once they ran.
+# Steps without "after" run concurrently.
+PROTOCOLS = {
+    "house party": {
+        "steps": [
+            {"intent": "set_volume", "params": {"level": 80}},
+            {"intent": "open_app", "params": {"app_name": "chrome"}},
+        ],
+        "response": "House Party Protocol engaged. Volume optimized. Launching entertainment.",
+    },
+    "focus": {
+        "steps": [
+            {"intent": "set_volume", "params": {"level": 0}},
+        ],
+        "response": "Focus mode enabled. Distractions minimized.",
+    },
+}
+
 class ModeManager:
-    def __init__(self, assistant):
+    def __init__(self, assistant, protocols=None):
         self.assistant = assistant
+        self.protocols = protocols if protocols is not None else PROTOCOLS
         self.active_mode = "standard"
 
     def set_mode(self, mode_name):
-        mode_name = mode_name.lower()
-        if mode_name == "house party":
-            return self.house_party_protocol()
-        elif mode_name == "focus":
-             return self.focus_mode()
-        else:
+        mode_name = mode_name.lower().strip()
+        protocol = self.protocols.get(mode_name)
+        if protocol is None:
             self.active_mode = "standard"
             return "Switched to standard mode."
 
-    def house_party_protocol(self):
-        """Automates multiple actions for a party."""
-        self.assistant.system.set_volume(80)
-        self.assistant.system.open_app("chrome")
-        return "House Party Protocol engaged. Volume optimized. Launching entertainment."
-
-    def focus_mode(self):
-        """Silences distractions."""
-        self.assistant.system.set_volume(0)
-        return "Focus mode enabled. Distractions minimized."
+        result = self.assistant.plans.run(protocol["steps"])
+        self.active_mode = mode_name
+        return " ".join([protocol["response"]] + result.problems())
 
     def get_modes(self):
-        return ["standard", "house party", "focus"]
+        return ["standard"] + list(self.protocols)
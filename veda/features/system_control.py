@@ -1,23 +1,24 @@
 import os
 import subprocess
-import pyautogui
 import threading
 import time
 from veda.utils.sanitizer import VedaSanitizer
+from veda.features.file_index import FileIndex
 
-try:
-    from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-    from ctypes import cast, POINTER
-    from comtypes import CLSCTX_ALL
-    WINDOWS_AUDIO = True
-except ImportError:
-    WINDOWS_AUDIO = False
+# pyautogui, pycaw/comtypes and screen_brightness_control are slow to import,
+# so they load inside the actions that need them rather than with this module
 
-try:
-    import screen_brightness_control as sbc
-    WINDOWS_BRIGHTNESS = True
-except ImportError:
-    WINDOWS_BRIGHTNESS = False
+def _speaker_volume():
+    """Returns the speakers' IAudioEndpointVolume, or None where pycaw is unavailable."""
+    try:
+        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+        from ctypes import cast, POINTER
+        from comtypes import CLSCTX_ALL
+    except ImportError:
+        return None
+    devices = AudioUtilities.GetSpeakers()
+    interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+    return cast(interface, POINTER(IAudioEndpointVolume))
 
 class SystemControl:
     @staticmethod
@@ -72,12 +73,10 @@ class SystemControl:
     @staticmethod
     def set_volume(level):
         """Sets system volume (0-100)."""
-        if not WINDOWS_AUDIO:
-            return "Volume control is only available on Windows."
         try:
-            devices = AudioUtilities.GetSpeakers()
-            interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-            volume = cast(interface, POINTER(IAudioEndpointVolume))
+            volume = _speaker_volume()
+            if volume is None:
+                return "Volume control is only available on Windows."
             volume.SetMasterVolumeLevelScalar(float(level) / 100, None)
             return f"Volume set to {level} percent"
         except Exception as e:
@@ -86,7 +85,9 @@ class SystemControl:
     @staticmethod
     def set_brightness(level):
         """Sets screen brightness (0-100)."""
-        if not WINDOWS_BRIGHTNESS:
+        try:
+            import screen_brightness_control as sbc
+        except ImportError:
             return "Brightness control is only available on Windows."
         try:
             sbc.set_brightness(int(level))
@@ -108,6 +109,7 @@ class SystemControl:
     def screenshot():
         """Takes a screenshot and saves it."""
         try:
+            import pyautogui
             pic_dir = os.path.join(os.path.expanduser("~"), "Pictures")
             if not os.path.exists(pic_dir):
                 os.makedirs(pic_dir)
@@ -119,26 +121,14 @@ class SystemControl:
 
     @staticmethod
     def find(query):
-        """Searches for files in the current user's folder (limited depth)."""
+        """Searches for files in the current user's folders via the background file index."""
         try:
-            user_home = os.path.expanduser("~")
-            results = []
-            target_dirs = ["Documents", "Desktop", "Downloads", "Pictures"]
-            for folder in target_dirs:
-                path = os.path.join(user_home, folder)
-                if not os.path.exists(path):
-                    continue
-                # Limit search depth to 2 to avoid GUI hang
-                for root, dirs, files in os.walk(path):
-                    depth = root[len(path):].count(os.sep)
-                    if depth > 2:
-                        continue
-                    for file in files:
-                        if query.lower() in file.lower():
-                            results.append(os.path.join(root, file))
-                        if len(results) >= 5: break
-                    if len(results) >= 5: break
-                if len(results) >= 5: break
+            index = FileIndex.shared()
+            if index.ready.is_set():
+                results = index.search(query, limit=5)
+            else:
+                # First crawl still running: fall back to a shallow walk
+                results = SystemControl._walk_find(query)
 
             if results:
                 res_str = "\n".join(results[:3])
@@ -149,6 +139,29 @@ class SystemControl:
         except Exception as e:
             return f"Search failed: {str(e)}"
 
+    @staticmethod
+    def _walk_find(query):
+        """Limited-depth os.walk search, used until the file index is built."""
+        user_home = os.path.expanduser("~")
+        results = []
+        target_dirs = ["Documents", "Desktop", "Downloads", "Pictures"]
+        for folder in target_dirs:
+            path = os.path.join(user_home, folder)
+            if not os.path.exists(path):
+                continue
+            # Limit search depth to 2 to avoid GUI hang
+            for root, dirs, files in os.walk(path):
+                depth = root[len(path):].count(os.sep)
+                if depth > 2:
+                    continue
+                for file in files:
+                    if query.lower() in file.lower():
+                        results.append(os.path.join(root, file))
+                    if len(results) >= 5: break
+                if len(results) >= 5: break
+            if len(results) >= 5: break
+        return results
+
     @staticmethod
     def move(source, destination=None):
         """Moves a file or folder safely."""
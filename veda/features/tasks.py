@@ -1,47 +1,22 @@
-import sqlite3
-import datetime
+from veda.core.storage import VedaStorage
+from veda.core.schema import ensure_schema
 
 class TaskManager:
     def __init__(self, db_path="veda_memory.db"):
         self.db_path = db_path
-        self._init_db()
-
-    def _init_db(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                task TEXT,
-                status TEXT DEFAULT 'pending',
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        conn.commit()
-        conn.close()
+        self.storage = VedaStorage.for_path(db_path)
+        ensure_schema(self.storage)
 
     def add_task(self, task):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("INSERT INTO tasks (task) VALUES (?)", (task,))
-        conn.commit()
-        conn.close()
+        self.storage.execute("INSERT INTO tasks (task) VALUES (?)", (task,))
         return f"Added task: {task}"
 
     def list_tasks(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, task FROM tasks WHERE status = 'pending'")
-        rows = cursor.fetchall()
-        conn.close()
+        rows = self.storage.query("SELECT id, task FROM tasks WHERE status = 'pending'")
         if not rows:
             return "You have no pending tasks."
         return "Your tasks:\n" + "\n".join([f"{row[0]}. {row[1]}" for row in rows])
 
     def complete_task(self, task_id):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("UPDATE tasks SET status = 'completed' WHERE id = ?", (task_id,))
-        conn.commit()
-        conn.close()
+        self.storage.execute("UPDATE tasks SET status = 'completed' WHERE id = ?", (task_id,))
         return f"Marked task {task_id} as completed."
@@ -1,42 +1,75 @@
-import requests
-from duckduckgo_search import DDGS
+import threading
+from urllib.parse import quote
+from veda.core.web_cache import HttpClient, ResponseCache
 
 class WebInfo:
-    @staticmethod
-    def search(query):
+    """
+    Weather, news and web search.
+
+    Lookups share one pooled HTTP session and one DuckDuckGo client, and go
+    through a per-endpoint TTL cache that coalesces identical concurrent
+    requests and refreshes popular entries shortly before they expire.
+    requests and duckduckgo_search are imported on first use: they are slow
+    to load and only needed once the user actually asks for something online.
+    """
+
+    WEATHER_TTL = 10 * 60
+    NEWS_TTL = 5 * 60
+    SEARCH_TTL = 60 * 60
+
+    def __init__(self, weather_url="https://wttr.in/{city}", http=None, cache=None, ddgs_factory=None):
+        self.weather_url = weather_url
+        self.http = http or HttpClient()
+        self.cache = cache or ResponseCache()
+        self.ddgs_factory = ddgs_factory
+        self._ddgs = None
+        self.ddgs_lock = threading.Lock()
+
+    def _ddgs_call(self, method, *args, **kwargs):
+        # DDGS keeps its own HTTP client; reuse one instance, one call at a time
+        with self.ddgs_lock:
+            if self._ddgs is None:
+                if self.ddgs_factory is None:
+                    from duckduckgo_search import DDGS
+                    self.ddgs_factory = lambda: DDGS(timeout=self.http.timeout[1])
+                self._ddgs = self.ddgs_factory()
+            return list(getattr(self._ddgs, method)(*args, **kwargs))
+
+    def search(self, query):
         """Searches the web using DuckDuckGo."""
         try:
-            with DDGS() as ddgs:
-                results = list(ddgs.text(query, max_results=3))
-                if results:
-                    summary = results[0]['body']
-                    return f"According to the web: {summary}"
-                return "I couldn't find anything on that."
+            key = ("search", query.strip().lower())
+            results = self.cache.get(key, lambda: self._ddgs_call("text", query, max_results=3), self.SEARCH_TTL)
+            if results:
+                summary = results[0]['body']
+                return f"According to the web: {summary}"
+            return "I couldn't find anything on that."
         except Exception as e:
             return f"Search failed: {str(e)}"
 
-    @staticmethod
-    def get_weather(city="New York"):
+    def get_weather(self, city="New York"):
         """Gets weather info (simplified for demo, usually needs an API key)."""
         # Using a free service that doesn't require a key or simple scraping
         try:
-            url = f"https://wttr.in/{city}?format=%C+%t"
-            response = requests.get(url)
-            if response.status_code == 200:
-                return f"The weather in {city} is {response.text}"
-            return "I couldn't retrieve the weather right now."
+            url = self.weather_url.format(city=quote(city.strip()))
+            key = ("weather", city.strip().lower())
+            report = self.cache.get(key, lambda: self.http.get_text(url, params={"format": "%C %t"}), self.WEATHER_TTL)
+            return f"The weather in {city} is {report}"
         except Exception as e:
+            # raise_for_status() errors carry the response; network failures don't
+            if getattr(e, "response", None) is not None:
+                return "I couldn't retrieve the weather right now."
             return f"Weather check failed: {str(e)}"
 
-    @staticmethod
-    def get_news():
+    def get_news(self):
         """Gets top news headlines."""
         try:
-            with DDGS() as ddgs:
-                results = list(ddgs.news("top stories", max_results=3))
-                if results:
-                    headlines = [r['title'] for r in results]
-                    return "Here are the top headlines: " + "; ".join(headlines)
-                return "I couldn't find any news."
+            results = self.cache.get(
+                ("news",), lambda: self._ddgs_call("news", "top stories", max_results=3), self.NEWS_TTL
+            )
+            if results:
+                headlines = [r['title'] for r in results]
+                return "Here are the top headlines: " + "; ".join(headlines)
+            return "I couldn't find any news."
         except Exception as e:
             return f"News retrieval failed: {str(e)}"
@@ -1,12 +1,15 @@
 import customtkinter as ctk
-import threading
+from veda.core.scheduler import CommandScheduler
+from veda.ui.transcript import Transcript, history_pages
 
 class VedaGUI(ctk.CTk):
-    def __init__(self, on_send_callback, on_voice_callback):
+    def __init__(self, on_send_callback, on_voice_callback, scheduler=None, history=None):
         super().__init__()
 
         self.on_send_callback = on_send_callback
         self.on_voice_callback = on_voice_callback
+        # Bounded worker pool shared with the assistant (which takes resource locks on it)
+        self.scheduler = scheduler or CommandScheduler()
 
         self.title("VEDA - Advanced Assistant")
         self.geometry("600x700")
@@ -16,10 +19,14 @@ class VedaGUI(ctk.CTk):
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
 
-        # Chat display
+        # Chat display: keeps a bounded window of messages; older ones (from the
+        # optional InteractionHistory) are paged back in when scrolling to the top
         self.chat_display = ctk.CTkTextbox(self, width=580, height=500)
         self.chat_display.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
         self.chat_display.configure(state="disabled")
+        self.transcript = Transcript(self.chat_display, load_older=history_pages(history) if history else None)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Prior>"):
+            self.chat_display.bind(sequence, self.transcript.on_scroll, add="+")
 
         # Input frame
         self.input_frame = ctk.CTkFrame(self)
@@ -38,27 +45,40 @@ class VedaGUI(ctk.CTk):
 
         self.update_chat("Veda", "System Online. Ready to assist.")
 
-    def update_chat(self, sender, message):
-        """Thread-safe way to update the chat display."""
-        self.after(0, self._update_chat_ui, sender, message)
-
-    def _update_chat_ui(self, sender, message):
-        self.chat_display.configure(state="normal")
-        self.chat_display.insert("end", f"{sender}: {message}\n\n")
-        self.chat_display.configure(state="disabled")
-        self.chat_display.see("end")
+    def update_chat(self, sender, message, partial=False):
+        """
+        Thread-safe way to update the chat display (redrawn at most once per frame).
+        partial=True appends a streamed chunk to the current message;
+        the next non-partial call closes it (an empty message just closes it).
+        """
+        self.transcript.post(sender, message, partial)
 
     def send_message(self):
         message = self.input_entry.get()
         if message:
             self.update_chat("You", message)
             self.input_entry.delete(0, "end")
-            # Run the callback in a separate thread to keep UI responsive
-            threading.Thread(target=self.on_send_callback, args=(message,), daemon=True).start()
+            # A command that goes stale in the queue is dropped; say so instead of ignoring it
+            on_drop = lambda: self.update_chat("Veda", f"I skipped \"{message}\" because it waited too long. "
+                                                       "Please ask again.")
+            # Run the callback on the command pool to keep UI responsive
+            if self.scheduler.submit(self.on_send_callback, message, on_drop=on_drop) is None:
+                self.update_chat("Veda", "I'm still working through your earlier requests. Please try again in a moment.")
 
     def trigger_voice(self):
+        if self.scheduler.submit(self.on_voice_callback, on_drop=self._voice_dropped) is None:
+            self.update_chat("Veda", "I'm still working through your earlier requests. Please try again in a moment.")
+            return
         self.voice_button.configure(text="Listening...", fg_color="red")
-        threading.Thread(target=self.on_voice_callback, daemon=True).start()
+
+    def _voice_dropped(self):
+        # The voice command went stale in the queue, so listen_and_process won't reset the button
+        self.reset_voice_button()
+        self.update_chat("Veda", "I skipped that voice command because it waited too long. Please try again.")
+
+    def attach_history(self, history):
+        """Pages older messages in from an InteractionHistory (the assistant passes memory.history)."""
+        self.transcript.set_history(history_pages(history))
 
     def reset_voice_button(self):
         self.after(0, lambda: self.voice_button.configure(text="Voice", fg_color="green"))
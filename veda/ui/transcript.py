@@ -0,0 +1,188 @@
+import collections
+import datetime
+import itertools
+import threading
+import time
+
+STAMP = "%Y-%m-%d %H:%M:%S"
+
+def _now():
+    # Same format and clock as the interaction log, so pages line up with it
+    return datetime.datetime.now(datetime.timezone.utc).strftime(STAMP)
+
+def _next_second(stamp):
+    return (datetime.datetime.strptime(stamp, STAMP) + datetime.timedelta(seconds=1)).strftime(STAMP)
+
+def history_pages(history):
+    """
+    Adapts InteractionHistory.by_time to Transcript's load_older(end, cursor, limit):
+    messages before end (exclusive) for the first page, then the next page after the
+    (timestamp, id) keyset cursor.
+    """
+    senders = {"user": "You", "assistant": "Veda"}
+
+    def load_older(end, cursor, limit):
+        rows, cursor = history.by_time(end=end, limit=limit, cursor=cursor)
+        messages = [(senders.get(row["role"], row["role"]), row["content"], row["timestamp"]) for row in reversed(rows)]
+        return messages, cursor
+    return load_older
+
+class Transcript:
+    """
+    Chat transcript behind a Tk text widget (tk.Text / CTkTextbox API).
+
+    post() may be called from any thread: it only queues the update, and at
+    most one flush is scheduled per frame, so a burst of streamed chunks
+    costs one insert instead of one event-loop callback each. The widget
+    holds only the latest `window` messages; older ones are dropped from it
+    and, when the user scrolls to the top, paged back in from load_older
+    (see history_pages). Paged-in history is trimmed again once the view is
+    back at the bottom.
+    """
+
+    def __init__(self, widget, window=300, page=50, load_older=None, frame_ms=16):
+        self.widget = widget
+        self.window = window
+        self.page = page
+        self.load_older = load_older
+        self.frame_ms = frame_ms
+        self.lock = threading.Lock()
+        self.pending = []
+        self.scheduled = False
+        self.entries = collections.deque()  # [timestamp, line count, sender, text] per rendered message, oldest first
+        self.streaming = False
+        self.older_cursor = None
+        self.history_done = load_older is None
+        self.counts = collections.Counter()
+        self.flush_ms = collections.deque(maxlen=1000)
+
+    def post(self, sender, message, partial=False):
+        """
+        Queues a message. partial=True appends a streamed chunk to the current
+        message; the next non-partial post closes it (an empty message just closes it).
+        """
+        with self.lock:
+            self.pending.append((sender, message, partial, _now()))
+            if self.scheduled:
+                return
+            self.scheduled = True
+        self.widget.after(self.frame_ms, self.flush)
+
+    def flush(self):
+        """Applies every queued update in one widget edit (UI thread); returns how many there were."""
+        with self.lock:
+            updates, self.pending = self.pending, []
+            self.scheduled = False
+        if not updates:
+            return 0
+        start = time.perf_counter()
+        at_bottom = self.widget.yview()[1] >= 0.999
+        parts = []
+        for sender, message, partial, stamp in updates:
+            if partial:
+                if not self.streaming:
+                    parts.append(f"{sender}: ")
+                    self.entries.append([stamp, 0, sender, ""])
+                    self.streaming = True
+                parts.append(message)
+                self.entries[-1][1] += message.count("\n")
+                self.entries[-1][3] += message
+            else:
+                if self.streaming:
+                    parts.append("\n\n")
+                    self.entries[-1][1] += 2
+                    self.streaming = False
+                if message:
+                    text = f"{sender}: {message}\n\n"
+                    parts.append(text)
+                    self.entries.append([stamp, text.count("\n"), sender, message])
+
+        self.widget.configure(state="normal")
+        self.widget.insert("end", "".join(parts))
+        if at_bottom:
+            self._trim()
+        self.widget.configure(state="disabled")
+        if at_bottom:
+            self.widget.see("end")
+        self.counts["updates"] += len(updates)
+        self.counts["flushes"] += 1
+        self.flush_ms.append((time.perf_counter() - start) * 1000)
+        return len(updates)
+
+    def _trim(self):
+        excess = len(self.entries) - self.window
+        if excess <= 0:
+            return
+        lines = sum(self.entries.popleft()[1] for _ in range(excess))
+        self.widget.delete("1.0", f"{lines + 1}.0")
+        self.counts["trimmed"] += excess
+        # What was dropped can be paged back in, starting again from the new oldest message
+        self.older_cursor = None
+        self.history_done = self.load_older is None
+
+    def on_scroll(self, event=None):
+        """Bound to scroll events: pages in older messages once the view reaches the top."""
+        self.widget.after_idle(self._page_if_at_top)
+
+    def _page_if_at_top(self):
+        if self.widget.yview()[0] <= 0.0:
+            self.page_older()
+
+    def set_history(self, load_older):
+        """Sets (or replaces) where older messages are paged in from, e.g. history_pages(memory.history)."""
+        self.load_older = load_older
+        self.older_cursor = None
+        self.history_done = load_older is None
+
+    def page_older(self):
+        """Prepends the next page of older messages from load_older; returns how many were added."""
+        if self.history_done:
+            return 0
+        end, on_screen = None, None
+        if self.entries and self.older_cursor is None:
+            # The first page starts at the oldest rendered message. Stamps have one-second
+            # resolution, so it takes in that whole second and leaves out the messages of
+            # it that are already on screen; later pages continue from the (timestamp, id) cursor.
+            oldest = self.entries[0][0]
+            end = _next_second(oldest)
+            on_screen = collections.Counter(
+                (sender, text) for _, _, sender, text in itertools.takewhile(lambda entry: entry[0] == oldest, self.entries)
+            )
+        try:
+            messages, self.older_cursor = self.load_older(end, self.older_cursor, self.page)
+        except Exception as e:
+            print(f"Loading older messages failed: {e}")
+            return 0
+        if self.older_cursor is None:
+            self.history_done = True
+        if on_screen:
+            kept = []
+            for sender, message, stamp in reversed(messages):  # newest first, like the rendered ones
+                if stamp == oldest and on_screen[(sender, message)] > 0:
+                    on_screen[(sender, message)] -= 1
+                else:
+                    kept.append((sender, message, stamp))
+            messages = kept[::-1]
+        if not messages:
+            # A page of only on-screen messages: the cursor has moved past them, so go on
+            return 0 if self.history_done else self.page_older()
+        texts = [f"{sender}: {message}\n\n" for sender, message, _ in messages]
+        lines = [text.count("\n") for text in texts]
+        self.widget.configure(state="normal")
+        self.widget.insert("1.0", "".join(texts))
+        self.widget.configure(state="disabled")
+        self.entries.extendleft([stamp, count, sender, message]
+                                for (sender, message, stamp), count in zip(reversed(messages), reversed(lines)))
+        # Keep the message that was at the top where it was
+        self.widget.yview(f"{sum(lines) + 1}.0")
+        self.counts["paged"] += len(messages)
+        return len(messages)
+
+    def metrics(self):
+        flush_ms = sorted(self.flush_ms)
+        return {
+            **dict(self.counts),
+            "rendered": len(self.entries),
+            "flush_ms_p50": flush_ms[len(flush_ms) // 2] if flush_ms else 0.0,
+            "flush_ms_max": flush_ms[-1] if flush_ms else 0.0,
+        }
@@ -30,3 +30,27 @@ def get_system_summary():
         "python": sys.version.split()[0],
         "missing_deps": check_dependencies()
     }
+
+def startup_report(module="veda.core.assistant", top=15):
+    """
+    Imports a module in a fresh interpreter under `python -X importtime` and
+    returns the slowest imports as (cumulative_ms, self_ms, name), slowest first.
+    """
+    import subprocess
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=os.getcwd()
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # header row
+        rows.append((int(cumulative_us) / 1000, int(self_us) / 1000, name.rstrip()))
+    if result.returncode != 0:
+        print(f"Importing {module} failed: {result.stderr.strip().splitlines()[-1:]}")
+    rows.sort(reverse=True)
+    return rows[:top]
@@ -0,0 +1,43 @@
+import importlib
+import threading
+
+class LazyProxy:
+    """
+    Stands in for a subsystem that is expensive to import or construct.
+
+    The module is imported and module.class_name(*args, **kwargs) built the
+    first time an attribute is used (or when resolve() is called, e.g. from a
+    warm-up thread); after that every access goes straight to the instance.
+    """
+
+    def __init__(self, module, class_name, *args, **kwargs):
+        object.__setattr__(self, "_spec", (module, class_name, args, kwargs))
+        object.__setattr__(self, "_target", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def resolve(self):
+        target = self._target
+        if target is None:
+            with self._lock:
+                target = self._target
+                if target is None:
+                    module, class_name, args, kwargs = self._spec
+                    cls = getattr(importlib.import_module(module), class_name)
+                    target = cls(*args, **kwargs)
+                    object.__setattr__(self, "_target", target)
+        return target
+
+    @property
+    def loaded(self):
+        return self._target is not None
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.resolve(), name, value)
+
+    def __repr__(self):
+        module, class_name, _, _ = self._spec
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyProxy {module}.{class_name} ({state})>"
@@ -0,0 +1,87 @@
+"""
+Imports legacy Veda databases into the unified memory store.
+
+    python -m veda.utils.migrate [--target veda_memory.db] [source.db ...]
+
+Sources are recognised by their tables: an old veda_memory.db (memory,
+interactions, tasks) or a veda2.0 memory_manager.db (facts, episodes).
+With no sources, memory_manager.db in the current directory is imported if
+present. The target's schema is brought up to date first (an old
+veda_memory.db used as the target is upgraded in place). Every source is
+recorded in imported_sources, so running the tool again imports nothing twice.
+"""
+import argparse
+import os
+import time
+from veda.core.schema import ensure_schema
+from veda.core.storage import VedaStorage
+
+# table -> (columns copied, skip rows already present in the target)
+IMPORTS = {
+    "memory": ("key, value", False),
+    "interactions": ("role, content, timestamp", False),
+    "tasks": ("task, status, created_at", False),
+    "facts": ("fact", True),
+    "episodes": ("episode", True),
+}
+
+def _source_tables(conn):
+    return {row[0] for row in conn.execute("SELECT name FROM src.sqlite_master WHERE type = 'table'")}
+
+def import_database(storage, source, force=False):
+    """Copies one legacy database into storage; returns {table: rows imported}."""
+    source = os.path.abspath(source)
+    if os.path.abspath(storage.db_path) == source:
+        return {}
+    if not force and storage.query_one("SELECT 1 FROM imported_sources WHERE path = ?", (source,)):
+        print(f"{source}: already imported, skipping")
+        return {}
+
+    conn = storage.connection()
+    imported = {}
+    with storage.write_lock:
+        # ATTACH cannot run inside a transaction
+        conn.execute("ATTACH DATABASE ? AS src", (source,))
+        try:
+            tables = _source_tables(conn)
+            kind = "memory_manager" if {"facts", "episodes"} & tables else "veda_memory"
+            with conn:
+                for table, (columns, dedupe) in IMPORTS.items():
+                    if table not in tables:
+                        continue
+                    sql = f"INSERT OR IGNORE INTO main.{table} ({columns}) SELECT {columns} FROM src.{table}"
+                    if dedupe:
+                        sql += f" WHERE {columns} NOT IN (SELECT {columns} FROM main.{table})"
+                    imported[table] = conn.execute(sql + " ORDER BY rowid").rowcount
+                conn.execute(
+                    "INSERT OR REPLACE INTO imported_sources (path, kind, rows) VALUES (?, ?, ?)",
+                    (source, kind, sum(imported.values()))
+                )
+        finally:
+            conn.execute("DETACH DATABASE src")
+    return imported
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import legacy Veda databases into the unified memory store.")
+    parser.add_argument("sources", nargs="*", help="databases to import (default: memory_manager.db if present)")
+    parser.add_argument("--target", default="veda_memory.db", help="unified store (default: veda_memory.db)")
+    parser.add_argument("--force", action="store_true", help="import sources again even if already recorded")
+    args = parser.parse_args(argv)
+
+    sources = args.sources or [path for path in ["memory_manager.db"] if os.path.exists(path)]
+    storage = VedaStorage.for_path(args.target)
+    version = ensure_schema(storage)
+    print(f"{args.target}: schema version {version}")
+    for source in sources:
+        if not os.path.exists(source):
+            print(f"{source}: not found, skipping")
+            continue
+        start = time.perf_counter()
+        imported = import_database(storage, source, force=args.force)
+        if imported:
+            counts = ", ".join(f"{rows} {table}" for table, rows in imported.items())
+            print(f"{source}: imported {counts} in {time.perf_counter() - start:.2f}s")
+    storage.close()
+
+if __name__ == "__main__":
+    main()
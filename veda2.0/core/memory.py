@@ -1,6 +1,9 @@
 import sqlite3
 
 class MemoryManager:
+    # Superseded by veda.core.memory.VedaMemory (facts and episodes now live in
+    # veda_memory.db); import an existing database with `python -m veda.utils.migrate`.
+
     def __init__(self, db_name='memory_manager.db'):
         self.conn = sqlite3.connect(db_name)
         self.cur = self.conn.cursor()